@@ -0,0 +1,78 @@
+"""
+Minimal closed-loop HTTP load generator used to compare the uWSGI and ASGI deployments.
+
+Every worker thread keeps one persistent connection open and fires requests back to back, so `--concurrency`
+is the number of in-flight requests the server has to sustain.
+
+Usage:
+    python scripts/load_test.py http://127.0.0.1:8000/api/events/ --concurrency 200 --duration 30
+"""
+
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+
+def run_worker(url: str, deadline: float) -> Tuple[List[float], int]:
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    connection, latencies, errors = None, [], 0
+
+    while time.perf_counter() < deadline:
+        try:
+            connection = connection or http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            started_at = time.perf_counter()
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - started_at)
+
+            if response.status >= 400:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection = None
+
+    return latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="+", help="URLs to load, spread across the workers round-robin.")
+    parser.add_argument("--concurrency", type=int, default=200, help="Number of concurrent connections.")
+    parser.add_argument("--duration", type=float, default=30, help="Test duration in seconds.")
+    args = parser.parse_args()
+
+    threading.stack_size(256 * 1024)
+    deadline = time.perf_counter() + args.duration
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [
+            executor.submit(run_worker, args.urls[index % len(args.urls)], deadline)
+            for index in range(args.concurrency)
+        ]
+        results = [future.result() for future in futures]
+
+    latencies = sorted(latency * 1000 for worker_latencies, _ in results for latency in worker_latencies)
+    errors = sum(worker_errors for _, worker_errors in results)
+
+    if not latencies:
+        print(f"No successful requests, {errors} errors")
+        return
+
+    print(f"requests:   {len(latencies)} ({errors} errors)")
+    print(f"throughput: {len(latencies) / args.duration:.1f} req/s")
+    print(
+        f"latency:    p50={statistics.median(latencies):.1f}ms "
+        f"p95={latencies[int(len(latencies) * 0.95)]:.1f}ms "
+        f"p99={latencies[int(len(latencies) * 0.99)]:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+#!/bin/bash
+# Keeps the admin statistics rollups up to date: refreshes them every EVENT_STATISTICS_REFRESH_INTERVAL seconds and
+# rebuilds them every EVENT_STATISTICS_REBUILD_INTERVAL seconds, starting with a rebuild so a fresh deploy is filled.
+
+
+refresh_interval=${EVENT_STATISTICS_REFRESH_INTERVAL:-900}
+rebuild_interval=${EVENT_STATISTICS_REBUILD_INTERVAL:-86400}
+last_rebuild=0
+
+
+while true; do
+    if (( $(date +%s) - last_rebuild >= rebuild_interval )); then
+        echo "Rebuilding event statistics..."
+        python src/manage.py refresh_event_statistics --rebuild && last_rebuild=$(date +%s)
+    else
+        python src/manage.py refresh_event_statistics
+    fi || echo "Refreshing event statistics failed, retrying in ${refresh_interval}s"
+
+    sleep "$refresh_interval"
+done
@@ -1,8 +1,16 @@
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "base.settings")
+os.environ.setdefault("ASYNC_READ_VIEWS", "True")
+
+# Connections belong to threads, and ASGI requests don't run on a fixed set of threads, so persistent connections
+# would pile up instead of being reused. Use POSTGRES_POOL to reuse connections under ASGI. This is set on the loaded
+# settings rather than through the environment, which `.env` overrides.
+for database in settings.DATABASES.values():
+    database["CONN_MAX_AGE"] = 0
 
 application = get_asgi_application()
@@ -0,0 +1,96 @@
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+
+def measure_latency(
+    func: Callable[[], Any],
+    repeat: int = 20,
+    warmup: int = 2,
+    setup: Optional[Callable[[], Any]] = None,
+) -> Dict[str, float]:
+    """
+    Call `func` repeatedly and summarize its wall-clock latency in milliseconds.
+
+    Args:
+        func: The zero-argument callable to measure.
+        repeat: The number of measured calls.
+        warmup: The number of unmeasured calls made first to warm up caches and connections.
+        setup: An optional zero-argument callable run before every call, outside the measured time.
+
+    Returns:
+        The mean, median, 95th percentile and minimum latency.
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+
+        func()
+
+    samples = []
+
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        started_at = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started_at) * 1000)
+
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "min_ms": round(samples[0], 3),
+    }
+
+
+def format_latency(name: str, latency: Dict[str, float]) -> str:
+    return f"{name:<48} " + "  ".join(f"{key}={value:>9.3f}" for key, value in latency.items())
+
+
+def measure_peak_memory(func: Callable[[], Any]) -> float:
+    """
+    Call `func` once and return the peak memory it allocated through Python, in KiB.
+    """
+    tracemalloc.start()
+
+    try:
+        func()
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    thresholds: Dict[str, float],
+) -> List[str]:
+    """
+    Compare benchmark results against a baseline.
+
+    Args:
+        results: The measured metrics, keyed by benchmark name.
+        baseline: The reference metrics, in the same shape. Benchmarks missing on either side are skipped.
+        thresholds: The relative increase tolerated per metric, e.g. `{"p50_ms": 0.25, "queries": 0}`.
+
+    Returns:
+        A description of every metric that grew past its threshold.
+    """
+    regressions = []
+
+    for name, metrics in results.items():
+        if (reference := baseline.get(name)) is None:
+            continue
+
+        for metric, threshold in thresholds.items():
+            if metric not in metrics or metric not in reference:
+                continue
+
+            if metrics[metric] > reference[metric] * (1 + threshold):
+                regressions.append(f"{name}: {metric} {reference[metric]} -> {metrics[metric]} (> {threshold:.0%})")
+
+    return regressions
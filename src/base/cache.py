@@ -0,0 +1,124 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from django.core.cache import cache
+from django.utils.http import urlencode
+
+from base.telemetry import record_cache_access
+
+
+class VersionedCache:
+    """
+    Generation-based cache namespace.
+
+    Every stored entry embeds the current namespace version in its key, so bumping the version makes all previous
+    entries unreachable at once without scanning or deleting them. Stale generations simply age out by their TTL,
+    which lets readers use a long timeout while writers still become visible immediately.
+
+    Callers should build the key once and reuse it for both lookup and store: a response computed while a write bumps
+    the version is then stored under the old generation, where nobody will read it.
+    """
+
+    def __init__(self, namespace: str, timeout: Optional[int]) -> None:
+        self.namespace = namespace
+        self.timeout = timeout
+
+    @property
+    def version_key(self) -> str:
+        return f"{self.namespace}:version"
+
+    def get_version(self) -> int:
+        if (version := cache.get(self.version_key)) is None:
+            # Seeding from the clock instead of 1 guarantees that an evicted counter never restarts at a generation
+            # whose entries are still alive in the cache.
+            cache.add(self.version_key, time.time_ns(), timeout=None)
+            version = cache.get(self.version_key)
+
+        return version
+
+    async def aget_version(self) -> int:
+        if (version := await cache.aget(self.version_key)) is None:
+            await cache.aadd(self.version_key, time.time_ns(), timeout=None)
+            version = await cache.aget(self.version_key)
+
+        return version
+
+    def bump_version(self) -> None:
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.add(self.version_key, time.time_ns(), timeout=None)
+
+    def build_key(self, params: Dict[str, Any]) -> str:
+        return f"{self.namespace}:{self.get_version()}:{self._hash_params(params)}"
+
+    async def abuild_key(self, params: Dict[str, Any]) -> str:
+        return f"{self.namespace}:{await self.aget_version()}:{self._hash_params(params)}"
+
+    def get(self, key: str) -> Any:
+        value = cache.get(key)
+        record_cache_access(hit=value is not None)
+        return value
+
+    async def aget(self, key: str) -> Any:
+        value = await cache.aget(key)
+        record_cache_access(hit=value is not None)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        cache.set(key, value, timeout=self.timeout)
+
+    async def aset(self, key: str, value: Any) -> None:
+        await cache.aset(key, value, timeout=self.timeout)
+
+    @staticmethod
+    def _hash_params(params: Dict[str, Any]) -> str:
+        normalized_params = urlencode(sorted(params.items()), doseq=True)
+        return hashlib.md5(normalized_params.encode(), usedforsecurity=False).hexdigest()
+
+
+class LocalLRUCache:
+    """
+    Bounded, thread-safe in-process LRU cache.
+
+    Entries also expire `timeout` seconds after being stored: the cache is private to the worker process, so a delete
+    issued by another process never reaches it and the timeout is what bounds how stale an entry can get.
+    """
+
+    def __init__(self, maxsize: int, timeout: float) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,73 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def build_etag(*parts: Any) -> str:
+    """
+    Build a weak entity tag from values that identify a representation, e.g. a watermark and the query parameters.
+
+    The tag is weak because it is derived from the underlying rows rather than the bytes of the body.
+    """
+    digest = hashlib.md5("|".join(map(str, parts)).encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def build_list_etag(watermark: Tuple[Any, ...], params: Dict[str, Any]) -> str:
+    """
+    Build the entity tag of a list page from the watermark of the rows it is taken from and the parameters that
+    select the page.
+    """
+    return build_etag(*watermark, *sorted(params.items()))
+
+
+def build_page_etag(envelope: Dict[str, Any], etags: Iterable[str]) -> str:
+    """
+    Build the entity tag of a list page from the rows already loaded for it, for lists cheaper to read than to probe.
+
+    Args:
+        envelope: The pagination data around the results, e.g. the count and the links.
+        etags: The entity tags of the rows of the page.
+    """
+    return build_etag(*sorted(envelope.items()), *etags)
+
+
+def get_validators(key: Any, *timestamps: datetime) -> Tuple[str, datetime]:
+    """
+    Returns:
+        The entity tag and last modification time of an object, from its key and the write timestamps of the rows
+        its representation is built from.
+    """
+    return build_etag(key, *(timestamp.isoformat() for timestamp in timestamps)), max(timestamps)
+
+
+def get_not_modified_response(
+    request: HttpRequest, etag: str, last_modified: Optional[datetime] = None
+) -> Optional[HttpResponse]:
+    """
+    Answer a conditional GET or HEAD request from its validators alone.
+
+    Returns:
+        A 304 (or a 412 for a failed `If-Match`) carrying the validators, or None when the full response is due.
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+
+    return response
+
+
+def set_validators(response: HttpResponse, etag: str, last_modified: Optional[datetime] = None) -> HttpResponse:
+    response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+
+    return response
@@ -9,3 +9,8 @@ class BaseConstant:
             for attr in dir(cls)
             if not callable(getattr(cls, attr)) and not attr.startswith("__")
         ]
+
+
+class ExportFormat(BaseConstant):
+    CSV = "csv"
+    NDJSON = "ndjson"
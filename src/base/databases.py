@@ -0,0 +1,37 @@
+import os
+from collections import Counter
+from typing import Any, Dict
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+# Connections opened by this process, per alias. With pooling, this counts checkouts from the pool instead.
+_opened_connections: Counter[str] = Counter()
+
+
+@receiver(connection_created)
+def count_opened_connection(connection: Any, **kwargs: Any) -> None:
+    _opened_connections[connection.alias] += 1
+
+
+def get_connection_stats() -> Dict[str, Any]:
+    """
+    Describe how this worker process connects to each database: its persistence and health check settings, the number
+    of connections it opened so far and, when pooling is enabled, the pool's own statistics.
+    """
+    databases = {}
+
+    for alias in connections:
+        connection = connections[alias]
+        settings_dict = connection.settings_dict
+        pooled = bool(settings_dict["OPTIONS"].get("pool"))
+        databases[alias] = {
+            "conn_max_age": settings_dict["CONN_MAX_AGE"],
+            "health_checks": settings_dict["CONN_HEALTH_CHECKS"],
+            "connections_opened": _opened_connections[alias],
+            "pool": connection.pool.get_stats() if pooled else None,
+        }
+
+    return {"pid": os.getpid(), "databases": databases}
@@ -0,0 +1,75 @@
+from typing import Any
+
+from django.db import models
+from django.db.models import Func, Value
+
+
+class EarthField(models.Field):
+    """
+    The `earth` domain of the `earthdistance` extension: a point on the Earth's surface as a 3-D `cube`.
+    """
+
+    def db_type(self, connection: Any) -> str:
+        return "earth"
+
+
+class LLToEarth(Func):
+    """
+    `ll_to_earth(latitude, longitude)`, the indexable point a pair of coordinates stands for.
+    """
+
+    function = "ll_to_earth"
+    output_field = EarthField()
+
+    def __init__(self, latitude: Any, longitude: Any, **extra: Any) -> None:
+        super().__init__(latitude, longitude, **extra)
+
+    @classmethod
+    def from_coordinates(cls, latitude: float, longitude: float) -> "LLToEarth":
+        return cls(Value(float(latitude)), Value(float(longitude)))
+
+
+class EarthBox(Func):
+    """
+    `earth_box(point, radius_m)`, a cube bounding every point within `radius_m` metres of `point`.
+
+    It may also contain points slightly further than that, so matches are to be checked with `EarthDistance`.
+    """
+
+    function = "earth_box"
+    output_field = EarthField()
+
+    def __init__(self, point: LLToEarth, radius_m: float, **extra: Any) -> None:
+        super().__init__(point, Value(float(radius_m)), **extra)
+
+
+class CubeContains(Func):
+    """
+    `cube @> other`, which a GiST index on `other` can answer.
+    """
+
+    arg_joiner = " @> "
+    template = "(%(expressions)s)"
+    output_field = models.BooleanField()
+
+
+class CubeDistance(Func):
+    """
+    `cube <-> other`, the straight-line distance between two points.
+
+    It grows with the great-circle distance, so it orders rows the same way `EarthDistance` does, while a GiST index
+    on either side can return the rows already in that order instead of sorting every match.
+    """
+
+    arg_joiner = " <-> "
+    template = "(%(expressions)s)"
+    output_field = models.FloatField()
+
+
+class EarthDistance(Func):
+    """
+    `earth_distance(point, other)`, the great-circle distance between two points in metres.
+    """
+
+    function = "earth_distance"
+    output_field = models.FloatField()
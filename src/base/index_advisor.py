@@ -0,0 +1,268 @@
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Type
+
+from django.apps import apps
+from django.db import connection, models, transaction
+from django.db.models import Model
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_CAST = re.compile(
+    r"::(?:(?:timestamp|time) with(?:out)? time zone|character varying|double precision|\"?\w+\"?)(?:\[\])?"
+)
+_PARENTHESIZED_NAME = re.compile(r"(?<![\w\"])\(((?:\w+\.)?\"?\w+\"?)\)")
+_PREDICATE = re.compile(
+    r"(?:(?<=[\s(])|^)(?:\w+\.)?\"?(\w+)\"? (=|<>|<=|>=|<|>|~~\*?|!~~\*?|@>|<@|&&|IS NOT NULL|IS NULL)"
+)
+_SORT_KEY = re.compile(r"^(?:\w+\.)?\"?(\w+)\"?( DESC)?(?: NULLS (?:FIRST|LAST))?$")
+
+EQUALITY_OPERATORS = {"=", "IS NULL"}
+RANGE_OPERATORS = {"<", ">", "<=", ">="}
+SCAN_NODES = {"Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+CONDITION_KEYS = ("Index Cond", "Recheck Cond", "Filter")
+
+
+class TableInfo(NamedTuple):
+    rows: int
+    columns: Set[str]
+    # Column lists of the table's B-tree indexes, in index order.
+    indexes: Dict[str, Tuple[str, ...]]
+
+
+class IndexProposal(NamedTuple):
+    table: str
+    # Column names, with a `-` prefix for descending order as in `Meta.indexes`.
+    columns: Tuple[str, ...]
+
+    @property
+    def model(self) -> Optional[Type[Model]]:
+        return get_models_by_table().get(self.table)
+
+    def build_index(self) -> Optional[models.Index]:
+        """
+        The proposal as a `Meta.indexes` entry of the table's model, named the way Django names indexes.
+        """
+        if (model := self.model) is None:
+            return None
+
+        fields_by_column = {field.column: field.name for field in model._meta.concrete_fields}
+        index = models.Index(fields=[self._to_field(column, fields_by_column) for column in self.columns])
+        index.set_name_with_model(model)
+        return index
+
+    def build_sql(self) -> str:
+        if (model := self.model) is not None and (index := self.build_index()) is not None:
+            with connection.schema_editor(collect_sql=True) as schema_editor:
+                return str(index.create_sql(model, schema_editor)).replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY")
+
+        name = "_".join((self.table, *(column.lstrip("-") for column in self.columns), "idx"))[:63]
+        columns = ", ".join(
+            f'"{column.lstrip("-")}"' + (" DESC" if column.startswith("-") else "") for column in self.columns
+        )
+        return f'CREATE INDEX CONCURRENTLY "{name}" ON "{self.table}" ({columns})'
+
+    @staticmethod
+    def _to_field(column: str, fields_by_column: Dict[str, str]) -> str:
+        descending = column.startswith("-")
+        name = fields_by_column.get(column.lstrip("-"), column.lstrip("-"))
+        return f"-{name}" if descending else name
+
+
+class Finding(NamedTuple):
+    node_type: str
+    table: str
+    table_rows: int
+    # Share of the plan's estimated cost spent in the node and below it, the most an index on it could save. Nodes
+    # under a `LIMIT` may stop early, so their full cost is capped to the plan's.
+    cost_share: float
+    detail: str
+    proposal: Optional[IndexProposal]
+    note: str = ""
+
+
+def get_models_by_table() -> Dict[str, Type[Model]]:
+    return {model._meta.db_table: model for model in apps.get_models(include_auto_created=True)}
+
+
+def load_tables() -> Dict[str, TableInfo]:
+    """
+    Row estimates, columns and B-tree indexes of the tables in the current schema.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            "WHERE relkind IN ('r', 'p') AND relnamespace = 'public'::regnamespace"
+        )
+        rows = dict(cursor.fetchall())
+        tables = {}
+
+        for table, table_rows in rows.items():
+            columns = {column.name for column in connection.introspection.get_table_description(cursor, table)}
+            constraints = connection.introspection.get_constraints(cursor, table)
+            indexes = {
+                name: tuple(constraint["columns"])
+                for name, constraint in constraints.items()
+                if (constraint["primary_key"] or constraint["unique"] or constraint.get("type") == models.Index.suffix)
+                and all(constraint["columns"])
+            }
+            tables[table] = TableInfo(max(table_rows, 0), columns, indexes)
+
+    return tables
+
+
+def explain(sql: str) -> Dict[str, Any]:
+    """
+    The estimated plan of `sql`, without executing it.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+        return cursor.fetchone()[0][0]["Plan"]
+
+
+def measure_proposals(sql: str, proposals: List[IndexProposal]) -> Tuple[float, float]:
+    """
+    The plan cost of `sql` before and after building the proposed indexes in a transaction that is rolled back.
+
+    Building an index reads the whole table and blocks writes to it until the rollback, so this is meant for a copy
+    of the production data, not for production itself.
+    """
+    before = explain(sql)["Total Cost"]
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for proposal in proposals:
+                cursor.execute(proposal.build_sql().replace(" CONCURRENTLY", ""))
+
+        after = explain(sql)["Total Cost"]
+        transaction.set_rollback(True)
+
+    return before, after
+
+
+def find_issues(plan: Dict[str, Any], tables: Dict[str, TableInfo], min_rows: int) -> List[Finding]:
+    """
+    Sequential scans of tables with `min_rows` rows or more and sorts of as many of their rows, with the index that
+    would avoid each of them when their conditions and sort keys are plain columns.
+    """
+    total_cost = plan["Total Cost"] or 1.0
+    findings = []
+
+    for node in walk_plan(plan):
+        if node["Node Type"] == "Seq Scan":
+            finding = _check_seq_scan(node, tables, min_rows, total_cost)
+        elif node["Node Type"] == "Sort":
+            finding = _check_sort(node, tables, min_rows, total_cost)
+        else:
+            finding = None
+
+        if finding is not None:
+            findings.append(finding)
+
+    return findings
+
+
+def walk_plan(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from walk_plan(child)
+
+
+def parse_conditions(condition: str, columns: Set[str]) -> Tuple[List[str], List[str]]:
+    """
+    Returns:
+        The columns of `columns` that `condition` compares for equality, and the ones it compares as ranges, in order
+        of appearance. Conditions on expressions of a column, such as `upper(location)`, are left out.
+    """
+    condition = _CAST.sub("", _STRING_LITERAL.sub("?", condition))
+    while (unwrapped := _PARENTHESIZED_NAME.sub(r"\1", condition)) != condition:
+        condition = unwrapped
+
+    equality, ranges = [], []
+    for column, operator in _PREDICATE.findall(condition):
+        if column not in columns:
+            continue
+
+        if operator in EQUALITY_OPERATORS and column not in equality:
+            equality.append(column)
+        elif operator in RANGE_OPERATORS and column not in ranges:
+            ranges.append(column)
+
+    return equality, [column for column in ranges if column not in equality]
+
+
+def propose_index(table: str, info: TableInfo, columns: Tuple[str, ...]) -> Tuple[Optional[IndexProposal], str]:
+    """
+    Returns:
+        A proposal for an index on `columns`, unless one of the existing indexes already starts with them, in which
+        case its name is returned as a note instead.
+    """
+    if not columns:
+        return None, ""
+
+    plain_columns = tuple(column.lstrip("-") for column in columns)
+    for name, index_columns in info.indexes.items():
+        if index_columns[: len(plain_columns)] == plain_columns:
+            return None, f"{name} already covers it; the planner expects it to read too much of the table"
+
+    return IndexProposal(table, columns), ""
+
+
+def _check_seq_scan(
+    node: Dict[str, Any], tables: Dict[str, TableInfo], min_rows: int, total_cost: float
+) -> Optional[Finding]:
+    table = node["Relation Name"]
+    if (info := tables.get(table)) is None or info.rows < min_rows:
+        return None
+
+    condition = node.get("Filter", "")
+    equality, ranges = parse_conditions(condition, info.columns)
+    proposal, note = propose_index(table, info, (*equality, *ranges[:1]))
+
+    if proposal is None and not note:
+        note = "no condition on plain columns to index" if condition else "reads the whole table"
+
+    return Finding(
+        node_type="Seq Scan",
+        table=table,
+        table_rows=info.rows,
+        cost_share=min(node["Total Cost"] / total_cost, 1.0),
+        detail=condition,
+        proposal=proposal,
+        note=note,
+    )
+
+
+def _check_sort(
+    node: Dict[str, Any], tables: Dict[str, TableInfo], min_rows: int, total_cost: float
+) -> Optional[Finding]:
+    scan = node
+    while scan["Node Type"] not in SCAN_NODES and len(scan.get("Plans", ())) == 1:
+        scan = scan["Plans"][0]
+
+    if scan["Node Type"] not in SCAN_NODES or (info := tables.get(scan["Relation Name"])) is None:
+        return None
+
+    if info.rows < min_rows or node["Plan Rows"] < min_rows:
+        return None
+
+    sort_keys = [_SORT_KEY.match(key) for key in node["Sort Key"]]
+    if all(sort_keys) and all(match.group(1) in info.columns for match in sort_keys):
+        equality, _ = parse_conditions(" AND ".join(scan.get(key, "") for key in CONDITION_KEYS), info.columns)
+        ordering = tuple(("-" if match.group(2) else "") + match.group(1) for match in sort_keys)
+        proposal, note = propose_index(
+            scan["Relation Name"],
+            info,
+            (*(column for column in equality if column not in {key.lstrip("-") for key in ordering}), *ordering),
+        )
+    else:
+        proposal, note = None, "sorts on expressions"
+
+    return Finding(
+        node_type="Sort",
+        table=scan["Relation Name"],
+        table_rows=info.rows,
+        cost_share=min(node["Total Cost"] / total_cost, 1.0),
+        detail=", ".join(node["Sort Key"]),
+        proposal=proposal,
+        note=note,
+    )
@@ -0,0 +1,95 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Sequence
+
+
+# Attributes every `LogRecord` has; anything else on a record was passed through `extra=` and is emitted as a field.
+RESERVED_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formats records as single-line JSON objects, with every `extra=` field emitted as a top-level key.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update((key, value) for key, value in record.__dict__.items() if key not in RESERVED_RECORD_ATTRIBUTES)
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, default=str)
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    Hands records over to a background `QueueListener`, which formats them and passes them to `handlers`. Request
+    threads only pay for an enqueue.
+
+    With `dictConfig`, the target handlers are given as `cfg://handlers.<name>` references, which resolve to the
+    configured handlers only if their names sort before this handler's own name (handlers are configured in name
+    order).
+
+    Records are queued as they are: unlike `QueueHandler.prepare`, nothing is formatted up front. Formatting happens
+    on the listener thread, and only for records that pass the target handlers' levels. Arguments are formatted
+    later, so they must not be mutated after the logging call. When the queue is full, records are dropped rather than
+    blocking the request.
+
+    The listener starts on the first record each process emits, so forked workers (uWSGI, gunicorn) each get their
+    own listener thread instead of inheriting the master's dead one.
+    """
+
+    def __init__(self, handlers: Sequence[logging.Handler], queue_size: int = 10000) -> None:
+        super().__init__(queue.Queue(queue_size))
+        # `dictConfig` resolves `cfg://` references when its lists are indexed, not when they are iterated.
+        self.handlers = [handlers[index] for index in range(len(handlers))]
+
+        if unresolved := [handler for handler in self.handlers if not isinstance(handler, logging.Handler)]:
+            raise ValueError(f"Handlers {unresolved!r} are not configured")
+        self.listener: Optional[QueueListener] = None
+        self.listener_pid: Optional[int] = None
+        self.listener_lock = threading.Lock()
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.listener_pid != os.getpid():
+            self.start_listener()
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def start_listener(self) -> None:
+        with self.listener_lock:
+            if self.listener_pid == os.getpid():
+                return
+
+            # A listener inherited through fork has no thread behind it, and its queue may hold records the parent
+            # had not written yet, so both are replaced.
+            self.queue = queue.Queue(self.queue.maxsize)
+            self.listener = QueueListener(self.queue, *self.handlers, respect_handler_level=True)
+            self.listener.start()
+            self.listener_pid = os.getpid()
+            atexit.register(self.stop_listener)
+
+    def stop_listener(self) -> None:
+        with self.listener_lock:
+            if self.listener is not None and self.listener_pid == os.getpid():
+                self.listener.stop()
+                self.listener, self.listener_pid = None, None
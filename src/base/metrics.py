@@ -0,0 +1,171 @@
+import atexit
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Tuple, Union
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from base.settings import TELEMETRY_CONFIGURATION
+
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = "eventfor"
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# name -> (help text, buckets)
+HISTOGRAMS: Dict[str, Tuple[str, Tuple[float, ...]]] = {
+    "request_duration_seconds": ("Total time spent handling the request.", SECONDS_BUCKETS),
+    "db_duration_seconds": ("Time spent executing database queries per request.", SECONDS_BUCKETS),
+    "db_queries": ("Database queries executed per request.", QUERY_COUNT_BUCKETS),
+    "serialization_duration_seconds": ("Time spent serializing and rendering the response.", SECONDS_BUCKETS),
+}
+
+# name -> help text
+COUNTERS: Dict[str, str] = {
+    "cache_hits_total": "Application cache lookups that found an entry.",
+    "cache_misses_total": "Application cache lookups that found nothing.",
+}
+
+Number = Union[int, float]
+
+
+class RequestMetrics:
+    """
+    Per-view request histograms shared by every worker process.
+
+    Each process aggregates its observations in memory and adds them to a single Redis hash at most once every
+    `flush_interval` seconds, so the metrics endpoint reports the totals of all workers no matter which one serves
+    the scrape, while requests only pay for a dictionary update.
+    """
+
+    def __init__(self, namespace: str, flush_interval: float) -> None:
+        self.namespace = namespace
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Number] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    @property
+    def key(self) -> str:
+        return cache.make_key(self.namespace)
+
+    def observe(self, view: str, histograms: Dict[str, Number], counters: Dict[str, int]) -> None:
+        with self._lock:
+            for name, value in histograms.items():
+                buckets = HISTOGRAMS[name][1]
+                index = bisect_left(buckets, value)
+                le = self._format_value(buckets[index]) if index < len(buckets) else "+Inf"
+                self._pending[self._build_field(name, view, f"le={le}")] += 1
+                self._pending[self._build_field(name, view, "sum")] += value
+                self._pending[self._build_field(name, view, "count")] += 1
+
+            for name, value in counters.items():
+                if value:
+                    self._pending[self._build_field(name, view, "total")] += value
+
+    def is_flush_due(self) -> bool:
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return
+
+        pipeline = get_redis_connection().pipeline(transaction=False)
+        for field, value in pending.items():
+            if isinstance(value, float):
+                pipeline.hincrbyfloat(self.key, field, value)
+            else:
+                pipeline.hincrby(self.key, field, value)
+
+        try:
+            pipeline.execute()
+        except RedisError:
+            logger.warning("Could not flush %s request metrics, keeping them for the next flush", len(pending))
+            self._restore(pending)
+
+    def collect(self) -> Dict[Tuple[str, str, str], float]:
+        self.flush()
+        values = {}
+        for field, value in get_redis_connection().hgetall(self.key).items():
+            # View names go last in the field, so any separator they contain cannot shift the other parts.
+            name, suffix, view = field.decode().split("|", 2)
+            values[(name, view, suffix)] = float(value)
+
+        return values
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+        """
+        values = self.collect()
+        views = sorted({view for _, view, _ in values})
+        lines: List[str] = []
+
+        for name, (help_text, buckets) in HISTOGRAMS.items():
+            metric = f"{METRICS_PREFIX}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+
+            for view in views:
+                if (count := values.get((name, view, "count"))) is None:
+                    continue
+
+                label = f'view="{self._escape_label(view)}"'
+                cumulative = 0.0
+                for le in (*map(self._format_value, buckets), "+Inf"):
+                    cumulative += values.get((name, view, f"le={le}"), 0.0)
+                    lines.append(f'{metric}_bucket{{{label},le="{le}"}} {self._format_value(cumulative)}')
+
+                lines.append(f"{metric}_sum{{{label}}} {self._format_value(values[(name, view, 'sum')])}")
+                lines.append(f"{metric}_count{{{label}}} {self._format_value(count)}")
+
+        for name, help_text in COUNTERS.items():
+            metric = f"{METRICS_PREFIX}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            lines += [
+                f'{metric}{{view="{self._escape_label(view)}"}} {self._format_value(values[(name, view, "total")])}'
+                for view in views
+                if (name, view, "total") in values
+            ]
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+
+        get_redis_connection().delete(self.key)
+
+    def _restore(self, pending: Dict[str, Number]) -> None:
+        with self._lock:
+            for field, value in pending.items():
+                self._pending[field] += value
+
+    @staticmethod
+    def _build_field(name: str, view: str, suffix: str) -> str:
+        return f"{name}|{suffix}|{view}"
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def _format_value(value: Number) -> str:
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+request_metrics = RequestMetrics(namespace="request_metrics", flush_interval=TELEMETRY_CONFIGURATION["FLUSH_INTERVAL"])
+
+# Whatever a worker observed since its last flush would otherwise be lost when it is recycled.
+atexit.register(request_metrics.flush)
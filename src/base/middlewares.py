@@ -1,27 +1,341 @@
 import logging
-from typing import Callable
+import random
+import time
+from typing import Awaitable, Callable, List, Union
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.core.exceptions import ValidationError
-from django.http import HttpRequest, JsonResponse
-from django.utils.deprecation import MiddlewareMixin
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from rest_framework.permissions import SAFE_METHODS
+
+from base.metrics import request_metrics
+from base.queries import (
+    NPlusOneError,
+    QueryCounter,
+    QueryShape,
+    count_queries,
+    detect_n_plus_one,
+    format_repeated_queries,
+    record_query_shapes,
+)
+from base.query_shapes import query_shape_statistics
+from base.routers import read_from_replica
+from base.settings import (
+    LOGGER_CONFIGURATION,
+    N_PLUS_ONE_CONFIGURATION,
+    QUERY_SHAPES_CONFIGURATION,
+    REPLICA_CONFIGURATION,
+    SESSION_COOKIE_SECURE,
+    TELEMETRY_CONFIGURATION,
+)
+from base.telemetry import RequestTelemetry, track_request
 
 
 logger = logging.getLogger(__name__)
+request_logger = logging.getLogger("base.requests")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serves the reads of safe-method requests from the replica, when one is configured.
+
+    Every other request pins its client to the primary for `POSTGRES_REPLICA_STICKY_SECONDS` through a short-lived
+    cookie, so the client reads its own writes even while the replica lags behind.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not REPLICA_CONFIGURATION["ALIAS"]:
+            return self.get_response(request)
+
+        if self.can_read_from_replica(request):
+            with read_from_replica():
+                return self.get_response(request)
+
+        return self.pin_to_primary(request, self.get_response(request))
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not REPLICA_CONFIGURATION["ALIAS"]:
+            return await self.get_response(request)
+
+        if self.can_read_from_replica(request):
+            with read_from_replica():
+                return await self.get_response(request)
+
+        return self.pin_to_primary(request, await self.get_response(request))
+
+    @staticmethod
+    def can_read_from_replica(request: HttpRequest) -> bool:
+        return request.method in SAFE_METHODS and REPLICA_CONFIGURATION["COOKIE_NAME"] not in request.COOKIES
+
+    @staticmethod
+    def pin_to_primary(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        if request.method not in SAFE_METHODS:
+            response.set_cookie(
+                REPLICA_CONFIGURATION["COOKIE_NAME"],
+                "1",
+                max_age=REPLICA_CONFIGURATION["STICKY_SECONDS"],
+                secure=SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        return response
+
+
+class TelemetryMiddleware:
+    """
+    Measures each request's total, database and serialization time along with its query count and cache hits and
+    misses, reports them to the client in a `Server-Timing` header and adds them to the per-view histograms served at
+    `/api/metrics/`.
+
+    Streaming responses are measured up to the point where their body starts being sent.
+    """
+
+    sync_capable = True
+    async_capable = True
+    unmatched_view_name = "unmatched"
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started_at = time.perf_counter()
+
+        with count_queries() as queries, track_request() as telemetry:
+            response = self.get_response(request)
+
+        self.record(request, response, time.perf_counter() - started_at, queries, telemetry)
+
+        if request_metrics.is_flush_due():
+            request_metrics.flush()
+
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started_at = time.perf_counter()
+
+        with count_queries() as queries, track_request() as telemetry:
+            response = await self.get_response(request)
+
+        self.record(request, response, time.perf_counter() - started_at, queries, telemetry)
+
+        if request_metrics.is_flush_due():
+            await sync_to_async(request_metrics.flush)()
+
+        return response
+
+    def record(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        duration: float,
+        queries: QueryCounter,
+        telemetry: RequestTelemetry,
+    ) -> None:
+        resolver_match = request.resolver_match
+        request_metrics.observe(
+            view=resolver_match.view_name if resolver_match else self.unmatched_view_name,
+            histograms={
+                "request_duration_seconds": duration,
+                "db_duration_seconds": queries.duration,
+                "db_queries": queries.count,
+                "serialization_duration_seconds": telemetry.serialization_time,
+            },
+            counters={
+                "cache_hits_total": telemetry.cache_hits,
+                "cache_misses_total": telemetry.cache_misses,
+            },
+        )
+
+        if TELEMETRY_CONFIGURATION["SERVER_TIMING"]:
+            response["Server-Timing"] = ", ".join(
+                (
+                    f'db;dur={queries.duration * 1000:.3f};desc="{queries.count} queries"',
+                    f'cache;desc="hits={telemetry.cache_hits} misses={telemetry.cache_misses}"',
+                    f"serialize;dur={telemetry.serialization_time * 1000:.3f}",
+                    f"total;dur={duration * 1000:.3f}",
+                )
+            )
+
+
+class RequestLoggingMiddleware:
+    """
+    Logs one structured record per request: method, path, view, status, duration and query count.
+
+    Successful responses are sampled at `LOGGER_REQUEST_SAMPLE_RATE`, while client and server errors are always
+    logged. Nothing is computed for records that are sampled out or below the logger's level, and formatting is left
+    to the handlers, which run on the background logging thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started_at = time.perf_counter()
+
+        with count_queries() as queries:
+            response = self.get_response(request)
+
+        self.log_request(request, response, started_at, queries.count)
+        return response
 
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started_at = time.perf_counter()
+
+        with count_queries() as queries:
+            response = await self.get_response(request)
+
+        self.log_request(request, response, started_at, queries.count)
+        return response
+
+    def log_request(self, request: HttpRequest, response: HttpResponse, started_at: float, query_count: int) -> None:
+        status_code = response.status_code
+
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+        elif random.random() < LOGGER_CONFIGURATION["REQUEST_SAMPLE_RATE"]:
+            level = logging.INFO
+        else:
+            return
+
+        if not request_logger.isEnabledFor(level):
+            return
+
+        resolver_match = request.resolver_match
+        request_logger.log(
+            level,
+            "%s %s %s",
+            request.method,
+            request.path,
+            status_code,
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "view": resolver_match.view_name if resolver_match else None,
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - started_at) * 1000, 3),
+                "query_count": query_count,
+            },
+        )
+
+
+class NPlusOneDetectionMiddleware:
+    """
+    Looks for N+1 queries: the same query shape issued `N_PLUS_ONE_THRESHOLD` times or more from the same line while
+    handling a request.
+
+    Depending on `N_PLUS_ONE_MODE`, they are logged as warnings ("warn", meant for staging) or raised as
+    `NPlusOneError` ("raise", used by the `no_n_plus_one` test marker). With "off", requests pass straight through.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if N_PLUS_ONE_CONFIGURATION["MODE"] == "off":
+            return self.get_response(request)
+
+        with detect_n_plus_one(N_PLUS_ONE_CONFIGURATION["THRESHOLD"]) as detector:
+            response = self.get_response(request)
+
+        self.report(request, detector.get_repeated_queries())
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if N_PLUS_ONE_CONFIGURATION["MODE"] == "off":
+            return await self.get_response(request)
+
+        with detect_n_plus_one(N_PLUS_ONE_CONFIGURATION["THRESHOLD"]) as detector:
+            response = await self.get_response(request)
+
+        self.report(request, detector.get_repeated_queries())
+        return response
+
+    @staticmethod
+    def report(request: HttpRequest, repeated_queries: List[QueryShape]) -> None:
+        if not repeated_queries:
+            return
+
+        if N_PLUS_ONE_CONFIGURATION["MODE"] == "raise":
+            raise NPlusOneError(
+                f"Repeated queries during {request.method} {request.path}:\n{format_repeated_queries(repeated_queries)}"
+            )
+
+        for shape in repeated_queries:
+            logger.warning(
+                "Possible N+1 during %s %s: %s queries from %s: %s",
+                request.method,
+                request.path,
+                shape.count,
+                shape.call_site,
+                shape.sql,
+                extra={"call_site": shape.call_site, "query_count": shape.count},
+            )
+
+
+class ExceptionHandlingMiddleware:
+    sync_capable = True
+    async_capable = True
 
-class ExceptionHandlingMiddleware(MiddlewareMixin):
     def __init__(self, get_response: Callable) -> None:
-        super().__init__(get_response)
         self.get_response = get_response
 
-    def __call__(self, request: HttpRequest):
-        logger.info(f"Processing request to {request.path}")
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
 
         try:
             response = self.get_response(request)
-            logger.info(f"Response status: {response.status_code} for request to {request.path}")
         except Exception as ex:
-            logger.error(f"Exception encountered during request to {request.path}: {ex}")
+            response = self.process_exception(request, ex)
+
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        try:
+            response = await self.get_response(request)
+        except Exception as ex:
             response = self.process_exception(request, ex)
 
         return response
@@ -29,6 +343,7 @@ class ExceptionHandlingMiddleware(MiddlewareMixin):
     @staticmethod
     def process_exception(request: HttpRequest, exception: Exception):
         if isinstance(exception, ValidationError):
+            logger.warning("Invalid request parameters for request to %s: %s", request.path, exception)
             error_details = exception.messages if hasattr(exception, "messages") else [str(exception)]
             response_data = {
                 "detail": "Invalid request parameters.",
@@ -37,8 +352,56 @@ class ExceptionHandlingMiddleware(MiddlewareMixin):
             status_code = 400
 
         else:
-            logger.exception(f"Unhandled exception: {exception}")
+            logger.exception("Unhandled exception during request to %s", request.path)
             response_data = {"detail": "Internal server error."}
             status_code = 500
 
         return JsonResponse(response_data, status=status_code)
+
+
+class QueryShapeRecordingMiddleware:
+    """
+    Records the shape, count and duration of the queries of every request for `manage.py index_advisor` when
+    `QUERY_SHAPES_RECORD` is on. With it off, requests pass straight through.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not QUERY_SHAPES_CONFIGURATION["RECORD"]:
+            return self.get_response(request)
+
+        with record_query_shapes() as recorder:
+            response = self.get_response(request)
+
+        query_shape_statistics.observe(recorder.shapes)
+
+        if query_shape_statistics.is_flush_due():
+            query_shape_statistics.flush()
+
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not QUERY_SHAPES_CONFIGURATION["RECORD"]:
+            return await self.get_response(request)
+
+        with record_query_shapes() as recorder:
+            response = await self.get_response(request)
+
+        query_shape_statistics.observe(recorder.shapes)
+
+        if query_shape_statistics.is_flush_due():
+            # Composing the samples goes through a database connection.
+            await sync_to_async(query_shape_statistics.flush)()
+
+        return response
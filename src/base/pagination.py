@@ -0,0 +1,258 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from django.core.paginator import InvalidPage
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import View
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque-cursor pagination over a composite, descending `(position_field, tiebreaker_field)` key.
+
+    Each page seeks straight to the cursor through the matching composite index instead of counting and skipping
+    rows, so every page costs the same as the first one no matter how deep the client goes.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+    page_size = api_settings.PAGE_SIZE
+    position_field = "created_at"
+    tiebreaker_field = "id"
+
+    def __init__(self) -> None:
+        self.base_url: Optional[str] = None
+        self.next_position: Optional[Tuple[str, str]] = None
+        self.previous_position: Optional[Tuple[str, str]] = None
+
+    @property
+    def ordering(self) -> Tuple[str, str]:
+        return f"-{self.position_field}", f"-{self.tiebreaker_field}"
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Optional[View] = None) -> List[Model]:
+        page_queryset = self._get_page_queryset(queryset, request)
+        return self._set_page(list(page_queryset), request)
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Optional[View] = None
+    ) -> List[Model]:
+        page_queryset = self._get_page_queryset(queryset, request)
+        return self._set_page([instance async for instance in page_queryset], request)
+
+    def get_paginated_data(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data: List[Dict[str, Any]]) -> Response:
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+
+        return replace_query_param(self.base_url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_previous_link(self) -> Optional[str]:
+        if self.previous_position is None:
+            return None
+
+        cursor = self.encode_cursor(self.previous_position, reverse=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_schema_operation_parameters(self, view: View) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+        ]
+
+    @staticmethod
+    def encode_cursor(position: Sequence[str], reverse: bool = False) -> str:
+        payload = json.dumps({"p": list(position), "r": int(reverse)}, separators=(",", ":"))
+        return urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request: Request) -> Tuple[Optional[Tuple[str, str]], bool]:
+        if not (encoded := request.query_params.get(self.cursor_query_param)):
+            return None, False
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode()))
+            position_value, tiebreaker_value = payload["p"]
+            return (str(position_value), str(tiebreaker_value)), bool(payload.get("r"))
+        except (BinasciiError, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_page_queryset(self, queryset: QuerySet, request: Request) -> QuerySet:
+        self.base_url = request.build_absolute_uri()
+        position, reverse = self.decode_cursor(request)
+
+        if position is None:
+            queryset = queryset.order_by(*self.ordering)
+        elif reverse:
+            queryset = queryset.filter(self._build_seek_filter(position, lookup="gt")).order_by(
+                self.position_field, self.tiebreaker_field
+            )
+        else:
+            queryset = queryset.filter(self._build_seek_filter(position, lookup="lt")).order_by(*self.ordering)
+
+        return queryset[: self.page_size + 1]
+
+    def _set_page(self, results: List[Model], request: Request) -> List[Model]:
+        position, reverse = self.decode_cursor(request)
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+
+        has_next = has_more if not reverse else position is not None
+        has_previous = has_more if reverse else position is not None
+
+        self.next_position = self._get_position(results[-1]) if results and has_next else None
+        self.previous_position = self._get_position(results[0]) if results and has_previous else None
+        return results
+
+    def _build_seek_filter(self, position: Tuple[str, str], lookup: str) -> Q:
+        # The leading inclusive bound is what lets Postgres start the index scan at the cursor;
+        # the disjunction only trims rows sharing the cursor's position value.
+        position_value, tiebreaker_value = position
+        return Q(**{f"{self.position_field}__{lookup}e": position_value}) & (
+            Q(**{f"{self.position_field}__{lookup}": position_value})
+            | Q(**{f"{self.tiebreaker_field}__{lookup}": tiebreaker_value})
+        )
+
+    def _get_position(self, instance: Model) -> Tuple[str, str]:
+        position_value = getattr(instance, self.position_field)
+        if isinstance(position_value, datetime):
+            position_value = position_value.isoformat()
+
+        return str(position_value), str(getattr(instance, self.tiebreaker_field))
+
+
+class AsyncPageNumberPagination(PageNumberPagination):
+    """
+    `PageNumberPagination` that can also evaluate the page through the async ORM.
+    """
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Optional[View] = None
+    ) -> List[Model]:
+        self.request = request
+        paginator = self.django_paginator_class(queryset, self.get_page_size(request))
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        self.page.object_list = [instance async for instance in self.page.object_list]
+        return list(self.page)
+
+    def get_paginated_data(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "count": self.page.paginator.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+
+class KeysetOrPageNumberPagination(BasePagination):
+    """
+    Keyset pagination by default, with classic page-number pagination kept for older clients that either send
+    `?pagination=page` or are already paging through `?page=N`.
+
+    Querysets that arrive explicitly ordered (e.g. search results ordered by rank) are paginated by page number as
+    well, since their ordering has no seekable index behind it.
+    """
+
+    pagination_mode_query_param = "pagination"
+    page_number_mode = "page"
+
+    def __init__(self) -> None:
+        self.keyset_paginator = KeysetPagination()
+        self.page_number_paginator = AsyncPageNumberPagination()
+        self.paginator: Union[KeysetPagination, AsyncPageNumberPagination] = self.keyset_paginator
+
+    @property
+    def cursor_query_param(self) -> str:
+        return self.keyset_paginator.cursor_query_param
+
+    @property
+    def page_query_param(self) -> str:
+        return self.page_number_paginator.page_query_param
+
+    @property
+    def query_params(self) -> Tuple[str, ...]:
+        return self.pagination_mode_query_param, self.cursor_query_param, self.page_query_param
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Optional[View] = None) -> List[Model]:
+        queryset = self._select_paginator(queryset, request)
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Optional[View] = None
+    ) -> List[Model]:
+        queryset = self._select_paginator(queryset, request)
+        return await self.paginator.apaginate_queryset(queryset, request, view)
+
+    def get_paginated_data(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self.paginator.get_paginated_data(data)
+
+    def get_paginated_response(self, data: List[Dict[str, Any]]) -> Response:
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        return self.paginator.get_paginated_response_schema(schema)
+
+    def is_page_number_mode(self, request: Request) -> bool:
+        return (
+            request.query_params.get(self.pagination_mode_query_param) == self.page_number_mode
+            or self.page_query_param in request.query_params
+        )
+
+    def _select_paginator(self, queryset: QuerySet, request: Request) -> QuerySet:
+        if queryset.query.order_by:
+            self.paginator = self.page_number_paginator
+        elif self.is_page_number_mode(request):
+            self.paginator = self.page_number_paginator
+            queryset = queryset.order_by(*self.keyset_paginator.ordering)
+        else:
+            self.paginator = self.keyset_paginator
+
+        return queryset
+
+    def get_schema_operation_parameters(self, view: View) -> List[Dict[str, Any]]:
+        return [
+            *self.keyset_paginator.get_schema_operation_parameters(view),
+            *self.page_number_paginator.get_schema_operation_parameters(view),
+        ]
@@ -0,0 +1,36 @@
+import codecs
+import json
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON lazily, one line at a time, so arbitrarily large uploads can be processed in
+    bounded memory.
+
+    The parsed data is an iterator of the decoded lines. Blank lines are skipped, and a line that isn't valid JSON is
+    yielded as a `ParseError` instead of aborting the whole stream, so callers can report it next to the other rows.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(
+        self, stream: Any, media_type: Optional[str] = None, parser_context: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[Union[Dict[str, Any], ParseError]]:
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        return self._parse_lines(codecs.getreader(encoding)(stream))
+
+    @staticmethod
+    def _parse_lines(lines: Iterator[str]) -> Iterator[Union[Dict[str, Any], ParseError]]:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield ParseError(f"Line {line_number}: JSON parse error - {exc}")
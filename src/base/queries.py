@@ -0,0 +1,188 @@
+import os
+import re
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple, TypeVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+class QueryShape(NamedTuple):
+    sql: str
+    call_site: str
+    count: int
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+    def record(self, sql: str, duration: float, params: Any = None) -> None:
+        self.count += 1
+        self.duration += duration
+
+
+class NPlusOneDetector(QueryCounter):
+    """
+    Groups the executed queries by normalized SQL and by the line of project code that issued them.
+
+    A shape issued `threshold` times or more from the same line is what a lazy relation accessed in a loop looks like,
+    while the same shape issued once from several places is not. Finding the call site walks the stack on every query,
+    so the detector is meant for tests and staging, not for every production request.
+    """
+
+    def __init__(self, threshold: int) -> None:
+        super().__init__()
+        self.threshold = threshold
+        self.shapes: Counter[Tuple[str, str]] = Counter()
+
+    def record(self, sql: str, duration: float, params: Any = None) -> None:
+        super().record(sql, duration, params)
+        self.shapes[(normalize_sql(sql), get_call_site())] += 1
+
+    def get_repeated_queries(self) -> List[QueryShape]:
+        return [
+            QueryShape(sql, call_site, count)
+            for (sql, call_site), count in self.shapes.most_common()
+            if count >= self.threshold
+        ]
+
+
+class RecordedShape(NamedTuple):
+    count: int
+    duration: float
+    # The first statement of the shape and its parameters, to EXPLAIN it later.
+    sample: Tuple[str, Any]
+
+
+class QueryShapeRecorder(QueryCounter):
+    """
+    Aggregates the executed queries by normalized SQL: how often each shape ran, for how long in total, and the first
+    statement of each shape, which `manage.py index_advisor` explains.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.shapes: Dict[str, RecordedShape] = {}
+
+    def record(self, sql: str, duration: float, params: Any = None) -> None:
+        super().record(sql, duration, params)
+        shape = normalize_sql(sql)
+
+        if (recorded := self.shapes.get(shape)) is None:
+            self.shapes[shape] = RecordedShape(1, duration, (sql, params))
+        else:
+            self.shapes[shape] = recorded._replace(count=recorded.count + 1, duration=recorded.duration + duration)
+
+
+QueryCounterT = TypeVar("QueryCounterT", bound=QueryCounter)
+
+_active_counters: ContextVar[Tuple[QueryCounter, ...]] = ContextVar("query_counters", default=())
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Count and time the database queries executed within the block, on any connection, including the ones async views
+    run in `sync_to_async` threads (those inherit a copy of the context, which still points at the same counter).
+
+    Blocks can be nested: every query is recorded by all the counters active around it.
+    """
+    with _activate(QueryCounter()) as counter:
+        yield counter
+
+
+@contextmanager
+def detect_n_plus_one(threshold: int) -> Iterator[NPlusOneDetector]:
+    with _activate(NPlusOneDetector(threshold)) as detector:
+        yield detector
+
+
+@contextmanager
+def record_query_shapes() -> Iterator[QueryShapeRecorder]:
+    with _activate(QueryShapeRecorder()) as recorder:
+        yield recorder
+
+
+def format_repeated_queries(repeated_queries: List[QueryShape]) -> str:
+    return "\n".join(f"{shape.count} x {shape.call_site}: {shape.sql}" for shape in repeated_queries)
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Reduce a statement to its shape: literals and placeholders become `?` and value lists of any length `(...)`.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql.replace("%s", "?"))
+    sql = _VALUE_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def get_call_site() -> str:
+    """
+    Return the innermost frame of project code on the stack, outside this module, as `path:line in function`.
+    """
+    project_dir = str(settings.BASE_DIR) + os.sep
+    frame = sys._getframe(1)
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(project_dir) and filename != __file__ and "site-packages" not in filename:
+            return f"{os.path.relpath(filename, project_dir)}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+        frame = frame.f_back
+
+    return "<unknown>"
+
+
+@contextmanager
+def _activate(counter: QueryCounterT) -> Iterator[QueryCounterT]:
+    token = _active_counters.set((*_active_counters.get(), counter))
+
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
+
+
+def _count_query(execute: Callable, sql: str, params: Any, many: bool, context: Any) -> Any:
+    if not (counters := _active_counters.get()):
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started_at
+        for counter in counters:
+            # The batches of `executemany` are not one statement's parameters.
+            counter.record(sql, duration, None if many else params)
+
+
+@receiver(connection_created)
+def install_query_counter(connection: Any, **kwargs: Any) -> None:
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+# Connections opened before this module was imported never send `connection_created` again.
+for _connection in connections.all(initialized_only=True):
+    install_query_counter(_connection)
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set
+from uuid import UUID
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from base.queries import RecordedShape
+from base.settings import QUERY_SHAPES_CONFIGURATION
+
+
+logger = logging.getLogger(__name__)
+
+# Statements `EXPLAIN` accepts, the only ones whose samples are kept.
+EXPLAINABLE_STATEMENTS = ("SELECT", "WITH", "UPDATE", "DELETE")
+# Tables holding credentials, personal data or tokens. Statements reading from or writing to them are recorded without
+# a sample, and other statements' parameters compared with their columns are redacted.
+SENSITIVE_TABLES = (
+    "users_user",
+    "token_blacklist_outstandingtoken",
+    "token_blacklist_blacklistedtoken",
+    "django_session",
+)
+
+_SENSITIVE_TABLE_NAMES = "|".join(SENSITIVE_TABLES)
+# The table a statement reads from, updates or deletes from: the first one after `FROM` or `UPDATE`.
+_TARGET_TABLE = re.compile(r'\b(?:FROM|UPDATE)\s+"(\w+)"', re.IGNORECASE)
+# Aliases given to the sensitive tables, such as Django's `U0` in subqueries.
+_SENSITIVE_TABLE_ALIAS = re.compile(
+    rf'"(?:{_SENSITIVE_TABLE_NAMES})"\s+(?:AS\s+)?"?'
+    r"(?!(?:ON|WHERE|INNER|LEFT|RIGHT|FULL|CROSS|JOIN|GROUP|ORDER|LIMIT)\b)(\w+)",
+    re.IGNORECASE,
+)
+# The start of the condition or expression a placeholder belongs to.
+_CLAUSE_START = re.compile(
+    r"\b(?:SELECT|WHERE|AND|OR|ON|HAVING|WHEN|THEN|ELSE|LIMIT|OFFSET|SET|VALUES)\b", re.IGNORECASE
+)
+# What separates the values of an `IN` list or a `BETWEEN`, which belong to the condition before them.
+_VALUE_SEPARATOR = re.compile(r"^\s*(?:,|AND)\s*$", re.IGNORECASE)
+
+
+class QueryShapeSummary(NamedTuple):
+    shape: str
+    count: int
+    duration: float
+    # The first recorded statement of the shape with its parameters inlined, or `None` if it couldn't be composed or
+    # is not kept (statements that can't be explained and the ones on `SENSITIVE_TABLES`). Parameters compared with
+    # the columns of `SENSITIVE_TABLES` are replaced with placeholder values of the same type.
+    sample: Optional[str]
+
+
+class QueryShapeStatistics:
+    """
+    Query shapes recorded by every worker process, for `manage.py index_advisor`.
+
+    Like the request metrics, each process aggregates the shapes in memory and adds them to Redis at most once every
+    `flush_interval` seconds: counts and total durations go to one hash, keyed by a digest of the shape, and the shape
+    with its first sample statement to another, written only once per shape.
+    """
+
+    def __init__(self, namespace: str, flush_interval: float) -> None:
+        self.namespace = namespace
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, RecordedShape] = {}
+        self._stored_digests: Set[str] = set()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    @property
+    def totals_key(self) -> str:
+        return cache.make_key(f"{self.namespace}:totals")
+
+    @property
+    def samples_key(self) -> str:
+        return cache.make_key(f"{self.namespace}:samples")
+
+    def observe(self, shapes: Dict[str, RecordedShape]) -> None:
+        with self._lock:
+            for shape, recorded in shapes.items():
+                if (pending := self._pending.get(shape)) is None:
+                    self._pending[shape] = recorded
+                else:
+                    self._pending[shape] = pending._replace(
+                        count=pending.count + recorded.count, duration=pending.duration + recorded.duration
+                    )
+
+    def is_flush_due(self) -> bool:
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return
+
+        pipeline = get_redis_connection().pipeline(transaction=False)
+        new_digests = set()
+
+        for shape, recorded in pending.items():
+            digest = self._build_digest(shape)
+            pipeline.hincrby(self.totals_key, f"count|{digest}", recorded.count)
+            pipeline.hincrbyfloat(self.totals_key, f"duration|{digest}", recorded.duration)
+
+            if digest not in self._stored_digests:
+                sample = self._build_sample(shape, *recorded.sample)
+                pipeline.hsetnx(self.samples_key, digest, json.dumps({"shape": shape, "sample": sample}))
+                new_digests.add(digest)
+
+        try:
+            pipeline.execute()
+        except RedisError:
+            logger.warning("Could not flush %s query shapes, keeping them for the next flush", len(pending))
+            self.observe(pending)
+        else:
+            self._stored_digests |= new_digests
+
+    def collect(self) -> List[QueryShapeSummary]:
+        """
+        Returns:
+            Every recorded shape, the ones that took the most time in total first.
+        """
+        self.flush()
+        redis = get_redis_connection()
+        totals = {field.decode(): value for field, value in redis.hgetall(self.totals_key).items()}
+        summaries = []
+
+        for digest, stored in redis.hgetall(self.samples_key).items():
+            digest, stored = digest.decode(), json.loads(stored)
+            summaries.append(
+                QueryShapeSummary(
+                    shape=stored["shape"],
+                    count=int(totals.get(f"count|{digest}", 0)),
+                    duration=float(totals.get(f"duration|{digest}", 0.0)),
+                    sample=stored["sample"],
+                )
+            )
+
+        return sorted(summaries, key=lambda summary: summary.duration, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._stored_digests.clear()
+
+        get_redis_connection().delete(self.totals_key, self.samples_key)
+
+    @staticmethod
+    def _build_digest(shape: str) -> str:
+        return hashlib.md5(shape.encode(), usedforsecurity=False).hexdigest()
+
+    @classmethod
+    def _build_sample(cls, shape: str, sql: str, params: Any) -> Optional[str]:
+        if not shape.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS):
+            return None
+
+        if (target := _TARGET_TABLE.search(shape)) is not None and target.group(1) in SENSITIVE_TABLES:
+            return None
+
+        if params is not None and any(f'"{table}"' in sql for table in SENSITIVE_TABLES):
+            if (params := redact_params(sql, params)) is None:
+                return None
+
+        return cls._compose_sample(sql, params)
+
+    @staticmethod
+    def _compose_sample(sql: str, params: Any) -> Optional[str]:
+        if params is None:
+            return sql
+
+        try:
+            return connections[DEFAULT_DB_ALIAS].ops.compose_sql(sql, params)
+        except (DatabaseError, TypeError, ValueError):
+            return None
+
+
+def redact_params(sql: str, params: Sequence[Any]) -> Optional[List[Any]]:
+    """
+    Replace the parameters compared with the columns of `SENSITIVE_TABLES`, or of their aliases, with placeholder
+    values of the same type, so the sample can still be explained.
+
+    Returns:
+        The redacted parameters, or `None` if they can't be matched with the statement's `%s` placeholders.
+    """
+    segments = sql.split("%s")[:-1]
+    if not isinstance(params, (list, tuple)) or len(segments) != len(params):
+        return None
+
+    qualifiers = "|".join([f'"(?:{_SENSITIVE_TABLE_NAMES})"', *map(re.escape, _SENSITIVE_TABLE_ALIAS.findall(sql))])
+    sensitive_column = re.compile(rf'(?<![\w"])(?:{qualifiers})\."?\w+"?')
+    redacted, sensitive = [], False
+
+    for segment, param in zip(segments, params):
+        if not _VALUE_SEPARATOR.match(segment):
+            sensitive = sensitive_column.search(_CLAUSE_START.split(segment)[-1]) is not None
+
+        redacted.append(_redact_value(param) if sensitive else param)
+
+    return redacted
+
+
+def _redact_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return "redacted"
+    if isinstance(value, UUID):
+        return UUID(int=0)
+    if isinstance(value, (bool, int, float)):
+        return type(value)()
+    if isinstance(value, date):
+        return value.replace(year=2000, month=1, day=1)
+
+    return None
+
+
+query_shape_statistics = QueryShapeStatistics(
+    namespace="query_shapes", flush_interval=QUERY_SHAPES_CONFIGURATION["FLUSH_INTERVAL"]
+)
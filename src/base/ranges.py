@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.contrib.postgres.fields import DateRangeField
+from django.db.models import Func, Value
+
+
+class DateSpan(Func):
+    """
+    `daterange(start, end, '[]')`, the days from `start` to `end` with both included.
+
+    Indexes on it must be built from the same expression, including the bounds, for filters to use them.
+    """
+
+    function = "daterange"
+    output_field = DateRangeField()
+
+    def __init__(self, start: Any, end: Any, **extra: Any) -> None:
+        super().__init__(start, end, Value("[]"), **extra)
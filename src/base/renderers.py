@@ -0,0 +1,17 @@
+from typing import Any, Mapping, Optional
+
+from rest_framework.renderers import JSONRenderer
+
+from base.telemetry import measure_serialization
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` that reports the time spent encoding the response as serialization time.
+    """
+
+    def render(
+        self, data: Any, accepted_media_type: Optional[str] = None, renderer_context: Optional[Mapping[str, Any]] = None
+    ) -> bytes:
+        with measure_serialization():
+            return super().render(data, accepted_media_type, renderer_context)
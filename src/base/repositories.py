@@ -1,8 +1,8 @@
-from typing import Generic, Type, TypeVar
+from typing import Any, Dict, Generic, Tuple, Type, TypeVar, Union
 
 from django.db import models
-from django.db.models import QuerySet
-from django.shortcuts import get_object_or_404
+from django.db.models import Count, Expression, Max, QuerySet
+from django.shortcuts import aget_object_or_404, get_object_or_404
 
 
 ModelType = TypeVar("ModelType", bound=models.Model)
@@ -18,10 +18,34 @@ class BaseRepository(Generic[ModelType]):
     def get(cls, **kwargs) -> ModelType:
         return get_object_or_404(cls.model, **kwargs)
 
+    @classmethod
+    async def aget(cls, **kwargs) -> ModelType:
+        return await aget_object_or_404(cls.get_all(), **kwargs)
+
     @classmethod
     def get_all(cls) -> QuerySet[ModelType]:
         return cls.model.objects.all()
 
+    @classmethod
+    def get_watermark(cls, queryset: QuerySet[ModelType], *fields: Union[str, Expression]) -> Tuple[Any, ...]:
+        """
+        Summarize the rows of `queryset` with a single aggregate query, to tell whether they changed without loading
+        them.
+
+        Args:
+            queryset: The rows to summarize.
+            fields: Timestamps refreshed on every write, e.g. `updated_at`, or expressions of related ones. With an
+                index on a single timestamp field and no filters, the query is answered by an index-only scan.
+
+        Returns:
+            The number of rows followed by the latest value of each field. Deleted rows only show in the count.
+        """
+        return tuple(queryset.order_by().aggregate(**cls._get_watermark_aggregates(fields)).values())
+
+    @classmethod
+    async def aget_watermark(cls, queryset: QuerySet[ModelType], *fields: Union[str, Expression]) -> Tuple[Any, ...]:
+        return tuple((await queryset.order_by().aaggregate(**cls._get_watermark_aggregates(fields))).values())
+
     @classmethod
     def get_by_id(cls, pk: str) -> ModelType:
         return cls.model.objects.get(pk=pk)
@@ -45,3 +69,7 @@ class BaseRepository(Generic[ModelType]):
     @staticmethod
     def delete(instance: ModelType) -> None:
         instance.delete()
+
+    @staticmethod
+    def _get_watermark_aggregates(fields: Tuple[Union[str, Expression], ...]) -> Dict[str, Any]:
+        return {"count": Count("*"), **{f"max_{index}": Max(field) for index, field in enumerate(fields)}}
@@ -0,0 +1,72 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Type
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+from base.settings import REPLICA_CONFIGURATION
+
+
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+def get_replica_alias() -> str:
+    """
+    Return the alias analytics queries should read from: the replica when one is configured, the primary otherwise.
+    """
+    return REPLICA_CONFIGURATION["ALIAS"] or DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def read_from_replica() -> Iterator[None]:
+    """
+    Route the reads made within the block, including the ones async views run in `sync_to_async` threads, to the
+    replica. Writes always go to the primary.
+    """
+    token = _replica_reads.set(True)
+
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """
+    Route the reads made within the block to the primary, even within `read_from_replica`.
+
+    For reads whose results are cached: the replica may not have caught up with the write that invalidated the cache
+    yet, and its stale rows would then be stored under the new generation until the next write or the timeout.
+    """
+    token = _replica_reads.set(False)
+
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the replica only within `read_from_replica` blocks (opened by `ReplicaRoutingMiddleware` for
+    safe-method requests) and everything else to the primary, so management commands, signals and write requests keep
+    reading their own writes. The reads that fill caches open `read_from_primary` blocks.
+    """
+
+    def db_for_read(self, model: Type[Model], **hints: Any) -> Optional[str]:
+        if _replica_reads.get() and REPLICA_CONFIGURATION["ALIAS"]:
+            return REPLICA_CONFIGURATION["ALIAS"]
+
+        return None
+
+    def db_for_write(self, model: Type[Model], **hints: Any) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:
+        # The replica holds the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: Optional[str] = None, **hints: Any) -> bool:
+        return db == DEFAULT_DB_ALIAS
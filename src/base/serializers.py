@@ -0,0 +1,23 @@
+from typing import Any
+
+from rest_framework import serializers
+
+from base.telemetry import measure_serialization
+
+
+class TimedSerializerMixin:
+    """
+    Reports the time spent building `data` as serialization time.
+
+    Serializers mixing it in should also set `Meta.list_serializer_class = TimedListSerializer`, so that `many=True`
+    instances are timed as well.
+    """
+
+    @property
+    def data(self) -> Any:
+        with measure_serialization():
+            return super().data
+
+
+class TimedListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    pass
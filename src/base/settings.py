@@ -2,6 +2,8 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+import django
+from django.core.exceptions import ImproperlyConfigured
 from environs import Env
 
 
@@ -19,6 +21,32 @@ with env.prefixed("POSTGRES_"):
         "PASSWORD": env.str("PASSWORD"),
         "HOST": env.str("HOST"),
         "PORT": env.str("PORT"),
+        # Keep each worker thread's connection open between requests instead of reconnecting on every request, and
+        # check it is still usable before reusing it.
+        "CONN_MAX_AGE": env.int("CONN_MAX_AGE", 60),
+        "CONN_HEALTH_CHECKS": env.bool("CONN_HEALTH_CHECKS", True),
+    }
+    POSTGRES_POOL_CONFIGURATION = {
+        "ENABLED": env.bool("POOL", False),
+        "MIN_SIZE": env.int("POOL_MIN_SIZE", 2),
+        "MAX_SIZE": env.int("POOL_MAX_SIZE", 10),
+        "TIMEOUT": env.float("POOL_TIMEOUT", 10.0),
+    }
+
+# An optional read replica: unset values fall back to the primary's, and setting the host is what enables it.
+with env.prefixed("POSTGRES_REPLICA_"):
+    POSTGRES_REPLICA_DATABASE = {
+        "HOST": env.str("HOST", ""),
+        "PORT": env.str("PORT", POSTGRES_DATABASE["PORT"]),
+        "NAME": env.str("DB", POSTGRES_DATABASE["NAME"]),
+        "USER": env.str("USER", POSTGRES_DATABASE["USER"]),
+        "PASSWORD": env.str("PASSWORD", POSTGRES_DATABASE["PASSWORD"]),
+    }
+    REPLICA_CONFIGURATION = {
+        "ALIAS": "replica" if POSTGRES_REPLICA_DATABASE["HOST"] else None,
+        # How long a client's reads stay on the primary after it writes, so it always sees its own changes.
+        "STICKY_SECONDS": env.int("STICKY_SECONDS", 5),
+        "COOKIE_NAME": "use_primary",
     }
 
 
@@ -32,6 +60,21 @@ with env.prefixed("REDIS_"):
         "TIMEOUT": env.int("TIMEOUT"),
     }
 
+with env.prefixed("CACHE_"):
+    CACHE_CONFIGURATION = {
+        "EVENTS_LIST_TIMEOUT": env.int("EVENTS_LIST_TIMEOUT", 60 * 60 * 24),
+        "AUTH_USER_TIMEOUT": env.int("AUTH_USER_TIMEOUT", 60 * 5),
+        "AUTH_USER_LOCAL_TIMEOUT": env.int("AUTH_USER_LOCAL_TIMEOUT", 10),
+        "AUTH_USER_LOCAL_MAXSIZE": env.int("AUTH_USER_LOCAL_MAXSIZE", 1024),
+        "SAVED_EVENTS_TIMEOUT": env.int("SAVED_EVENTS_TIMEOUT", 60 * 60 * 24),
+    }
+
+with env.prefixed("EVENTS_"):
+    EVENTS_CONFIGURATION = {
+        "BULK_CREATE_BATCH_SIZE": env.int("BULK_CREATE_BATCH_SIZE", 1000),
+        "BULK_CREATE_MAX_ROWS": env.int("BULK_CREATE_MAX_ROWS", 10000),
+    }
+
 with env.prefixed("JWT_"):
     JWT_CONFIGURATION = {
         "ACCESS_TOKEN_LIFETIME_DAYS": env.int("ACCESS_TOKEN_LIFETIME_DAYS"),
@@ -55,6 +98,28 @@ with env.prefixed("LOGGER_"):
     LOGGER_CONFIGURATION = {
         "CONSOLE_LEVEL": env.str("CONSOLE_LEVEL"),
         "FILE_LEVEL": env.str("FILE_LEVEL"),
+        "REQUEST_SAMPLE_RATE": env.float("REQUEST_SAMPLE_RATE", 1.0),
+        "QUEUE_SIZE": env.int("QUEUE_SIZE", 10000),
+    }
+
+with env.prefixed("N_PLUS_ONE_"):
+    N_PLUS_ONE_CONFIGURATION = {
+        # "off", "warn" (log repeated queries, e.g. on staging) or "raise" (fail the request, used by tests).
+        "MODE": env.str("MODE", "off"),
+        "THRESHOLD": env.int("THRESHOLD", 5),
+    }
+
+with env.prefixed("QUERY_SHAPES_"):
+    QUERY_SHAPES_CONFIGURATION = {
+        # Records the shape of every query for `manage.py index_advisor`, e.g. on staging. Kept samples have literals.
+        "RECORD": env.bool("RECORD", False),
+        "FLUSH_INTERVAL": env.float("FLUSH_INTERVAL", 5.0),
+    }
+
+with env.prefixed("TELEMETRY_"):
+    TELEMETRY_CONFIGURATION = {
+        "SERVER_TIMING": env.bool("SERVER_TIMING", True),
+        "FLUSH_INTERVAL": env.float("FLUSH_INTERVAL", 5.0),
     }
 
 # Django settings
@@ -63,8 +128,11 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = env.str("SECRET_KEY")
 DEBUG = env.bool("DEBUG")
+ASYNC_READ_VIEWS = env.bool("ASYNC_READ_VIEWS", False)
 ALLOWED_HOSTS = env.list("ALLOWED_HOSTS")
 INTERNAL_IPS = env.list("INTERNAL_IPS")
+# Addresses of the reverse proxies whose `X-Forwarded-For` is trusted to name the client.
+TRUSTED_PROXIES = env.list("TRUSTED_PROXIES", [])
 
 
 INSTALLED_APPS = [
@@ -75,9 +143,9 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # 3-rd party
     "django_filters",
-    "debug_toolbar",
     "rest_framework",
     "rest_framework_simplejwt.token_blacklist",
     # local
@@ -94,13 +162,24 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    # 3-rd party
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
-    "request_logging.middleware.LoggingMiddleware",
     # local
+    "base.middlewares.ReplicaRoutingMiddleware",
+    "base.middlewares.TelemetryMiddleware",
+    "base.middlewares.RequestLoggingMiddleware",
+    "base.middlewares.NPlusOneDetectionMiddleware",
+    "base.middlewares.QueryShapeRecordingMiddleware",
     "base.middlewares.ExceptionHandlingMiddleware",
 ]
 
+if DEBUG:
+    # The toolbar is sync-only and would force every ASGI request through a worker thread, so it is only
+    # installed where it can actually be shown.
+    INSTALLED_APPS.insert(INSTALLED_APPS.index("django_filters") + 1, "debug_toolbar")
+    MIDDLEWARE.insert(
+        MIDDLEWARE.index("base.middlewares.RequestLoggingMiddleware"),
+        "debug_toolbar.middleware.DebugToolbarMiddleware",
+    )
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -147,6 +226,39 @@ DATABASES = {
     "default": POSTGRES_DATABASE,
 }
 
+if REPLICA_CONFIGURATION["ALIAS"]:
+    DATABASES[REPLICA_CONFIGURATION["ALIAS"]] = {
+        **POSTGRES_DATABASE,
+        **POSTGRES_REPLICA_DATABASE,
+        "TEST": {"MIRROR": "default"},
+    }
+
+if POSTGRES_POOL_CONFIGURATION["ENABLED"]:
+    # One psycopg 3 pool per worker process, shared by its threads. Pooled connections go back to the pool after
+    # every request, so they cannot be persistent as well; `check` replaces the persistent connections' health checks.
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError:
+        raise ImproperlyConfigured("POSTGRES_POOL needs psycopg 3 with its pool extra: `psycopg[binary,pool]`.")
+
+    if django.VERSION < (5, 1):
+        raise ImproperlyConfigured("POSTGRES_POOL needs Django 5.1 or later.")
+
+    for database in DATABASES.values():
+        database.update(
+            CONN_MAX_AGE=0,
+            OPTIONS={
+                "pool": {
+                    "min_size": POSTGRES_POOL_CONFIGURATION["MIN_SIZE"],
+                    "max_size": POSTGRES_POOL_CONFIGURATION["MAX_SIZE"],
+                    "timeout": POSTGRES_POOL_CONFIGURATION["TIMEOUT"],
+                    "check": ConnectionPool.check_connection,
+                },
+            },
+        )
+
+DATABASE_ROUTERS = ["base.routers.ReplicaRouter"]
+
 CACHES = {
     "default": REDIS_CONFIGURATION,
 }
@@ -158,14 +270,19 @@ LOG_DIR = os.path.join(BASE_DIR, "logs")
 if not os.path.exists(LOG_DIR):
     os.makedirs(LOG_DIR)
 
+# Records are handed to a background listener thread through the "queue" handler, which formats and writes them
+# with the handlers it names, so request threads never block on formatting or file I/O.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
         "verbose": {
-            "format": "{levelname} {asctime} {module}",
+            "format": "{levelname} {asctime} {module} {message}",
             "style": "{",
         },
+        "json": {
+            "()": "base.loggers.JSONFormatter",
+        },
     },
     "handlers": {
         "console": {
@@ -177,33 +294,48 @@ LOGGING = {
             "level": LOGGER_CONFIGURATION["FILE_LEVEL"],
             "class": "logging.FileHandler",
             "filename": os.path.join(LOG_DIR, "eventfor.log"),
-            "formatter": "verbose",
+            "formatter": "json",
+        },
+        "queue": {
+            "()": "base.loggers.QueueListenerHandler",
+            "handlers": ["cfg://handlers.console"] if DEBUG else ["cfg://handlers.file"],
+            "queue_size": LOGGER_CONFIGURATION["QUEUE_SIZE"],
         },
     },
     "loggers": {
         "django.request": {
-            "handlers": ["console"] if DEBUG else ["file"],
+            "handlers": ["queue"],
             "level": LOGGER_CONFIGURATION["CONSOLE_LEVEL"] if DEBUG else LOGGER_CONFIGURATION["FILE_LEVEL"],
             "propagate": True,
         },
+        "base": {
+            "handlers": ["queue"],
+            "level": LOGGER_CONFIGURATION["CONSOLE_LEVEL"] if DEBUG else LOGGER_CONFIGURATION["FILE_LEVEL"],
+            "propagate": False,
+        },
     },
 }
 
 # Rest Framework and DJT settings
 
 DEBUG_TOOLBAR_CONFIG = {
-    "SHOW_TOOLBAR_CALLBACK": lambda request: DEBUG,
+    "SHOW_TOOLBAR_CALLBACK": "base.utils.show_debug_toolbar",
 }
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.CachedJWTAuthentication",),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": env.int("PAGE_SIZE"),
 }
 
-if not DEBUG:
-    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ("rest_framework.renderers.JSONRenderer",)
+if DEBUG:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "base.renderers.TimedJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+else:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ("base.renderers.TimedJSONRenderer",)
 
 # JWT settings
 
@@ -0,0 +1,64 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class RequestTelemetry:
+    """
+    Cache and serialization figures collected while a single request is handled. Database figures come from
+    `base.queries.count_queries`, which records them at the connection level.
+    """
+
+    def __init__(self) -> None:
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.serialization_time = 0.0
+        self.serializing = False
+
+
+_current_telemetry: ContextVar[Optional[RequestTelemetry]] = ContextVar("request_telemetry", default=None)
+
+
+@contextmanager
+def track_request() -> Iterator[RequestTelemetry]:
+    telemetry = RequestTelemetry()
+    token = _current_telemetry.set(telemetry)
+
+    try:
+        yield telemetry
+    finally:
+        _current_telemetry.reset(token)
+
+
+def record_cache_access(hit: bool) -> None:
+    if (telemetry := _current_telemetry.get()) is None:
+        return
+
+    if hit:
+        telemetry.cache_hits += 1
+    else:
+        telemetry.cache_misses += 1
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    """
+    Add the time spent in the block to the current request's serialization time.
+
+    Only the outermost block is timed, so serializers nested in one another are not counted twice.
+    """
+    telemetry = _current_telemetry.get()
+
+    if telemetry is None or telemetry.serializing:
+        yield
+        return
+
+    telemetry.serializing = True
+    started_at = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        telemetry.serialization_time += time.perf_counter() - started_at
+        telemetry.serializing = False
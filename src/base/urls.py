@@ -5,6 +5,7 @@ from django.views.static import serve as serve_static
 from rest_framework.request import Request
 
 from base import settings
+from base.views import get_database_stats, get_metrics
 
 
 def get_swagger(request: Request) -> HttpResponse:
@@ -19,6 +20,8 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     # api urls
     path("api/", include("events.urls")),
+    path("api/metrics/", get_metrics, name="metrics"),
+    path("api/metrics/database/", get_database_stats, name="database_metrics"),
     path("api/swagger/", get_swagger, name="swagger"),
     path("api/users/", include("users.urls")),
 ]
@@ -0,0 +1,95 @@
+from typing import Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import APIException
+
+from base.databases import get_connection_stats
+from base.metrics import request_metrics
+from base.settings import INTERNAL_IPS, TRUSTED_PROXIES
+from base.utils import build_response
+
+
+class AsyncReadView(View):
+    """
+    Base class for the native async read endpoints served under ASGI.
+
+    Missing objects and DRF errors, such as the pagination classes' invalid page or cursor, are reported with the same
+    JSON body DRF produces for its sync counterparts.
+    """
+
+    http_method_names = ["get", "head"]
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except Http404 as exc:
+            return build_response(detail=str(exc), status=404)
+        except APIException as exc:
+            return build_response(detail=exc.detail, status=exc.status_code)
+
+
+def dispatch_by_method(read_view: Callable, write_view: Callable) -> Callable:
+    """
+    Serve GET and HEAD from the native async `read_view` and every other method from the sync `write_view`,
+    so a single route can mix both implementations.
+    """
+
+    async def view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if request.method in ("GET", "HEAD"):
+            return await read_view(request, *args, **kwargs)
+
+        return await sync_to_async(write_view)(request, *args, **kwargs)
+
+    return csrf_exempt(view)
+
+
+@require_GET
+def get_metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Serve the request metrics of all worker processes in the Prometheus text format, to scrapers on `INTERNAL_IPS`
+    only.
+    """
+    if not is_internal_request(request):
+        return build_response(detail="You do not have permission to perform this action.", status=403)
+
+    return HttpResponse(request_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@require_GET
+def get_database_stats(request: HttpRequest) -> JsonResponse:
+    """
+    Serve the database connection and pool statistics of the worker process handling the request, to clients on
+    `INTERNAL_IPS` only.
+    """
+    if not is_internal_request(request):
+        return build_response(detail="You do not have permission to perform this action.", status=403)
+
+    return JsonResponse(get_connection_stats())
+
+
+def is_internal_request(request: HttpRequest) -> bool:
+    return get_client_ip(request) in INTERNAL_IPS
+
+
+def get_client_ip(request: HttpRequest) -> Optional[str]:
+    """
+    The address of the client, read from `X-Forwarded-For` when the request comes through one of `TRUSTED_PROXIES`.
+
+    The header is read from the right, skipping the trusted proxies: the addresses left of the first untrusted one may
+    have been sent by the client itself.
+    """
+    address = request.META.get("REMOTE_ADDR")
+    if address not in TRUSTED_PROXIES:
+        return address
+
+    forwarded_addresses = request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+    for forwarded_address in reversed([address.strip() for address in forwarded_addresses if address.strip()]):
+        address = forwarded_address
+        if address not in TRUSTED_PROXIES:
+            break
+
+    return address
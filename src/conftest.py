@@ -1,9 +1,63 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager
+
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from base.queries import detect_n_plus_one, format_repeated_queries
+from base.settings import N_PLUS_ONE_CONFIGURATION, REPLICA_CONFIGURATION
 from users.repositories import UserRepository
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Redis outlives the test database, whose sequences restart on every run.
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def replica(request, monkeypatch):
+    """
+    Keep every read on the primary unless the test is marked with `replica`.
+
+    Tests run inside a transaction on the primary, which the mirrored replica connection cannot see. Marked tests
+    need `django_db(transaction=True, databases=["default", "replica"])` and a configured `POSTGRES_REPLICA_HOST`.
+    """
+    if request.node.get_closest_marker("replica") is None:
+        monkeypatch.setitem(REPLICA_CONFIGURATION, "ALIAS", None)
+
+
+@pytest.fixture(autouse=True)
+def no_n_plus_one(request, monkeypatch):
+    """
+    Fail tests marked with `no_n_plus_one` on N+1 queries issued while handling their requests. Queries made by the
+    test itself (e.g. factories creating rows in a loop) are not checked.
+    """
+    if (marker := request.node.get_closest_marker("no_n_plus_one")) is None:
+        return
+
+    monkeypatch.setitem(N_PLUS_ONE_CONFIGURATION, "MODE", "raise")
+    monkeypatch.setitem(N_PLUS_ONE_CONFIGURATION, "THRESHOLD", marker.kwargs.get("threshold", 3))
+
+
+@pytest.fixture
+def assert_no_n_plus_one() -> Callable[..., ContextManager[None]]:
+    """
+    Fail the test on N+1 queries issued within a block: `with assert_no_n_plus_one(): ...`.
+    """
+
+    @contextmanager
+    def check(threshold: int = 3):
+        with detect_n_plus_one(threshold) as detector:
+            yield
+
+        if repeated_queries := detector.get_repeated_queries():
+            pytest.fail(f"Repeated queries:\n{format_repeated_queries(repeated_queries)}")
+
+    return check
+
+
 @pytest.fixture()
 def api_client():
     return APIClient()
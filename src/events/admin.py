@@ -1,11 +1,15 @@
 from django.contrib import admin
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils.html import format_html, format_html_join
 from rest_framework.request import Request
 
+from base.constants import ExportFormat
+from base.exports import build_export_response
+from events.constants import EVENT_ATTENDANCE_EXPORT_FIELDS, EVENT_EXPORT_FIELDS
 from events.models import Event, EventAttendance, EventCategory
-from events.repositories import EventRepository
+from events.repositories import EventAttendanceRepository, EventRepository
 
 
 @admin.register(Event)
@@ -13,10 +17,8 @@ class EventAdmin(admin.ModelAdmin):
     change_list_template = "admin/event_list.html"
 
     def get_queryset(self, request: Request) -> QuerySet:
-        return EventRepository.get_events_with_attendees_count()
-
-    def attendees_count(self, obj: Event) -> int:
-        return obj.attendees_count
+        # The change list renders the categories through their models, not through the category registry.
+        return EventRepository.get_all().select_related("category")
 
     def creator_link(self, obj: Event) -> str:
         link = reverse("admin:users_user_change", args=[obj.creator_id])
@@ -69,11 +71,24 @@ class EventAdmin(admin.ModelAdmin):
     list_filter = ("status", "category", "location", "start_date", "end_date")
     search_fields = ("id", "name", "creator__username", "location")
     ordering = ("-created_at",)
+    readonly_fields = ("attendees_count",)
+
+    actions = ("export_events", "export_attendance")
 
-    attendees_count.admin_order_field = "attendees_count"
-    attendees_count.short_description = "Attendees count"
     creator_link.short_description = "Creator"
 
+    @admin.action(description="Export selected events as CSV")
+    def export_events(self, request: Request, queryset: QuerySet) -> StreamingHttpResponse:
+        queryset = EventRepository.get_export_queryset(queryset)
+        return build_export_response(request, queryset, EVENT_EXPORT_FIELDS, ExportFormat.CSV, "events")
+
+    @admin.action(description="Export attendance of selected events as CSV")
+    def export_attendance(self, request: Request, queryset: QuerySet) -> StreamingHttpResponse:
+        attendance = EventAttendanceRepository.get_event_attendance_export(event_ids=queryset.values("id"))
+        return build_export_response(
+            request, attendance, EVENT_ATTENDANCE_EXPORT_FIELDS, ExportFormat.CSV, "attendance"
+        )
+
 
 @admin.register(EventAttendance)
 class EventAttendanceAdmin(admin.ModelAdmin):
@@ -0,0 +1,94 @@
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from uuid import UUID
+
+from django.utils import timezone
+from rest_framework.request import Request
+
+from base.cache import VersionedCache
+from base.conditional import get_validators
+from base.routers import read_from_primary
+from base.settings import CACHE_CONFIGURATION, REDIS_CONFIGURATION
+from events.filters import EventFilter
+from events.models import Event, EventCategory
+from events.repositories import EventCategoryRepository
+
+
+class EventCategoryRegistry:
+    """
+    Every event category, held in memory by each worker process.
+
+    The registry is tagged with the generation of `versions` it was loaded at, which category writes bump. Each read
+    compares the tag with the current generation in Redis and reloads the categories on a mismatch, so a read costs a
+    single Redis GET instead of a query or a join, and a write made by any process is visible to the next read.
+
+    The categories are shared by every thread of the process and must not be modified.
+    """
+
+    def __init__(self, versions: VersionedCache) -> None:
+        self.versions = versions
+        self._categories: Mapping[UUID, EventCategory] = MappingProxyType({})
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get_categories(self) -> Mapping[UUID, EventCategory]:
+        if (version := self.versions.get_version()) == self._version:
+            return self._categories
+
+        with self._lock:
+            if version != self._version:
+                # Loaded after reading the generation: a write committed in between makes the next read reload again.
+                with read_from_primary():
+                    self._store(version, EventCategoryRepository.get_all())
+
+        return self._categories
+
+    async def aget_categories(self) -> Mapping[UUID, EventCategory]:
+        if (version := await self.versions.aget_version()) != self._version:
+            with read_from_primary():
+                self._store(version, [category async for category in EventCategoryRepository.get_all()])
+
+        return self._categories
+
+    def _store(self, version: int, categories: Iterable[EventCategory]) -> None:
+        self._categories = MappingProxyType({category.id: category for category in categories})
+        self._version = version
+
+
+# Entries of both caches are `(etag, data)` pairs, so a cached response is revalidated without any query.
+events_list_cache = VersionedCache(namespace="events_list", timeout=CACHE_CONFIGURATION["EVENTS_LIST_TIMEOUT"])
+event_categories_cache = VersionedCache(namespace="event_categories", timeout=REDIS_CONFIGURATION["TIMEOUT"])
+# Follows the generations of the categories list cache, which every category write bumps.
+event_category_registry = EventCategoryRegistry(versions=event_categories_cache)
+
+
+def get_events_list_cache_params(request: Request, pagination_params: Iterable[str]) -> Dict[str, Any]:
+    """
+    Normalize the query string down to the parameters that affect the events list payload, so equivalent requests
+    (reordered, empty or unknown params) share a single cache entry. Values are kept as sent, since the filters
+    receive them that way. Requests with a date-relative filter are keyed by the current date as well.
+    """
+    cacheable_params = set(EventFilter.base_filters) | set(pagination_params)
+    params = {
+        param: sorted(value for value in request.query_params.getlist(param) if value) for param in cacheable_params
+    }
+    params = {param: values for param, values in params.items() if values}
+    if any(param in params for param in EventFilter.date_relative_filters):
+        params.update(date=timezone.now().date().isoformat())
+
+    params.update(host=request.get_host())
+    return params
+
+
+def get_event_categories_cache_params(request: Request, page_query_param: str) -> Dict[str, Any]:
+    return {"page": request.query_params.get(page_query_param, "").strip() or "1", "host": request.get_host()}
+
+
+def get_event_validators(event: Event, categories: Mapping[UUID, EventCategory]) -> Tuple[str, datetime]:
+    """
+    The ETag and `Last-Modified` of an event, which also change with its category, looked up in `categories`.
+    """
+    category = categories.get(event.category_id) or event.category
+    return get_validators(event.pk, event.updated_at, category.updated_at)
@@ -1,6 +1,38 @@
 from base.constants import BaseConstant
 
 
+SEARCH_CONFIG = "english"
+
+NEAR_DEFAULT_RADIUS_KM = 10
+NEAR_MAX_RADIUS_KM = 500
+
+EVENT_EXPORT_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "location",
+    "capacity",
+    "attendees_count",
+    "description",
+    "start_date",
+    "end_date",
+    "created_at",
+    "creator_id",
+    "creator_email",
+    "category_id",
+    "category_name",
+)
+EVENT_ATTENDANCE_EXPORT_FIELDS = (
+    "id",
+    "event_id",
+    "user_id",
+    "user_email",
+    "user_first_name",
+    "user_last_name",
+    "timestamp",
+)
+
+
 class EventStatus(BaseConstant):
     Created = "created"
     Canceled = "canceled"
@@ -1,14 +1,169 @@
-from django_filters.rest_framework import CharFilter, DateFilter, FilterSet
+from datetime import date
+from decimal import Decimal
+from typing import Any, Optional, Tuple
 
+from django import forms
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.exceptions import ValidationError
+from django.db.backends.postgresql.psycopg_any import DateRange
+from django.db.models import F, QuerySet
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from django_filters.rest_framework import (
+    BooleanFilter,
+    CharFilter,
+    ChoiceFilter,
+    DateFilter,
+    Filter,
+    FilterSet,
+    NumberFilter,
+)
+
+from base.geo import CubeContains, CubeDistance, EarthBox, EarthDistance, LLToEarth
+from base.ranges import DateSpan
+from events.constants import NEAR_DEFAULT_RADIUS_KM, NEAR_MAX_RADIUS_KM, SEARCH_CONFIG, EventStatus
 from events.models import Event
 
 
+class CoordinatesField(forms.Field):
+    default_error_messages = {
+        "invalid": _("Enter coordinates as `latitude,longitude` in decimal degrees."),
+    }
+
+    def to_python(self, value: Any) -> Optional[Tuple[float, float]]:
+        if value in self.empty_values:
+            return None
+
+        try:
+            latitude, longitude = (float(part) for part in str(value).split(","))
+        except ValueError:
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+
+        # Also rejects `nan`, which compares false with everything.
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+
+        return latitude, longitude
+
+
+class CoordinatesFilter(Filter):
+    field_class = CoordinatesField
+
+
+class DateSpanField(forms.Field):
+    default_error_messages = {
+        "invalid": _("Enter the first and last day as `YYYY-MM-DD,YYYY-MM-DD`, the first not after the last."),
+    }
+
+    def to_python(self, value: Any) -> Optional[Tuple[date, date]]:
+        if value in self.empty_values:
+            return None
+
+        try:
+            first_day, last_day = (date.fromisoformat(part.strip()) for part in str(value).split(","))
+        except ValueError:
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+
+        if first_day > last_day:
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+
+        return first_day, last_day
+
+
+class DateSpanFilter(Filter):
+    field_class = DateSpanField
+
+
 class EventFilter(FilterSet):
     category = CharFilter(field_name="category__id")
     creator = CharFilter(field_name="creator__id")
     location = CharFilter(field_name="location", lookup_expr="icontains")
     start_date_gte = DateFilter(field_name="start_date", lookup_expr="gte")
+    start_date_lte = DateFilter(field_name="start_date", lookup_expr="lte")
+    end_date_gte = DateFilter(field_name="end_date", lookup_expr="gte")
+    end_date_lte = DateFilter(field_name="end_date", lookup_expr="lte")
+    during = DateSpanFilter(method="filter_during")
+    ongoing_on = DateFilter(method="filter_ongoing_on")
+    status = ChoiceFilter(choices=EventStatus.choices())
+    upcoming = BooleanFilter(method="filter_upcoming")
+    search = CharFilter(method="filter_search")
+    # Declared after `search`, so events near the given point come nearest first even when searched for.
+    near = CoordinatesFilter(method="filter_near")
+    radius_km = NumberFilter(method="filter_radius_km", min_value=0, max_value=NEAR_MAX_RADIUS_KM)
+
+    # Filters compared with the current date, whose results change from one day to the next.
+    date_relative_filters = ("upcoming",)
 
     class Meta:
         model = Event
-        fields = ("creator", "category", "location", "start_date_gte")
+        fields = (
+            "creator",
+            "category",
+            "location",
+            "start_date_gte",
+            "start_date_lte",
+            "end_date_gte",
+            "end_date_lte",
+            "during",
+            "ongoing_on",
+            "status",
+            "upcoming",
+            "search",
+            "near",
+            "radius_km",
+        )
+
+    @staticmethod
+    def filter_during(queryset: QuerySet, name: str, value: Tuple[date, date]) -> QuerySet:
+        """
+        Keep the events running on at least one day from the first to the last day of `value`, both included.
+        """
+        return queryset.alias(date_span=DateSpan("start_date", "end_date")).filter(
+            date_span__overlap=DateRange(*value, bounds="[]")
+        )
+
+    @staticmethod
+    def filter_ongoing_on(queryset: QuerySet, name: str, value: date) -> QuerySet:
+        return queryset.alias(date_span=DateSpan("start_date", "end_date")).filter(date_span__contains=value)
+
+    @staticmethod
+    def filter_upcoming(queryset: QuerySet, name: str, value: bool) -> QuerySet:
+        # Events that are still going ahead as planned and haven't started yet; `upcoming=false` filters nothing.
+        if not value:
+            return queryset
+
+        return queryset.filter(status=EventStatus.Created, start_date__gte=timezone.now().date())
+
+    @staticmethod
+    def filter_search(queryset: QuerySet, name: str, value: str) -> QuerySet:
+        query = SearchQuery(value, search_type="websearch", config=SEARCH_CONFIG)
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-created_at", "-id")
+        )
+
+    def filter_near(self, queryset: QuerySet, name: str, value: Tuple[float, float]) -> QuerySet:
+        """
+        Keep the events within `radius_km` of the `latitude,longitude` in `value`, nearest first.
+
+        The bounding box and the nearest-first ordering are both served by the GiST index on the events' location,
+        the exact distance is only computed for the rows inside the box.
+        """
+        radius_km: Optional[Decimal] = self.form.cleaned_data.get("radius_km")
+        radius_m = float(NEAR_DEFAULT_RADIUS_KM if radius_km is None else radius_km) * 1000
+        origin = LLToEarth.from_coordinates(*value)
+        location = F("earth_location")
+
+        return (
+            queryset.filter(earth_location__isnull=False)
+            .filter(CubeContains(EarthBox(origin, radius_m), location))
+            .alias(distance=EarthDistance(origin, location))
+            .filter(distance__lte=radius_m)
+            .order_by(CubeDistance(location, origin), "-created_at", "-id")
+        )
+
+    @staticmethod
+    def filter_radius_km(queryset: QuerySet, name: str, value: Decimal) -> QuerySet:
+        # Only read by `filter_near`: a radius without a point to measure it from filters nothing.
+        return queryset
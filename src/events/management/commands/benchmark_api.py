@@ -0,0 +1,222 @@
+import json
+from datetime import timedelta
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models import F
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from base.benchmarks import find_regressions, format_latency, measure_latency, measure_peak_memory
+from base.queries import count_queries
+from events.caches import events_list_cache
+from events.management.commands.seed_events import Command as SeedEventsCommand
+from events.models import Event, EventAttendance, EventCategory
+from users.models import User, UserProfile
+from users.repositories import UserRepository
+
+
+Benchmark = Tuple[Callable[[], HttpResponse], Optional[Callable[[], Any]]]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the API hot paths through the full request stack: latency, queries per request and peak memory. "
+        "Seed a dataset first, e.g. `manage.py seed_events --events 100000 --users 1000 --attendances 100000 "
+        "--saved-events 100000`, then compare runs with `--output` and `--baseline`."
+    )
+
+    admin_email = "benchmark-admin@eventfor.us"
+    filter_values = {"location": "york", "search": "jazz"}
+    bulk_name_prefix = "Bulk benchmark #"
+    bulk_rows_count = 1000
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--repeat", type=int, default=20, help="Number of measured requests per benchmark.")
+        parser.add_argument("--output", help="Path of the JSON file the results are written to.")
+        parser.add_argument("--baseline", help="Path of a previous `--output` file to compare the results with.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Relative increase of median latency or peak memory over the baseline that fails the run. "
+            "Any increase in the number of queries fails it as well.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not Event.objects.exists():
+            raise CommandError("There are no events to benchmark against, run `manage.py seed_events` first.")
+
+        # Built first, since it creates the benchmark admin on the first run.
+        benchmarks = self.build_benchmarks()
+        dataset = self.describe_dataset()
+        self.stdout.write("Benchmarking against " + ", ".join(f"{count} {name}" for name, count in dataset.items()))
+
+        # The test client always sends `Host: testserver`.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results = {
+                name: self.run_benchmark(name, request, setup, options["repeat"])
+                for name, (request, setup) in benchmarks.items()
+            }
+
+        report = {"dataset": dataset, "results": results}
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2)
+
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options["baseline"]:
+            self.compare_with_baseline(report, options["baseline"], options["threshold"])
+
+    def run_benchmark(
+        self,
+        name: str,
+        request: Callable[[], HttpResponse],
+        setup: Optional[Callable[[], Any]],
+        repeat: int,
+    ) -> Dict[str, float]:
+        result = measure_latency(request, repeat=repeat, setup=setup)
+
+        if setup is not None:
+            setup()
+
+        with count_queries() as queries:
+            response = request()
+
+        if setup is not None:
+            setup()
+
+        result.update(
+            queries=queries.count,
+            peak_memory_kb=measure_peak_memory(request),
+            status=response.status_code,
+        )
+
+        line = format_latency(name, result)
+        self.stdout.write(self.style.ERROR(line) if response.status_code >= 400 else line)
+        return result
+
+    def build_benchmarks(self) -> Dict[str, Benchmark]:
+        user = User.objects.filter(email__startswith="benchmark+").order_by("email").first()
+        user = user or SeedEventsCommand.get_or_create_creator()
+        event = Event.objects.order_by("-created_at").first()
+        open_event = Event.objects.filter(start_date__gt=timezone.now(), capacity__gt=F("attendees_count")).first()
+        open_event = open_event or event
+
+        anonymous_client = Client()
+        user_client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        admin_client = Client()
+        admin_client.force_login(self.get_or_create_admin())
+        category_id = str(EventCategory.objects.values_list("id", flat=True).first())
+
+        # The rows uploaded by a previous run are deleted before the dataset is described.
+        self.delete_bulk_events()
+        bulk_rows = self.build_bulk_rows(category_id)
+
+        filter_values = {
+            "category": category_id,
+            "creator": str(event.creator_id),
+            "start_date_gte": timezone.now().date().isoformat(),
+            **self.filter_values,
+        }
+        events_list_url = reverse("event-list")
+        benchmarks: Dict[str, Benchmark] = {}
+
+        # Every combination of the list filters, each against the database: the list cache is invalidated first.
+        for size in range(len(filter_values) + 1):
+            for filters in combinations(filter_values, size):
+                params = {name: filter_values[name] for name in filters}
+                benchmarks[f"event list {'&'.join(filters) or '(no filters)'}"] = (
+                    lambda params=params: anonymous_client.get(events_list_url, params),
+                    events_list_cache.bump_version,
+                )
+
+        benchmarks.update(
+            {
+                "event list (cached)": (lambda: anonymous_client.get(events_list_url), None),
+                "event retrieve": (lambda: anonymous_client.get(reverse("event-detail", args=[event.id])), None),
+                "event attend": (lambda: user_client.post(reverse("event-attend", args=[open_event.id])), None),
+                "event toggle_save": (lambda: user_client.post(reverse("event-toggle-save", args=[event.id])), None),
+                f"event bulk create ({len(bulk_rows)} rows)": (
+                    lambda: user_client.post(reverse("event-bulk-create"), bulk_rows, content_type="application/json"),
+                    self.delete_bulk_events,
+                ),
+                "user saved events": (
+                    lambda: user_client.get(reverse("user_saved_events", args=[user.id])),
+                    None,
+                ),
+                "signin": (
+                    lambda: anonymous_client.post(
+                        reverse("signin"), {"email": user.email, "password": SeedEventsCommand.password}
+                    ),
+                    None,
+                ),
+                "admin event changelist": (
+                    lambda: admin_client.get(reverse("admin:events_event_changelist")),
+                    None,
+                ),
+            }
+        )
+        return benchmarks
+
+    def compare_with_baseline(self, report: Dict[str, Any], baseline_path: str, threshold: float) -> None:
+        with open(baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        if baseline["dataset"] != report["dataset"]:
+            message = f"The baseline was measured on another dataset: {baseline['dataset']}"
+            self.stdout.write(self.style.WARNING(message))
+
+        regressions = find_regressions(
+            report["results"],
+            baseline["results"],
+            thresholds={"p50_ms": threshold, "peak_memory_kb": threshold, "queries": 0},
+        )
+
+        if regressions:
+            raise CommandError("Regressions over the baseline:\n" + "\n".join(regressions))
+
+        self.stdout.write(self.style.SUCCESS(f"No regressions over {baseline_path}."))
+
+    def build_bulk_rows(self, category_id: str) -> List[Dict[str, Any]]:
+        start_date = timezone.now().date() + timedelta(days=30)
+        return [
+            {
+                "category": category_id,
+                "name": f"{self.bulk_name_prefix}{index}",
+                "location": "Main hall",
+                "capacity": 100,
+                "description": "Uploaded by `benchmark_api`",
+                "start_date": start_date.isoformat(),
+                "end_date": (start_date + timedelta(days=1)).isoformat(),
+            }
+            for index in range(self.bulk_rows_count)
+        ]
+
+    def delete_bulk_events(self) -> None:
+        Event.objects.filter(name__startswith=self.bulk_name_prefix).delete()
+
+    @staticmethod
+    def describe_dataset() -> Dict[str, int]:
+        return {
+            "events": Event.objects.count(),
+            "users": User.objects.count(),
+            "attendances": EventAttendance.objects.count(),
+            "saved events": UserProfile.saved_events.through.objects.count(),
+        }
+
+    @classmethod
+    def get_or_create_admin(cls) -> User:
+        if admin := User.objects.filter(email=cls.admin_email).first():
+            return admin
+
+        return UserRepository.create_superuser(
+            email=cls.admin_email, first_name="Bench", last_name="Admin", password=SeedEventsCommand.password
+        )
@@ -0,0 +1,83 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import close_old_connections, connections
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from base.benchmarks import format_latency, measure_latency
+from base.databases import get_connection_stats
+from events.caches import events_list_cache
+from events.models import Event
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure request latency when every request opens its own database connection, with persistent connections "
+        "and, when POSTGRES_POOL is enabled, with the connection pool."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--repeat", type=int, default=200, help="Number of measured requests per scenario.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not (event := Event.objects.order_by("-created_at").first()):
+            raise CommandError("There are no events to benchmark against, run `manage.py seed_events` first.")
+
+        client = Client()
+        requests: Dict[str, Tuple[Callable[[], HttpResponse], Optional[Callable[[], Any]]]] = {
+            "event retrieve": (lambda: client.get(reverse("event-detail", args=[event.id])), None),
+            "event list": (lambda: client.get(reverse("event-list")), events_list_cache.bump_version),
+        }
+        original_settings = {alias: connections[alias].settings_dict.copy() for alias in connections}
+
+        if any(settings_dict["OPTIONS"].get("pool") for settings_dict in original_settings.values()):
+            scenarios = {"pooled": {}}
+        else:
+            scenarios = {
+                "new connection per request": {"CONN_MAX_AGE": 0},
+                "persistent": {"CONN_MAX_AGE": None, "CONN_HEALTH_CHECKS": False},
+                "persistent, health checks": {"CONN_MAX_AGE": None, "CONN_HEALTH_CHECKS": True},
+            }
+
+        # The test client always sends `Host: testserver`.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            try:
+                for scenario, overrides in scenarios.items():
+                    self.configure_connections(overrides)
+
+                    for name, (request, setup) in requests.items():
+                        latency = measure_latency(self.as_served(request), repeat=options["repeat"], setup=setup)
+                        self.stdout.write(format_latency(f"{name}, {scenario}", latency))
+
+                    opened = {
+                        alias: stats["connections_opened"]
+                        for alias, stats in get_connection_stats()["databases"].items()
+                    }
+                    self.stdout.write(f"Connections opened so far: {opened}")
+            finally:
+                for alias, settings_dict in original_settings.items():
+                    connections[alias].close()
+                    connections[alias].settings_dict.update(settings_dict)
+
+    @staticmethod
+    def as_served(request: Callable[[], HttpResponse]) -> Callable[[], HttpResponse]:
+        # The test client disconnects `close_old_connections` from the request signals, which is what closes expired
+        # connections (or returns pooled ones) around every request in production.
+        def served_request() -> HttpResponse:
+            close_old_connections()
+            try:
+                return request()
+            finally:
+                close_old_connections()
+
+        return served_request
+
+    @staticmethod
+    def configure_connections(overrides: Dict[str, Any]) -> None:
+        # Persistence and health checks are read when a connection opens, so the current ones are closed first.
+        for alias in connections:
+            connections[alias].close()
+            connections[alias].settings_dict.update(overrides)
@@ -0,0 +1,74 @@
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+
+from base.benchmarks import format_latency, measure_latency
+from base.settings import REST_FRAMEWORK
+from events.filters import EventFilter
+from events.repositories import EventRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the latency of `near` radius queries with and without the GiST location index. "
+        "Seed a large dataset first, e.g. `manage.py seed_events --events 1000000`."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--near", default="40.7128,-74.006", help="The `latitude,longitude` to search around.")
+        parser.add_argument(
+            "--radius-km",
+            type=float,
+            nargs="+",
+            default=[1, 5, 10, 25],
+            help="Radii to benchmark, in kilometres.",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Number of measured runs per query.")
+        parser.add_argument(
+            "--no-index-repeat",
+            type=int,
+            default=3,
+            help="Number of measured runs per query without the index, which scan the whole table.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        events = EventRepository.get_all()
+        located = events.filter(latitude__isnull=False).count()
+        self.stdout.write(f"Benchmarking against {events.count()} events, {located} of them with coordinates")
+
+        for radius_km in options["radius_km"]:
+            filterset = EventFilter({"near": options["near"], "radius_km": radius_km}, queryset=events)
+            if not filterset.is_valid():
+                raise CommandError(filterset.errors.as_text())
+
+            queryset = filterset.qs
+            matches = queryset.count()
+
+            self.stdout.write(f"Within {radius_km:g} km: {matches} matches")
+
+            # What the list endpoint runs: the nearest page, and the count for page-number pagination.
+            queries = {
+                "nearest page": lambda queryset=queryset: list(queryset[: REST_FRAMEWORK["PAGE_SIZE"]]),
+                "count": queryset.count,
+            }
+
+            for query_name, query in queries.items():
+                for use_index in (False, True):
+                    name = f"  {query_name} ({'GiST' if use_index else 'no index'})"
+                    repeat = options["repeat"] if use_index else options["no_index_repeat"]
+                    latency = measure_latency(self.build_query(query, use_index), repeat=repeat, warmup=1)
+                    self.stdout.write(format_latency(name, latency))
+
+    @staticmethod
+    def build_query(query: Callable[[], Any], use_index: bool) -> Callable[[], None]:
+        def run_query() -> None:
+            with transaction.atomic():
+                if not use_index:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL enable_indexscan = off")
+                        cursor.execute("SET LOCAL enable_bitmapscan = off")
+
+                query()
+
+        return run_query
@@ -0,0 +1,77 @@
+import logging
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from base.benchmarks import format_latency, measure_latency
+from base.loggers import JSONFormatter, QueueListenerHandler
+from base.middlewares import RequestLoggingMiddleware, request_logger
+from base.settings import LOGGER_CONFIGURATION
+
+
+class Command(BaseCommand):
+    help = "Measure the per-request overhead of RequestLoggingMiddleware with synchronous and queued file logging."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=1000, help="Number of requests per measured run.")
+        parser.add_argument("--repeat", type=int, default=20, help="Number of measured runs per scenario.")
+        parser.add_argument("--sample-rate", type=float, default=0.1, help="Sample rate of the sampled scenario.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        request = RequestFactory().get("/api/events/")
+        original_handlers, original_sample_rate = (
+            request_logger.handlers[:],
+            LOGGER_CONFIGURATION["REQUEST_SAMPLE_RATE"],
+        )
+        request_logger.propagate, request_logger.level = False, logging.INFO
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            scenarios: Dict[str, Optional[logging.Handler]] = {
+                "no logging middleware": None,
+                "synchronous FileHandler": self.build_file_handler(log_dir, "sync.log"),
+                "queued FileHandler": self.build_queue_handler(log_dir, "queued.log"),
+                f"queued FileHandler, {options['sample_rate']:.0%} sampled": self.build_queue_handler(
+                    log_dir, "sampled.log"
+                ),
+            }
+
+            try:
+                for name, handler in scenarios.items():
+                    request_logger.handlers = [handler] if handler else []
+                    LOGGER_CONFIGURATION["REQUEST_SAMPLE_RATE"] = options["sample_rate"] if "sampled" in name else 1.0
+                    view = RequestLoggingMiddleware(self.get_response) if handler else self.get_response
+                    latency = measure_latency(self.run_requests(view, request, options["requests"]), options["repeat"])
+                    per_request = {key: value * 1000 / options["requests"] for key, value in latency.items()}
+                    self.stdout.write(format_latency(name, per_request).replace("_ms", "_us"))
+
+                    if isinstance(handler, QueueListenerHandler):
+                        handler.stop_listener()
+            finally:
+                request_logger.handlers = original_handlers
+                LOGGER_CONFIGURATION["REQUEST_SAMPLE_RATE"] = original_sample_rate
+
+    @staticmethod
+    def get_response(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(status=200)
+
+    @staticmethod
+    def run_requests(view: Callable, request: HttpRequest, count: int) -> Callable[[], None]:
+        def run() -> None:
+            for _ in range(count):
+                view(request)
+
+        return run
+
+    @staticmethod
+    def build_file_handler(log_dir: str, filename: str) -> logging.Handler:
+        handler = logging.FileHandler(os.path.join(log_dir, filename))
+        handler.setFormatter(JSONFormatter())
+        return handler
+
+    @classmethod
+    def build_queue_handler(cls, log_dir: str, filename: str) -> logging.Handler:
+        return QueueListenerHandler(handlers=[cls.build_file_handler(log_dir, filename)], queue_size=1_000_000)
@@ -0,0 +1,58 @@
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+
+from base.benchmarks import format_latency, measure_latency
+from base.settings import REST_FRAMEWORK
+from events.filters import EventFilter
+from events.repositories import EventRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare event search latency with and without the full-text and trigram GIN indexes. "
+        "Seed a large dataset first, e.g. `manage.py seed_events --events 1000000`."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--term", default="jazz", help="Search term used for the full-text comparison.")
+        parser.add_argument("--location", default="york", help="Location fragment used for the trigram comparison.")
+        parser.add_argument("--repeat", type=int, default=20, help="Number of measured runs per query.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        term, location, repeat = options["term"], options["location"], options["repeat"]
+        events = EventRepository.get_all()
+
+        benchmarks = {
+            f"location icontains {location!r} (no index)": (events.filter(location__icontains=location), False),
+            f"location icontains {location!r} (trigram)": (events.filter(location__icontains=location), True),
+            f"icontains over name/description/location {term!r}": (
+                events.filter(Q(name__icontains=term) | Q(description__icontains=term) | Q(location__icontains=term)),
+                False,
+            ),
+            f"full-text search {term!r}": (EventFilter.filter_search(events, "search", term), True),
+        }
+
+        self.stdout.write(f"Benchmarking against {EventRepository.get_all().count()} events")
+
+        for name, (queryset, use_indexes) in benchmarks.items():
+            latency = measure_latency(self.build_page_query(queryset, use_indexes), repeat=repeat)
+            self.stdout.write(format_latency(name, latency))
+
+    @staticmethod
+    def build_page_query(queryset: QuerySet, use_indexes: bool) -> Callable[[], None]:
+        if not queryset.query.order_by:
+            queryset = queryset.order_by("-created_at", "-id")
+
+        def run_page_query() -> None:
+            with transaction.atomic():
+                if not use_indexes:
+                    # GIN indexes are only reachable through bitmap scans.
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL enable_bitmapscan = off")
+
+                list(queryset[: REST_FRAMEWORK["PAGE_SIZE"]])
+
+        return run_page_query
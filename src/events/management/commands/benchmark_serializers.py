@@ -0,0 +1,39 @@
+import time
+from typing import Any, List, Type
+
+from django.core.management.base import BaseCommand, CommandParser
+from rest_framework.serializers import BaseSerializer
+
+from events.models import Event
+from events.repositories import EventRepository
+from events.serializers import EventReadSerializer, EventSerializer
+
+
+class Command(BaseCommand):
+    help = "Compare event serialization throughput of EventSerializer and EventReadSerializer."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=100, help="Number of events serialized per run.")
+        parser.add_argument("--repeat", type=int, default=50, help="Number of measured runs per serializer.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        events = list(EventRepository.get_all().order_by("-created_at")[: options["rows"]])
+
+        if not events:
+            self.stderr.write("No events to serialize, run `manage.py seed_events` first.")
+            return
+
+        for serializer_class in (EventSerializer, EventReadSerializer):
+            rows_per_second = self.measure(serializer_class, events, options["repeat"])
+            self.stdout.write(f"{serializer_class.__name__:<24} {rows_per_second:>12,.0f} rows/s")
+
+    @staticmethod
+    def measure(serializer_class: Type[BaseSerializer], events: List[Event], repeat: int) -> float:
+        serializer_class(events, many=True).data
+
+        started_at = time.perf_counter()
+
+        for _ in range(repeat):
+            serializer_class(events, many=True).data
+
+        return len(events) * repeat / (time.perf_counter() - started_at)
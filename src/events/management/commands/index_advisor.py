@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DatabaseError, models
+
+from base.index_advisor import IndexProposal, explain, find_issues, load_tables, measure_proposals
+from base.query_shapes import EXPLAINABLE_STATEMENTS, QueryShapeSummary, query_shape_statistics
+
+
+SHAPE_PREVIEW_LENGTH = 200
+
+
+class Command(BaseCommand):
+    help = (
+        "Explain the query shapes that took the most time, recorded with `QUERY_SHAPES_RECORD=True`, point out their "
+        "sequential scans and sorts on large tables and propose the indexes that would avoid them."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--top", type=int, default=20, help="Number of shapes to explain, by total time.")
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=10000,
+            help="Only report scans of tables with at least this many rows and sorts of as many rows.",
+        )
+        parser.add_argument(
+            "--measure",
+            action="store_true",
+            help=(
+                "Build each proposed index in a rolled-back transaction to compare plan costs. Building an index "
+                "blocks writes to its table, so only use this on a copy of the production data."
+            ),
+        )
+        parser.add_argument("--reset", action="store_true", help="Delete the recorded shapes afterwards.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        summaries = query_shape_statistics.collect()
+        if not summaries:
+            raise CommandError("No query shapes recorded yet. Set QUERY_SHAPES_RECORD=True and serve some traffic.")
+
+        top_summaries = summaries[: options["top"]]
+        total_duration = sum(summary.duration for summary in summaries)
+        self.stdout.write(
+            f"{len(summaries)} query shapes recorded, {total_duration * 1000:.1f} ms in total. "
+            f"Explaining the top {len(top_summaries)}."
+        )
+
+        tables = load_tables()
+        # Estimated milliseconds of recorded time each proposal could save, and the shapes it helps.
+        benefits: Dict[IndexProposal, float] = {}
+        helped_shapes: Dict[IndexProposal, List[Tuple[QueryShapeSummary, float]]] = {}
+
+        for rank, summary in enumerate(top_summaries, start=1):
+            self.stdout.write("")
+            self.stdout.write(
+                f"#{rank} {summary.count} calls, {summary.duration * 1000:.1f} ms total, "
+                f"{summary.duration * 1000 / max(summary.count, 1):.2f} ms average"
+            )
+            self.stdout.write(f"  {self.preview(summary.shape)}")
+
+            if summary.sample is None or not summary.sample.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS):
+                self.stdout.write("  Not explained: no sample kept, or not a query.")
+                continue
+
+            try:
+                plan = explain(summary.sample)
+            except DatabaseError as error:
+                self.stdout.write(self.style.WARNING(f"  Could not be explained: {error}".strip()))
+                continue
+
+            findings = find_issues(plan, tables, options["min_rows"])
+            if not findings:
+                self.stdout.write(self.style.SUCCESS("  No sequential scans or sorts of large tables."))
+
+            for finding in findings:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  {finding.node_type} on {finding.table} (~{finding.table_rows} rows), "
+                        f"{finding.cost_share:.0%} of the plan's cost: {finding.detail or '-'}"
+                    )
+                )
+
+                if finding.proposal is None:
+                    self.stdout.write(f"    {finding.note}")
+                    continue
+
+                benefits[finding.proposal] = (
+                    benefits.get(finding.proposal, 0.0) + finding.cost_share * summary.duration * 1000
+                )
+                helped_shapes.setdefault(finding.proposal, []).append((summary, finding.cost_share))
+                self.stdout.write(f"    Proposed: {finding.proposal.build_sql()}")
+
+        if not benefits:
+            self.stdout.write("")
+            self.stdout.write(self.style.SUCCESS("No indexes to propose."))
+        else:
+            self.write_proposals(benefits, helped_shapes, options["measure"])
+
+        if options["reset"]:
+            query_shape_statistics.reset()
+
+    def write_proposals(
+        self,
+        benefits: Dict[IndexProposal, float],
+        helped_shapes: Dict[IndexProposal, List[Tuple[QueryShapeSummary, float]]],
+        measure: bool,
+    ) -> None:
+        self.stdout.write("")
+        self.stdout.write("Proposed indexes, by estimated benefit:")
+
+        if measure:
+            benefits = {proposal: self.measure_benefit(proposal, helped_shapes[proposal]) for proposal in benefits}
+
+        for proposal, benefit in sorted(benefits.items(), key=lambda item: item[1], reverse=True):
+            shapes_count = len(helped_shapes[proposal])
+            estimate = "measured" if measure else "at most"
+            self.stdout.write("")
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{proposal.table} ({', '.join(proposal.columns)}): {estimate} {benefit:.1f} ms of the recorded "
+                    f"time, across {shapes_count} shape{'s' if shapes_count > 1 else ''}"
+                )
+            )
+
+            if (index := proposal.build_index()) is not None:
+                self.stdout.write(f"  In {proposal.model.__name__}.Meta.indexes: {self.format_index(index)}")
+            self.stdout.write(f"  {proposal.build_sql()};")
+
+    def measure_benefit(self, proposal: IndexProposal, shapes: List[Tuple[QueryShapeSummary, float]]) -> float:
+        """
+        The recorded time of `shapes` scaled by how much the index lowers their plan costs.
+        """
+        benefit = 0.0
+
+        for summary, _ in shapes:
+            before, after = measure_proposals(summary.sample, [proposal])
+            self.stdout.write(
+                f"  Measured {proposal.table} ({', '.join(proposal.columns)}): plan cost {before:.0f} -> {after:.0f}"
+            )
+            if before:
+                benefit += max(before - after, 0.0) / before * summary.duration * 1000
+
+        return benefit
+
+    @staticmethod
+    def format_index(index: models.Index) -> str:
+        fields = ", ".join(f'"{field}"' for field in index.fields)
+        return f'models.Index(fields=[{fields}], name="{index.name}")'
+
+    @staticmethod
+    def preview(shape: str) -> str:
+        return shape if len(shape) <= SHAPE_PREVIEW_LENGTH else f"{shape[:SHAPE_PREVIEW_LENGTH]}..."
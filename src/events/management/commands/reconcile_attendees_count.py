@@ -0,0 +1,16 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from events.repositories import EventRepository
+
+
+class Command(BaseCommand):
+    help = "Repair drift between Event.attendees_count and the actual attendance rows."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of events checked per transaction.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        repaired = EventRepository.reconcile_attendees_count(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Repaired attendees count for {repaired} event(s)."))
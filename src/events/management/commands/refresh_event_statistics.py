@@ -0,0 +1,20 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from events.repositories import EventStatisticsRepository
+
+
+class Command(BaseCommand):
+    help = "Incrementally refresh the admin statistics rollup tables from the stored high-water mark."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recompute every month instead of the months since the high-water mark.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        high_water_mark = EventStatisticsRepository.refresh_rollups(rebuild=options["rebuild"])
+        self.stdout.write(self.style.SUCCESS(f"Event statistics refreshed up to {high_water_mark.isoformat()}."))
@@ -0,0 +1,191 @@
+import random
+from datetime import timedelta
+from typing import Any, Callable, List, Type
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Model
+from django.utils import timezone
+
+from events.caches import events_list_cache
+from events.constants import EventStatus
+from events.models import Event, EventAttendance, EventCategory
+from events.repositories import EventRepository
+from users.caches import saved_events_cache
+from users.models import User, UserProfile
+from users.repositories import UserRepository
+
+
+WORDS = (
+    "annual art book charity chess city coding community conference cooking dance design film food garden hackathon "
+    "history jazz marathon market meetup music night open photo poetry python rock science startup summit tech "
+    "theatre wine workshop yoga"
+).split()
+# Location -> (latitude, longitude) of its centre, around which the events are scattered.
+LOCATIONS = {
+    "Amsterdam, Netherlands": (52.3676, 4.9041),
+    "Berlin, Germany": (52.52, 13.405),
+    "Chicago, USA": (41.8781, -87.6298),
+    "Kyiv, Ukraine": (50.4501, 30.5234),
+    "Lisbon, Portugal": (38.7223, -9.1393),
+    "London, UK": (51.5074, -0.1278),
+    "New York, USA": (40.7128, -74.006),
+    "Paris, France": (48.8566, 2.3522),
+    "Tokyo, Japan": (35.6762, 139.6503),
+    "Toronto, Canada": (43.6532, -79.3832),
+}
+# Standard deviation of the scatter in degrees, roughly 20 km.
+LOCATION_SCATTER = 0.2
+
+CATEGORIES = ("Conference", "Concert", "Meetup", "Networking", "Sports", "Workshop")
+
+
+class Command(BaseCommand):
+    help = "Seed the database with synthetic events, users, attendances and saved events for benchmarking."
+
+    password = "benchmark"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--events", type=int, default=10_000, help="Number of events to create.")
+        parser.add_argument("--users", type=int, default=0, help="Number of users (with profiles) to create.")
+        parser.add_argument(
+            "--attendances",
+            type=int,
+            default=0,
+            help="Number of attendances to create between random seeded users and events (duplicates are skipped).",
+        )
+        parser.add_argument(
+            "--saved-events",
+            type=int,
+            default=0,
+            help="Number of saved events to create between random seeded users and events (duplicates are skipped).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5_000, help="Number of rows per INSERT.")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible datasets.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rng = random.Random(options["seed"])
+        creator = self.get_or_create_creator()
+        categories = [EventCategory.objects.get_or_create(name=name)[0] for name in CATEGORIES]
+
+        created, total = 0, options["events"]
+
+        while created < total:
+            batch_size = min(options["batch_size"], total - created)
+            Event.objects.bulk_create(self.build_events(rng, batch_size, creator, categories))
+            created += batch_size
+            self.stdout.write(f"Created {created}/{total} events")
+
+        # bulk_create bypasses the post_save signal that invalidates cached list pages.
+        events_list_cache.bump_version()
+        self.stdout.write(self.style.SUCCESS(f"Seeded {total} event(s)."))
+
+        if options["users"]:
+            self.seed_users(options["users"], options["batch_size"])
+
+        if options["attendances"] or options["saved_events"]:
+            user_ids = list(User.objects.filter(email__startswith="benchmark+").values_list("id", flat=True))
+            event_ids = list(Event.objects.values_list("id", flat=True))
+
+            if not user_ids or not event_ids:
+                self.stdout.write(self.style.WARNING("Attendances and saved events need seeded users and events."))
+                return
+
+            self.seed_pairs(
+                EventAttendance,
+                options["attendances"],
+                options["batch_size"],
+                lambda: EventAttendance(user_id=rng.choice(user_ids), event_id=rng.choice(event_ids)),
+            )
+            # `bulk_create` skips `toggle_attendance`, so the denormalized counters are brought in line afterwards.
+            EventRepository.reconcile_attendees_count(batch_size=options["batch_size"])
+
+            profile_ids = list(UserProfile.objects.filter(user_id__in=user_ids).values_list("id", flat=True))
+            self.seed_pairs(
+                UserProfile.saved_events.through,
+                options["saved_events"],
+                options["batch_size"],
+                lambda: UserProfile.saved_events.through(
+                    userprofile_id=rng.choice(profile_ids), event_id=rng.choice(event_ids)
+                ),
+            )
+            # No `m2m_changed` either: drop the cached sets so they are reloaded with the seeded rows.
+            for profile_id in profile_ids:
+                saved_events_cache.delete(profile_id)
+
+    @classmethod
+    def get_or_create_creator(cls) -> User:
+        email = "benchmark@eventfor.us"
+
+        if user := User.objects.filter(email=email).first():
+            return user
+
+        return UserRepository.create_user(email=email, first_name="Bench", last_name="Mark", password=cls.password)
+
+    def seed_users(self, total: int, batch_size: int) -> None:
+        # Hashing once keeps seeding fast; every seeded user can still sign in with the same password.
+        password = make_password(self.password)
+        offset = User.objects.filter(email__startswith="benchmark+").count()
+        created = 0
+
+        while created < total:
+            count = min(batch_size, total - created)
+            users = [
+                User(
+                    email=f"benchmark+{offset + created + index}@eventfor.us",
+                    first_name="Bench",
+                    last_name=f"Mark {offset + created + index}",
+                    password=password,
+                )
+                for index in range(count)
+            ]
+            User.objects.bulk_create(users)
+            UserProfile.objects.bulk_create(UserProfile(user=user) for user in users)
+            created += count
+            self.stdout.write(f"Created {created}/{total} users")
+
+        self.stdout.write(self.style.SUCCESS(f"Seeded {total} user(s)."))
+
+    def seed_pairs(self, model: Type[Model], total: int, batch_size: int, build_row: Callable[[], Model]) -> None:
+        label, created = model._meta.verbose_name_plural, 0
+
+        while created < total:
+            count = min(batch_size, total - created)
+            # Random pairs can repeat, and the unique constraints turn repeats into skipped rows.
+            model.objects.bulk_create([build_row() for _ in range(count)], ignore_conflicts=True)
+            created += count
+            self.stdout.write(f"Created up to {created}/{total} {label}")
+
+        self.stdout.write(self.style.SUCCESS(f"Seeded up to {total} {label}."))
+
+    @staticmethod
+    def build_events(
+        rng: random.Random,
+        count: int,
+        creator: User,
+        categories: List[EventCategory],
+    ) -> List[Event]:
+        today = timezone.now().date()
+        locations = list(LOCATIONS.items())
+        events = []
+
+        for _ in range(count):
+            start_date = today + timedelta(days=rng.randint(-365, 365))
+            location, (latitude, longitude) = rng.choice(locations)
+            events.append(
+                Event(
+                    creator=creator,
+                    category=rng.choice(categories),
+                    name=" ".join(rng.choices(WORDS, k=3)).capitalize(),
+                    status=EventStatus.Created,
+                    location=location,
+                    latitude=latitude + rng.gauss(0, LOCATION_SCATTER),
+                    longitude=longitude + rng.gauss(0, LOCATION_SCATTER),
+                    capacity=rng.randint(0, 10_000),
+                    description=" ".join(rng.choices(WORDS, k=20)),
+                    start_date=start_date,
+                    end_date=start_date + timedelta(days=rng.randint(1, 14)),
+                )
+            )
+
+        return events
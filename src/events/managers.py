@@ -4,5 +4,6 @@ from django.db.models import QuerySet
 
 class EventManager(models.Manager):
     def with_related(self, *args: str) -> QuerySet:
-        select_related_fields = ["creator", "category"] + list(args)
+        # Categories are rendered from `event_category_registry` instead of being joined.
+        select_related_fields = ["creator"] + list(args)
         return self.select_related(*set(select_related_fields))
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-18 10:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0004_alter_event_capacity"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="event",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["created_at", "id"], name="event_created_at_id_idx"),
+        ),
+    ]
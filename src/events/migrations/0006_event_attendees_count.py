@@ -0,0 +1,35 @@
+# Generated by Django 5.0.14 on 2026-10-18 10:27
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_attendees_count(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    EventAttendance = apps.get_model("events", "EventAttendance")
+
+    attendees_count = (
+        EventAttendance.objects.filter(event=OuterRef("pk"))
+        .order_by()
+        .values("event")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Event.objects.update(attendees_count=Coalesce(Subquery(attendees_count, output_field=IntegerField()), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0005_event_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="attendees_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_attendees_count, migrations.RunPython.noop),
+    ]
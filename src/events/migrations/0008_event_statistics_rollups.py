@@ -0,0 +1,68 @@
+# Generated by Django 5.0.14 on 2026-10-18 10:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0007_event_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventDurationStatistic",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("month", models.DateField()),
+                ("duration_category", models.CharField(max_length=16)),
+                ("total", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "event duration statistic",
+                "verbose_name_plural": "event duration statistics",
+            },
+        ),
+        migrations.CreateModel(
+            name="MonthlyAttendanceStatistic",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("month", models.DateField(unique=True)),
+                ("total_attendees", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "monthly attendance statistic",
+                "verbose_name_plural": "monthly attendance statistics",
+            },
+        ),
+        migrations.CreateModel(
+            name="MonthlyEventCreationStatistic",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("month", models.DateField(unique=True)),
+                ("total", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "monthly event creation statistic",
+                "verbose_name_plural": "monthly event creation statistics",
+            },
+        ),
+        migrations.CreateModel(
+            name="StatisticsRollupState",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=64, unique=True)),
+                ("high_water_mark", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "statistics rollup state",
+                "verbose_name_plural": "statistics rollup states",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="eventdurationstatistic",
+            constraint=models.UniqueConstraint(
+                fields=("month", "duration_category"), name="unique_month_duration_category"
+            ),
+        ),
+    ]
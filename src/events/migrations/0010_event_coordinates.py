@@ -0,0 +1,74 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:33
+
+import django.contrib.postgres.indexes
+import django.core.validators
+from django.conf import settings
+from django.contrib.postgres.operations import CreateExtension
+from django.db import migrations, models
+
+import base.geo
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0009_updated_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        CreateExtension("cube"),
+        CreateExtension("earthdistance"),
+        migrations.AddField(
+            model_name="event",
+            name="latitude",
+            field=models.FloatField(
+                blank=True,
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(-90),
+                    django.core.validators.MaxValueValidator(90),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="longitude",
+            field=models.FloatField(
+                blank=True,
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(-180),
+                    django.core.validators.MaxValueValidator(180),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="earth_location",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=base.geo.LLToEarth("latitude", "longitude"),
+                output_field=base.geo.EarthField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.GistIndex(
+                condition=models.Q(("earth_location__isnull", False)),
+                fields=["earth_location"],
+                name="event_earth_location_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(("latitude__isnull", True), ("longitude__isnull", True)),
+                    models.Q(("latitude__isnull", False), ("longitude__isnull", False)),
+                    _connector="OR",
+                ),
+                name="event_coordinates_pair",
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:43
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+import base.ranges
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0010_event_coordinates"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="event",
+            name="category",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="events",
+                to="events.eventcategory",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["start_date"], name="event_start_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["category", "start_date"], include=("status",), name="event_category_start_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["status", "start_date"], name="event_status_start_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.GistIndex(
+                base.ranges.DateSpan("start_date", "end_date"), name="event_date_span_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.CheckConstraint(
+                check=models.Q(("start_date__lte", models.F("end_date"))), name="event_dates_order"
+            ),
+        ),
+    ]
@@ -1,11 +1,16 @@
 from uuid import uuid4
 
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import ValidationError
 
-from events.constants import EventStatus
+from base.geo import EarthField, LLToEarth
+from base.ranges import DateSpan
+from events.constants import SEARCH_CONFIG, EventStatus
 from events.managers import EventManager
 from users.models import User
 
@@ -14,6 +19,7 @@ class EventCategory(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "category"
@@ -26,21 +32,72 @@ class EventCategory(models.Model):
 class Event(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     creator = models.ForeignKey(User, on_delete=models.CASCADE)
-    category = models.ForeignKey(EventCategory, on_delete=models.CASCADE, related_name="events")
+    # Looked up through the `(category, start_date)` index instead of an index of its own.
+    category = models.ForeignKey(EventCategory, on_delete=models.CASCADE, related_name="events", db_index=False)
     name = models.CharField(max_length=255)
     status = models.CharField(max_length=25, default=EventStatus.Created, choices=EventStatus.choices())
     location = models.CharField(max_length=255, db_index=True)
+    latitude = models.FloatField(blank=True, null=True, validators=[MinValueValidator(-90), MaxValueValidator(90)])
+    longitude = models.FloatField(blank=True, null=True, validators=[MinValueValidator(-180), MaxValueValidator(180)])
+    # Stored, so distances are computed from the point instead of converting the coordinates of every candidate row.
+    earth_location = models.GeneratedField(
+        expression=LLToEarth("latitude", "longitude"),
+        output_field=EarthField(),
+        db_persist=True,
+    )
     capacity = models.BigIntegerField(validators=[MinValueValidator(0), MaxValueValidator(10_000)])
+    attendees_count = models.PositiveIntegerField(default=0, editable=False)
     description = models.TextField()
     start_date = models.DateField()
     end_date = models.DateField()
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("name", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("location", weight="B", config=SEARCH_CONFIG)
+            + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     objects = EventManager()
 
     class Meta:
         verbose_name: str = "event"
         verbose_name_plural: str = "events"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="event_created_at_id_idx"),
+            # Date filters, on their own or narrowed down by category or status (`upcoming`).
+            models.Index(fields=["start_date"], name="event_start_date_idx"),
+            # `status` lets `upcoming` within a category be counted from the index alone.
+            models.Index(fields=["category", "start_date"], include=["status"], name="event_category_start_date_idx"),
+            models.Index(fields=["status", "start_date"], name="event_status_start_date_idx"),
+            # Serves the `during` and `ongoing_on` filters, which a B-tree could only bound on one of the dates.
+            GistIndex(DateSpan("start_date", "end_date"), name="event_date_span_idx"),
+            GinIndex(fields=["search_vector"], name="event_search_vector_idx"),
+            # Matches the `UPPER("location"::text) LIKE UPPER(...)` that Django emits for `icontains`.
+            GinIndex(
+                OpClass(Upper(Cast("location", models.TextField())), name="gin_trgm_ops"),
+                name="event_location_trgm_idx",
+            ),
+            # Serves the `near` filter: both the bounding box lookup and the nearest-first ordering.
+            GistIndex(
+                fields=["earth_location"],
+                name="event_earth_location_idx",
+                condition=models.Q(earth_location__isnull=False),
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(latitude__isnull=True, longitude__isnull=True)
+                | models.Q(latitude__isnull=False, longitude__isnull=False),
+                name="event_coordinates_pair",
+            ),
+            # `daterange()` fails on reversed bounds, which would otherwise surface as an error from the index.
+            models.CheckConstraint(check=models.Q(start_date__lte=models.F("end_date")), name="event_dates_order"),
+        ]
 
     def clean(self) -> None:
         """
@@ -51,12 +108,17 @@ class Event(models.Model):
         provided and not None before comparing them. This avoids a TypeError that could occur when attempting
         to compare NoneType with a date object and ensures the integrity of the event's date range.
 
+        Coordinates are optional, but an event with a latitude must have a longitude as well and vice versa.
+
         Raises:
-            ValidationError: If the start date is not before the end date.
+            ValidationError: If the start date is not before the end date, or only one coordinate is set.
         """
         if (self.start_date and self.end_date) and self.start_date >= self.end_date:
             raise ValidationError({"start_date": _("The start date must be before the end date.")})
 
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValidationError({"latitude": _("Latitude and longitude must be set together.")})
+
     def __str__(self) -> str:
         return self.name
 
@@ -74,3 +136,46 @@ class EventAttendance(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user} attends {self.event}"
+
+
+class StatisticsRollupState(models.Model):
+    name = models.CharField(max_length=64, unique=True)
+    high_water_mark = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = "statistics rollup state"
+        verbose_name_plural = "statistics rollup states"
+
+    def __str__(self) -> str:
+        return f"{self.name} up to {self.high_water_mark}"
+
+
+class MonthlyAttendanceStatistic(models.Model):
+    month = models.DateField(unique=True)
+    total_attendees = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "monthly attendance statistic"
+        verbose_name_plural = "monthly attendance statistics"
+
+
+class MonthlyEventCreationStatistic(models.Model):
+    month = models.DateField(unique=True)
+    total = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "monthly event creation statistic"
+        verbose_name_plural = "monthly event creation statistics"
+
+
+class EventDurationStatistic(models.Model):
+    month = models.DateField()
+    duration_category = models.CharField(max_length=16)
+    total = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "event duration statistic"
+        verbose_name_plural = "event duration statistics"
+        constraints = [
+            models.UniqueConstraint(fields=["month", "duration_category"], name="unique_month_duration_category"),
+        ]
@@ -11,3 +11,12 @@ class IsEventCreator(BasePermission):
             return True
 
         return obj.creator == request.user
+
+
+class IsEventOrganizer(BasePermission):
+    """
+    Grants access to the event's creator and to superusers, whatever the request method.
+    """
+
+    def has_object_permission(self, request: Request, view: View, obj: Event) -> bool:
+        return obj.creator_id == request.user.id or request.user.is_superuser
@@ -1,83 +1,157 @@
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
 
-from django.db.models import Case, CharField, Count, ExpressionWrapper, F, QuerySet, Value, When, fields
+from django.db import IntegrityError, transaction
+from django.db.models import Case, CharField, Count, ExpressionWrapper, F, QuerySet, Subquery, Sum, Value, When, fields
 from django.db.models.functions import ExtractDay, TruncMonth
 from django.utils import timezone
 
 from base.repositories import BaseRepository, ModelType
-from events.models import Event, EventAttendance, EventCategory
+from base.routers import get_replica_alias
+from events.models import (
+    Event,
+    EventAttendance,
+    EventCategory,
+    EventDurationStatistic,
+    MonthlyAttendanceStatistic,
+    MonthlyEventCreationStatistic,
+    StatisticsRollupState,
+)
 from users.models import User
 
 
 class EventRepository(BaseRepository[Event]):
     model = Event
+    # The event payload embeds its category, yet joining the categories would keep the probe off the `updated_at`
+    # index: any category write changes the watermark of every list instead, as categories are few and rarely written.
+    watermark_fields = ("updated_at", Subquery(EventCategory.objects.order_by("-updated_at").values("updated_at")[:1]))
 
     @classmethod
     def get_all(cls) -> QuerySet[ModelType]:
         return cls.model.objects.with_related().all()
 
     @classmethod
-    def get_events_with_attendees_count(cls) -> QuerySet:
-        return cls.model.objects.with_related().annotate(attendees_count=Count("attendees"))
+    def get_events_watermark(cls, queryset: QuerySet[Event]) -> Tuple[Any, ...]:
+        return cls.get_watermark(queryset, *cls.watermark_fields)
+
+    @classmethod
+    async def aget_events_watermark(cls, queryset: QuerySet[Event]) -> Tuple[Any, ...]:
+        return await cls.aget_watermark(queryset, *cls.watermark_fields)
+
+    @classmethod
+    def get_export_queryset(cls, queryset: QuerySet[Event]) -> QuerySet[Event]:
+        """
+        Flatten the creator and category into the exported rows and order them by the `(created_at, id)` index
+        unless the queryset is already explicitly ordered (e.g. by search rank).
+        """
+        queryset = queryset.annotate(
+            creator_email=F("creator__email"),
+            category_name=F("category__name"),
+        )
+        return queryset if queryset.query.order_by else queryset.order_by("created_at", "id")
+
+    @classmethod
+    def bulk_create(cls, events: List[Event], batch_size: int) -> List[Event]:
+        return cls.model.objects.bulk_create(events, batch_size=batch_size)
+
+    # The statistics are periodically refreshed rollups, so they are always read from the replica: its lag is far
+    # below the refresh interval.
 
     @classmethod
     def get_monthly_attendance_statistics(cls) -> QuerySet:
         return (
-            EventAttendance.objects.annotate(month=TruncMonth("timestamp"))
-            .values("month")
-            .annotate(total_attendees=Count("user"))
+            MonthlyAttendanceStatistic.objects.using(get_replica_alias())
+            .values("month", "total_attendees")
             .order_by("month")
         )
 
     @classmethod
     def get_event_duration_analysis(cls) -> QuerySet:
         return (
-            cls.model.objects.annotate(
-                duration_days=ExpressionWrapper(
-                    F("end_date") - F("start_date"),
-                    output_field=fields.DurationField(),
-                ),
-                duration_days_extracted=ExtractDay("duration_days"),
-                duration_category=Case(
-                    When(duration_days_extracted__lte=1, then=Value("Short")),
-                    When(duration_days_extracted__lte=7, then=Value("Medium")),
-                    default=Value("Long"),
-                    output_field=CharField(),
-                ),
-            )
+            EventDurationStatistic.objects.using(get_replica_alias())
             .values("duration_category")
-            .annotate(total=Count("id"))
+            .annotate(total=Sum("total"))
             .order_by("-duration_category")
         )
 
     @classmethod
     def get_monthly_event_creation_statistics(cls) -> QuerySet:
         return (
-            cls.model.objects.annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(total=Count("id"))
-            .order_by("month")
+            MonthlyEventCreationStatistic.objects.using(get_replica_alias()).values("month", "total").order_by("month")
         )
 
     @classmethod
-    def get_open_event_for_attendance(cls, event_id: str) -> Optional[Event]:
-        return (
-            cls.model.objects.with_related()
-            .annotate(attendees_count=Count("attendees"))
-            .filter(id=event_id, start_date__gt=timezone.now(), attendees_count__lt=F("capacity"))
-            .first()
-        )
+    def toggle_attendance(cls, user: User, event_id: str) -> Optional[bool]:
+        """
+        Reserve or cancel the user's attendance without a check-then-act window.
 
-    @classmethod
-    def toggle_attendance(cls, user: User, event: Event) -> bool:
-        attendance, created = EventAttendance.objects.get_or_create(user=user, event=event)
+        A reservation claims its seat with a single conditional UPDATE that only matches while the event is still
+        upcoming and `attendees_count < capacity`. The row lock taken by that UPDATE serializes concurrent
+        reservations of the same event until commit, and every waiter re-checks the capacity against the committed
+        counter, so the event can never be oversubscribed.
+
+        Returns:
+            True if the attendance was reserved, False if it was canceled and None if the event is not open.
+        """
+        open_events = cls.model.objects.filter(id=event_id, start_date__gt=timezone.now())
+
+        try:
+            with transaction.atomic():
+                if EventAttendance.objects.filter(user=user, event__in=open_events).delete()[0]:
+                    open_events.update(attendees_count=F("attendees_count") - 1)
+                    return False
 
-        if not created:
-            attendance.delete()
-            return False
+                seat_claimed = open_events.filter(attendees_count__lt=F("capacity")).update(
+                    attendees_count=F("attendees_count") + 1
+                )
+                if not seat_claimed:
+                    return None
+
+                EventAttendance.objects.create(user=user, event_id=event_id)
+        except IntegrityError:
+            # A concurrent request of the same user has already reserved the seat; the whole transaction,
+            # including this request's counter increment, is rolled back.
+            pass
 
         return True
 
+    @classmethod
+    def reconcile_attendees_count(cls, batch_size: int = 1000) -> int:
+        """
+        Repair drift between the stored `attendees_count` and the actual `EventAttendance` rows.
+
+        Drift can appear when attendances are removed outside `toggle_attendance`, e.g. through the admin or a
+        cascading user deletion. Events are walked in primary key order, one batch per transaction, so the command
+        never holds locks on more than `batch_size` events at a time.
+
+        Returns:
+            The number of events whose counter was repaired.
+        """
+        repaired, last_id = 0, None
+
+        while True:
+            batch = cls.model.objects.order_by("id")
+            if last_id is not None:
+                batch = batch.filter(id__gt=last_id)
+
+            batch_ids = list(batch.values_list("id", flat=True)[:batch_size])
+            if not batch_ids:
+                return repaired
+
+            with transaction.atomic():
+                drifted_counts = (
+                    cls.model.objects.filter(id__in=batch_ids)
+                    .annotate(actual_count=Count("attendees"))
+                    .exclude(attendees_count=F("actual_count"))
+                    .values_list("id", "actual_count")
+                )
+
+                for event_id, actual_count in drifted_counts:
+                    repaired += cls.model.objects.filter(id=event_id).update(attendees_count=actual_count)
+
+            last_id = batch_ids[-1]
+
 
 class EventAttendanceRepository(BaseRepository[EventAttendance]):
     model = EventAttendance
@@ -86,6 +160,125 @@ class EventAttendanceRepository(BaseRepository[EventAttendance]):
     def is_user_attending_event(cls, user: User, event: Event) -> bool:
         return cls.model.objects.filter(user=user, event=event).exists()
 
+    @classmethod
+    def get_event_attendance_export(cls, event_ids: Iterable[UUID]) -> QuerySet[EventAttendance]:
+        return (
+            cls.model.objects.filter(event_id__in=event_ids)
+            .annotate(
+                user_email=F("user__email"),
+                user_first_name=F("user__first_name"),
+                user_last_name=F("user__last_name"),
+            )
+            .order_by("event_id", "timestamp", "id")
+        )
+
 
 class EventCategoryRepository(BaseRepository[EventCategory]):
     model = EventCategory
+
+    @classmethod
+    def get_existing_ids(cls, ids: Iterable[UUID]) -> Set[UUID]:
+        return set(cls.model.objects.filter(id__in=ids).values_list("id", flat=True))
+
+
+class EventStatisticsRepository:
+    rollup_name = "event_statistics"
+    # Rows of transactions that were still in flight when a refresh started may carry slightly older timestamps.
+    commit_lag = timedelta(minutes=5)
+
+    @classmethod
+    def refresh_rollups(cls, rebuild: bool = False) -> datetime:
+        """
+        Bring the statistics rollup tables up to date from the stored high-water mark.
+
+        Rollups are partitioned by month, so an incremental refresh only recomputes the months from the high-water
+        mark's month onwards. Its cost depends on recent activity instead of the whole history. Changes to rows
+        of already closed months (e.g. cancelling an old reservation or deleting an old event) are only picked up
+        by a full `rebuild`, which is meant to run occasionally.
+
+        Returns:
+            The new high-water mark.
+        """
+        with transaction.atomic():
+            state, _ = StatisticsRollupState.objects.select_for_update().get_or_create(name=cls.rollup_name)
+            since = None if rebuild or state.high_water_mark is None else cls._get_month_start(state.high_water_mark)
+            high_water_mark = timezone.now() - cls.commit_lag
+
+            cls._refresh_monthly_attendance(since)
+            cls._refresh_monthly_event_creation(since)
+            cls._refresh_event_duration(since)
+
+            state.high_water_mark = high_water_mark
+            state.save(update_fields=["high_water_mark"])
+
+        return high_water_mark
+
+    @classmethod
+    def _refresh_monthly_attendance(cls, since: Optional[datetime]) -> None:
+        attendances = EventAttendance.objects.all()
+        rollups = MonthlyAttendanceStatistic.objects.all()
+
+        if since is not None:
+            attendances = attendances.filter(timestamp__gte=since)
+            rollups = rollups.filter(month__gte=since.date())
+
+        rollups.delete()
+        MonthlyAttendanceStatistic.objects.bulk_create(
+            MonthlyAttendanceStatistic(month=row["month"].date(), total_attendees=row["total"])
+            for row in attendances.annotate(month=TruncMonth("timestamp")).values("month").annotate(total=Count("id"))
+        )
+
+    @classmethod
+    def _refresh_monthly_event_creation(cls, since: Optional[datetime]) -> None:
+        events = Event.objects.all()
+        rollups = MonthlyEventCreationStatistic.objects.all()
+
+        if since is not None:
+            events = events.filter(created_at__gte=since)
+            rollups = rollups.filter(month__gte=since.date())
+
+        rollups.delete()
+        MonthlyEventCreationStatistic.objects.bulk_create(
+            MonthlyEventCreationStatistic(month=row["month"].date(), total=row["total"])
+            for row in events.annotate(month=TruncMonth("created_at")).values("month").annotate(total=Count("id"))
+        )
+
+    @classmethod
+    def _refresh_event_duration(cls, since: Optional[datetime]) -> None:
+        events = Event.objects.all()
+        rollups = EventDurationStatistic.objects.all()
+
+        if since is not None:
+            events = events.filter(created_at__gte=since)
+            rollups = rollups.filter(month__gte=since.date())
+
+        durations = (
+            events.annotate(
+                month=TruncMonth("created_at"),
+                duration_days=ExpressionWrapper(
+                    F("end_date") - F("start_date"),
+                    output_field=fields.DurationField(),
+                ),
+                duration_days_extracted=ExtractDay("duration_days"),
+                duration_category=Case(
+                    When(duration_days_extracted__lte=1, then=Value("Short")),
+                    When(duration_days_extracted__lte=7, then=Value("Medium")),
+                    default=Value("Long"),
+                    output_field=CharField(),
+                ),
+            )
+            .values("month", "duration_category")
+            .annotate(total=Count("id"))
+        )
+
+        rollups.delete()
+        EventDurationStatistic.objects.bulk_create(
+            EventDurationStatistic(
+                month=row["month"].date(), duration_category=row["duration_category"], total=row["total"]
+            )
+            for row in durations
+        )
+
+    @staticmethod
+    def _get_month_start(moment: datetime) -> datetime:
+        return timezone.localtime(moment).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -1,26 +1,59 @@
-from typing import Any, Dict
+import logging
+from copy import copy
+from datetime import datetime
+from functools import cached_property
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, Set, Tuple
+from uuid import UUID
 
 from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
 from django.db.models import Model
+from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.exceptions import ParseError
 
+from base.serializers import TimedListSerializer, TimedSerializerMixin
+from events.caches import event_category_registry
 from events.models import Event, EventCategory
-from events.repositories import EventCategoryRepository
+from events.repositories import EventCategoryRepository, EventRepository
+from users.models import User
 from users.serializers import UserSerializer
 
 
-class EventCategorySerializer(serializers.ModelSerializer):
+logger = logging.getLogger(__name__)
+
+
+class EventCategorySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model: Model = EventCategory
         fields = ("id", "name", "description")
+        list_serializer_class = TimedListSerializer
+
+
+class EventCategoryField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves category IDs against `event_category_registry` instead of looking each of them up in the database.
+
+    IDs the registry doesn't know go through the regular lookup, which reports the usual errors for invalid ones.
+    """
 
+    def to_internal_value(self, data: Any) -> EventCategory:
+        try:
+            category = event_category_registry.get_categories().get(UUID(str(data)))
+        except ValueError:
+            category = None
+
+        if category is None:
+            return super().to_internal_value(data)
+
+        # The registry's instances are shared by the whole process, so the event gets its own copy.
+        return copy(category)
 
-class EventSerializer(serializers.ModelSerializer):
+
+class EventSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     creator = UserSerializer(read_only=True)
-    category = serializers.PrimaryKeyRelatedField(
-        queryset=EventCategoryRepository.get_all(),
-        write_only=True,
-    )
+    category = EventCategoryField(queryset=EventCategoryRepository.get_all(), write_only=True)
 
     class Meta:
         model: Model = Event
@@ -31,6 +64,8 @@ class EventSerializer(serializers.ModelSerializer):
             "name",
             "status",
             "location",
+            "latitude",
+            "longitude",
             "capacity",
             "description",
             "start_date",
@@ -38,9 +73,14 @@ class EventSerializer(serializers.ModelSerializer):
             "created_at",
         )
         read_only_fields = ("id", "creator", "created_at")
+        list_serializer_class = TimedListSerializer
 
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        instance = Event(**data)
+        # Partial updates may set a single coordinate, which is checked against the event's other one.
+        coordinates = (
+            {field: getattr(self.instance, field) for field in ("latitude", "longitude")} if self.instance else {}
+        )
+        instance = Event(**{**coordinates, **data})
 
         try:
             instance.clean()
@@ -51,5 +91,151 @@ class EventSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance: Event) -> Dict[str, Any]:
         representation: Dict[str, Any] = super(EventSerializer, self).to_representation(instance)
-        representation.update(category=EventCategorySerializer(instance.category).data)
+        category = event_category_registry.get_categories().get(instance.category_id) or instance.category
+        representation.update(category=EventCategorySerializer(category).data)
         return representation
+
+
+class EventBulkCreateSerializer(EventSerializer):
+    """
+    Validates and inserts events in bulk, reporting errors per row instead of rejecting the whole upload.
+
+    One serializer instance validates every row, so fields are only built once. Category IDs are checked against a
+    set loaded with a single query per chunk (and only for IDs not seen in earlier chunks) instead of a
+    `PrimaryKeyRelatedField` lookup per row. Valid rows are inserted with `bulk_create`, which sends no signals.
+    """
+
+    category = serializers.UUIDField(source="category_id", write_only=True)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.category_ids: Set[UUID] = set()
+        self.checked_category_ids: Set[UUID] = set()
+
+    def validate_category(self, value: UUID) -> UUID:
+        if value not in self.category_ids:
+            raise serializers.ValidationError(f'Invalid pk "{value}" - object does not exist.')
+
+        return value
+
+    def create_many(
+        self, rows: Iterable[Any], creator: User, batch_size: int, max_rows: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Each chunk of `batch_size` rows is inserted in its own transaction. A chunk the database rejects is rolled back
+        and reported for each of its rows, while the chunks before it stay created. Rows past `max_rows` are not
+        processed, which is reported once.
+
+        Returns:
+            The created rows as `{"row", "id"}` and the rejected ones as `{"row", "errors"}`, both keyed by the row's
+            position in the upload.
+        """
+        created, errors = [], []
+        numbered_rows = enumerate(rows)
+        allowed_rows = islice(numbered_rows, max_rows)
+
+        while chunk := list(islice(allowed_rows, batch_size)):
+            self._load_category_ids(row for _, row in chunk)
+            events = []
+
+            for row_number, row in chunk:
+                if isinstance(row, ParseError):
+                    errors.append({"row": row_number, "errors": [row.detail]})
+                    continue
+
+                try:
+                    events.append((row_number, Event(creator=creator, **self.run_validation(row))))
+                except serializers.ValidationError as exc:
+                    errors.append({"row": row_number, "errors": exc.detail})
+
+            try:
+                with transaction.atomic():
+                    EventRepository.bulk_create([event for _, event in events], batch_size=batch_size)
+            except DatabaseError:
+                logger.exception("Could not insert rows %s to %s of a bulk upload", chunk[0][0], chunk[-1][0])
+                errors.extend(
+                    {
+                        "row": row_number,
+                        "errors": ["The row's batch could not be saved, none of its rows were created."],
+                    }
+                    for row_number, _ in events
+                )
+                continue
+
+            created.extend({"row": row_number, "id": event.id} for row_number, event in events)
+
+        if next(numbered_rows, None) is not None:
+            errors.append(
+                {"row": max_rows, "errors": [f"Uploads are limited to {max_rows} rows, the rest was skipped."]}
+            )
+
+        return created, sorted(errors, key=lambda error: error["row"])
+
+    def _load_category_ids(self, rows: Iterable[Any]) -> None:
+        requested_ids = set()
+        for row in rows:
+            try:
+                requested_ids.add(UUID(str(row["category"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        if unchecked_ids := requested_ids - self.checked_category_ids:
+            self.category_ids |= EventCategoryRepository.get_existing_ids(unchecked_ids)
+            self.checked_category_ids |= unchecked_ids
+
+
+class EventReadSerializer(TimedSerializerMixin, serializers.BaseSerializer):
+    """
+    Read-only counterpart of `EventSerializer` for list and retrieve responses.
+
+    It produces exactly the same payload, but builds it with a single dictionary literal per row instead of running
+    every field through the `ModelSerializer` machinery and instantiating nested serializers for the creator and the
+    category. The instance is expected to come with `creator` already selected, while categories are taken from
+    `event_category_registry`. Async callers pass the categories in the `categories` context entry, as the registry
+    may have to query the database to refresh them.
+    """
+
+    class Meta:
+        list_serializer_class = TimedListSerializer
+
+    @cached_property
+    def categories(self) -> Mapping[UUID, EventCategory]:
+        # The list serializer renders every row with the same child, so the registry is only read once per list.
+        if "categories" in self.context:
+            return self.context["categories"]
+
+        return event_category_registry.get_categories()
+
+    def to_representation(self, instance: Event) -> Dict[str, Any]:
+        creator = instance.creator
+        category = self.categories.get(instance.category_id) or instance.category
+        return {
+            "id": str(instance.id),
+            "creator": {
+                "id": str(creator.id),
+                "email": creator.email,
+                "first_name": creator.first_name,
+                "last_name": creator.last_name,
+            },
+            "name": instance.name,
+            "status": instance.status,
+            "location": instance.location,
+            "latitude": instance.latitude,
+            "longitude": instance.longitude,
+            "capacity": instance.capacity,
+            "description": instance.description,
+            "start_date": instance.start_date.isoformat(),
+            "end_date": instance.end_date.isoformat(),
+            "created_at": self.format_datetime(instance.created_at),
+            "category": {
+                "id": str(category.id),
+                "name": category.name,
+                "description": category.description,
+            },
+        }
+
+    @staticmethod
+    def format_datetime(value: datetime) -> str:
+        # Mirrors `serializers.DateTimeField.to_representation` with the default ISO 8601 format.
+        value = timezone.localtime(value).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
@@ -0,0 +1,25 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from events.caches import event_categories_cache, events_list_cache
+from events.models import Event, EventCategory
+
+
+@receiver([post_save, post_delete], sender=Event)
+@receiver([post_save, post_delete], sender=EventCategory)
+def invalidate_events_list_cache(**kwargs: Any) -> None:
+    """
+    Bump the events list generation right away and once more after commit, so a reader that cached the
+    pre-commit state under the new generation gets invalidated as well.
+    """
+    events_list_cache.bump_version()
+    transaction.on_commit(events_list_cache.bump_version)
+
+
+@receiver([post_save, post_delete], sender=EventCategory)
+def invalidate_event_categories_cache(**kwargs: Any) -> None:
+    event_categories_cache.bump_version()
+    transaction.on_commit(event_categories_cache.bump_version)
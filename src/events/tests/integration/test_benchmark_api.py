@@ -0,0 +1,80 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from base.benchmarks import find_regressions
+from events.models import Event, EventAttendance
+from users.models import User, UserProfile
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def seeded_dataset() -> None:
+    call_command("seed_events", events=50, users=5, attendances=30, saved_events=30, batch_size=20, verbosity=0)
+
+
+def test__seed_events__related_rows() -> None:
+    # when
+    call_command("seed_events", events=50, users=5, attendances=30, saved_events=30, batch_size=20, verbosity=0)
+
+    # then
+    assert Event.objects.count() == 50
+    assert User.objects.filter(email__startswith="benchmark+").count() == 5
+    assert 0 < EventAttendance.objects.count() <= 30, "Expected duplicate pairs to be skipped"
+    assert 0 < UserProfile.saved_events.through.objects.count() <= 30
+
+    attended_event = EventAttendance.objects.values_list("event", flat=True).first()
+    event = Event.objects.get(id=attended_event)
+    assert event.attendees_count == event.attendees.count(), "Expected the counters to be reconciled"
+
+
+def test__benchmark_api__results_written(seeded_dataset, tmp_path) -> None:
+    # given
+    output = tmp_path / "results.json"
+
+    # when
+    call_command("benchmark_api", repeat=1, output=str(output), stdout=StringIO())
+
+    # then
+    report = json.loads(output.read_text())
+    assert report["dataset"]["events"] == 50
+
+    results = report["results"]
+    assert len([name for name in results if name.startswith("event list ")]) == 2**5 + 1
+    assert {"event retrieve", "event attend", "event toggle_save", "user saved events", "signin"} <= set(results)
+    assert all(result["status"] < 400 for result in results.values()), results
+    assert results["event retrieve"]["queries"] == 1
+    assert results["admin event changelist"]["peak_memory_kb"] > 0
+
+
+def test__benchmark_api__regression_fails(seeded_dataset, tmp_path) -> None:
+    # given
+    baseline = tmp_path / "baseline.json"
+    call_command("benchmark_api", repeat=1, output=str(baseline), stdout=StringIO())
+
+    report = json.loads(baseline.read_text())
+    report["results"]["event retrieve"]["queries"] = 0
+    baseline.write_text(json.dumps(report))
+
+    # when
+    with pytest.raises(CommandError) as exc_info:
+        call_command("benchmark_api", repeat=1, baseline=str(baseline), stdout=StringIO())
+
+    # then
+    assert "event retrieve: queries 0 -> 1" in str(exc_info.value)
+
+
+def test__find_regressions__thresholds() -> None:
+    # given
+    baseline = {"list": {"p50_ms": 10.0, "queries": 2}, "removed": {"p50_ms": 1.0}}
+    results = {"list": {"p50_ms": 12.0, "queries": 3}, "added": {"p50_ms": 100.0}}
+
+    # when
+    regressions = find_regressions(results, baseline, thresholds={"p50_ms": 0.25, "queries": 0})
+
+    # then
+    assert regressions == ["list: queries 2 -> 3 (> 0%)"], "Expected only the extra query to be reported"
@@ -0,0 +1,194 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from base.tests import BaseTest
+from events.caches import events_list_cache
+from events.serializers import EventReadSerializer
+from events.tests.factories import EventCategoryFactory, EventFactory
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestConditionalEventList(BaseTest):
+    endpoint = reverse("event-list")
+
+    def test__list_events__not_modified_from_cache(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        EventFactory()
+        etag = api_client.get(self.endpoint)["ETag"]
+
+        # when
+        with django_assert_num_queries(0):
+            response = api_client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response, expected_status=304, expected_content_type=None)
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test__list_events__not_modified_from_probe(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        EventFactory(location="Amsterdam")
+        etag = api_client.get(self.endpoint, {"location": "a"})["ETag"]
+        events_list_cache.bump_version()
+
+        # when
+        with patch.object(EventReadSerializer, "to_representation") as to_representation:
+            with django_assert_num_queries(1):
+                response = api_client.get(self.endpoint, {"location": "a"}, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response, expected_status=304, expected_content_type=None)
+        to_representation.assert_not_called()
+
+        # when revalidated again
+        with django_assert_num_queries(0):
+            response = api_client.get(self.endpoint, {"location": "a"}, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response, expected_status=304, expected_content_type=None)
+
+        # when requested without the ETag
+        response = api_client.get(self.endpoint, {"location": "a"})
+
+        # then
+        self._common_check(response)
+        assert response["ETag"] == etag
+        assert len(response.json()["results"]) == 1
+
+    def test__list_events__etag_changes_on_writes(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        etags = [api_client.get(self.endpoint)["ETag"]]
+
+        # when
+        event.name = "Renamed event"
+        event.save()
+        etags.append(api_client.get(self.endpoint)["ETag"])
+
+        event.category.name = "Renamed category"
+        event.category.save()
+        etags.append(api_client.get(self.endpoint)["ETag"])
+
+        event.delete()
+        response = api_client.get(self.endpoint, HTTP_IF_NONE_MATCH=etags[-1])
+        etags.append(response["ETag"])
+
+        # then
+        self._common_check(response)
+        assert len(set(etags)) == len(etags), "Expected every write to change the ETag"
+
+    def test__list_events__etag_per_page(self, api_client: APIClient) -> None:
+        # given
+        EventFactory()
+
+        # when
+        first_page = api_client.get(self.endpoint, {"page": "1"})
+        filtered = api_client.get(self.endpoint, {"page": "1", "location": "a"})
+
+        # then
+        assert first_page["ETag"] != filtered["ETag"]
+
+
+class TestConditionalEventRetrieve(BaseTest):
+    def test__retrieve_event__not_modified(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        endpoint = reverse("event-detail", args=[event.id])
+        response = api_client.get(endpoint)
+
+        # when
+        with patch.object(EventReadSerializer, "to_representation") as to_representation:
+            etag_response = api_client.get(endpoint, HTTP_IF_NONE_MATCH=response["ETag"])
+            date_response = api_client.get(endpoint, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+
+        # then
+        self._common_check(etag_response, expected_status=304, expected_content_type=None)
+        self._common_check(date_response, expected_status=304, expected_content_type=None)
+        assert response["Last-Modified"] == http_date(event.updated_at.timestamp())
+        to_representation.assert_not_called()
+
+    def test__retrieve_event__modified_with_category(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        endpoint = reverse("event-detail", args=[event.id])
+        etag = api_client.get(endpoint)["ETag"]
+
+        # when
+        event.category.name = "Renamed category"
+        event.category.save()
+        response = api_client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response)
+        assert response.json()["category"]["name"] == "Renamed category"
+        assert response["ETag"] != etag
+
+
+class TestConditionalEventCategoryList(BaseTest):
+    endpoint = reverse("categories_list")
+
+    def test__list_categories__not_modified(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        EventCategoryFactory()
+        etag = api_client.get(self.endpoint)["ETag"]
+
+        # when
+        with django_assert_num_queries(0):
+            response = api_client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response, expected_status=304, expected_content_type=None)
+
+    def test__list_categories__invalidated_on_category_write(self, api_client: APIClient) -> None:
+        # given
+        category = EventCategoryFactory(name="Sports")
+        etag = api_client.get(self.endpoint)["ETag"]
+
+        # when
+        category.name = "Outdoor sports"
+        category.save()
+        response = api_client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response)
+        assert response.json()["results"][0]["name"] == "Outdoor sports"
+
+
+class TestConditionalSavedEvents(BaseTest):
+    def test__saved_events__not_modified(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        user = UserFactory()
+        user.profile.saved_events.add(EventFactory())
+        endpoint = reverse("user_saved_events", kwargs={"uuid": str(user.id)})
+        etag = api_client.get(endpoint)["ETag"]
+
+        # when
+        with patch.object(EventReadSerializer, "to_representation") as to_representation:
+            with django_assert_num_queries(1):
+                response = api_client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response, expected_status=304, expected_content_type=None)
+        to_representation.assert_not_called()
+
+    def test__saved_events__modified_on_save(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        user.profile.saved_events.add(EventFactory())
+        endpoint = reverse("user_saved_events", kwargs={"uuid": str(user.id)})
+        etag = api_client.get(endpoint)["ETag"]
+
+        # when
+        user.profile.saved_events.add(EventFactory())
+        response = api_client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self._common_check(response)
+        assert len(response.json()["results"]) == 2
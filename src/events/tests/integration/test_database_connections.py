@@ -0,0 +1,82 @@
+import ast
+import os
+import subprocess
+import sys
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connections
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.tests import BaseTest
+from events.tests.factories import EventFactory
+
+
+class TestDatabaseStatsEndpoint(BaseTest):
+    endpoint = reverse("database_metrics")
+
+    @pytest.mark.django_db
+    def test__database_stats__connection_settings_per_alias(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.get(self.endpoint)
+
+        # then
+        self._common_check(response)
+
+        stats = response.json()
+        assert stats["pid"] == os.getpid()
+        assert set(stats["databases"]) == set(connections)
+        assert stats["databases"]["default"]["conn_max_age"] == connections["default"].settings_dict["CONN_MAX_AGE"]
+        assert stats["databases"]["default"]["health_checks"] is True
+        assert stats["databases"]["default"]["connections_opened"] >= 1
+        assert stats["databases"]["default"]["pool"] is None
+
+    def test__database_stats__external_address_forbidden(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.get(self.endpoint, REMOTE_ADDR="203.0.113.7")
+
+        # then
+        self._common_check(response, expected_status=403)
+
+
+# The command closes connections between scenarios, which a test wrapped in a transaction cannot survive.
+@pytest.mark.django_db(transaction=True)
+def test__benchmark_connections__reuses_persistent_connections() -> None:
+    # given
+    EventFactory()
+    original_settings = connections["default"].settings_dict.copy()
+    stdout = StringIO()
+
+    # when
+    call_command("benchmark_connections", repeat=3, stdout=stdout)
+
+    # then
+    output = stdout.getvalue()
+    opened = [
+        ast.literal_eval(line.split(": ", 1)[1])["default"]
+        for line in output.splitlines()
+        if line.startswith("Connections opened")
+    ]
+    assert "event retrieve, new connection per request" in output
+    assert len(opened) == 3
+    assert opened[0] >= 3, "Expected a new connection per request"
+    assert opened[2] - opened[1] <= 1, "Expected a single connection for every persistent request"
+    assert connections["default"].settings_dict == original_settings, "Expected the settings to be restored"
+
+
+def test__asgi__persistent_connections_disabled() -> None:
+    # given
+    environment = {**os.environ, "POSTGRES_CONN_MAX_AGE": "60"}
+    script = "import base.asgi; from django.conf import settings; print(settings.DATABASES['default']['CONN_MAX_AGE'])"
+
+    # when
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=settings.BASE_DIR, env=environment, capture_output=True, text=True
+    )
+
+    # then
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "0", "Expected the ASGI entry point to override POSTGRES_CONN_MAX_AGE"
@@ -0,0 +1,61 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from events.repositories import EventStatisticsRepository
+from events.tests.factories import EventAttendanceFactory
+from users.repositories import UserRepository
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestEventAdmin:
+    endpoint = reverse("admin:events_event_changelist")
+
+    def test__changelist__renders_statistics(self, client: Client) -> None:
+        # given
+        superuser = UserRepository.create_superuser(
+            email="admin@eventfor.us",
+            first_name="Admin",
+            last_name="Admin",
+            password="abc123",
+        )
+        [EventAttendanceFactory() for _ in range(2)]
+        EventStatisticsRepository.refresh_rollups()
+
+        # when
+        client.force_login(superuser)
+        response = client.get(self.endpoint)
+
+        # then
+        assert response.status_code == 200
+
+        content = response.content.decode()
+        assert "2 attendees" in content, "Expected the attendance statistics to be rendered from the rollups"
+        assert "Short: 2 events" in content
+
+    def test__export_events_action__streams_csv(self, client: Client) -> None:
+        # given
+        superuser = UserRepository.create_superuser(
+            email="admin@eventfor.us",
+            first_name="Admin",
+            last_name="Admin",
+            password="abc123",
+        )
+        attendances = [EventAttendanceFactory() for _ in range(2)]
+        selected_event = attendances[0].event
+
+        # when
+        client.force_login(superuser)
+        response = client.post(
+            self.endpoint, {"action": "export_attendance", "_selected_action": [str(selected_event.id)]}
+        )
+
+        # then
+        assert response.status_code == 200
+        assert response.streaming, "Expected the export to be streamed"
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert len(lines) == 2, "Expected a header and the selected event's attendance only"
+        assert str(attendances[0].id) in lines[1]
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.tests import BaseTest
+from base.views import dispatch_by_method
+from events.tests.factories import EventCategoryFactory, EventFactory
+from events.views import AsyncEventCategoryListView, AsyncEventDetailView, AsyncEventListView, EventViewSet
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestAsyncEventViews(BaseTest):
+    endpoint = reverse("event-list")
+    request_factory = AsyncRequestFactory()
+
+    def test__async_list_events__matches_sync_payload(self, api_client: APIClient) -> None:
+        # given
+        [EventFactory() for _ in range(3)]
+        sync_response = api_client.get(self.endpoint, {"pagination": "page"})
+
+        # when
+        request = self.request_factory.get(self.endpoint, {"pagination": "page"})
+        response = async_to_sync(AsyncEventListView.as_view())(request)
+
+        # then
+        self._common_check(response)
+        assert json.loads(response.content) == sync_response.json()
+
+    def test__async_list_events__invalid_filter__failed(self) -> None:
+        # when
+        request = self.request_factory.get(self.endpoint, {"start_date_gte": "not-a-date"})
+        response = async_to_sync(AsyncEventListView.as_view())(request)
+
+        # then
+        self._common_check(response, expected_status=400)
+        assert "start_date_gte" in json.loads(response.content)
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"pagination": "cursor", "cursor": "garbage"}, {"pagination": "page", "page": "99"}],
+        ids=["cursor", "page"],
+    )
+    def test__async_list_events__invalid_page__not_found(self, api_client: APIClient, params: dict) -> None:
+        # given
+        EventFactory()
+        sync_response = api_client.get(self.endpoint, params)
+
+        # when
+        request = self.request_factory.get(self.endpoint, params)
+        response = async_to_sync(AsyncEventListView.as_view())(request)
+
+        # then
+        self._common_check(response, expected_status=404)
+        assert json.loads(response.content) == sync_response.json()
+
+    def test__async_retrieve_event__success(self) -> None:
+        # given
+        event = EventFactory()
+
+        # when
+        request = self.request_factory.get(reverse("event-detail", args=[str(event.id)]))
+        response = async_to_sync(AsyncEventDetailView.as_view())(request, pk=str(event.id))
+
+        # then
+        self._common_check(response)
+        assert json.loads(response.content)["id"] == str(event.id)
+
+    def test__async_retrieve_event__not_found(self) -> None:
+        # given
+        event = EventFactory()
+        event_id = str(event.id)
+        event.delete()
+
+        # when
+        request = self.request_factory.get(reverse("event-detail", args=[event_id]))
+        response = async_to_sync(AsyncEventDetailView.as_view())(request, pk=event_id)
+
+        # then
+        self._common_check(response, expected_status=404)
+        assert json.loads(response.content)["detail"] == "No Event matches the given query."
+
+    def test__async_list_categories__success(self) -> None:
+        # given
+        [EventCategoryFactory() for _ in range(2)]
+
+        # when
+        request = self.request_factory.get(reverse("categories_list"), {"page": "1"})
+        response = async_to_sync(AsyncEventCategoryListView.as_view())(request)
+
+        # then
+        self._common_check(response)
+        assert json.loads(response.content)["count"] == 2
+
+    def test__dispatch_by_method__routes_writes_to_sync_view(self) -> None:
+        # given
+        user = UserFactory()
+        event = EventFactory(creator=user)
+        view = dispatch_by_method(
+            read_view=AsyncEventDetailView.as_view(),
+            write_view=EventViewSet.as_view({"patch": "partial_update"}),
+        )
+
+        # when
+        request = self.request_factory.patch(
+            reverse("event-detail", args=[str(event.id)]),
+            data={"name": "Updated event name"},
+            content_type="application/json",
+        )
+        request._force_auth_user = user
+        response = async_to_sync(view)(request, pk=str(event.id))
+
+        # then
+        event.refresh_from_db()
+        assert response.status_code == 200
+        assert event.name == "Updated event name"
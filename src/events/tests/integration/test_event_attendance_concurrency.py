@@ -0,0 +1,65 @@
+import threading
+import time
+from typing import List
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from events.models import EventAttendance
+from events.tests.factories import EventFactory
+from users.models import User
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+class TestEventAttendanceConcurrency:
+    capacity = 10
+    concurrent_users = 30
+
+    def test__concurrent_attend__never_oversells(self, record_property) -> None:
+        # given
+        event = EventFactory(capacity=self.capacity)
+        users = [UserFactory() for _ in range(self.concurrent_users)]
+        endpoint = reverse("event-attend", args=[str(event.id)])
+
+        barrier = threading.Barrier(len(users))
+        status_codes: List[int] = []
+
+        def attend(user: User) -> None:
+            client = APIClient()
+            client.force_authenticate(user)
+
+            try:
+                barrier.wait()
+                status_codes.append(client.post(endpoint).status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=attend, args=(user,)) for user in users]
+
+        # when
+        started_at = time.perf_counter()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.perf_counter() - started_at
+
+        # then
+        event.refresh_from_db()
+        reservations = EventAttendance.objects.filter(event=event).count()
+
+        assert status_codes.count(200) == self.capacity, "Expected exactly `capacity` successful reservations"
+        assert status_codes.count(400) == self.concurrent_users - self.capacity
+        assert reservations == self.capacity, "The event must never be oversubscribed"
+        assert event.attendees_count == reservations, "The stored counter must match the attendance rows"
+
+        reservations_per_second = len(status_codes) / elapsed
+        record_property("reservations_per_second", round(reservations_per_second, 2))
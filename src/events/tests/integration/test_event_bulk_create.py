@@ -0,0 +1,188 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+from django.db import IntegrityError
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.settings import EVENTS_CONFIGURATION
+from base.tests import BaseTest
+from events.models import Event, EventCategory
+from events.repositories import EventRepository
+from events.tests.factories import EventCategoryFactory
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _build_row(category: EventCategory, index: int = 0) -> dict:
+    start_date = date.today() + timedelta(days=index % 30 + 1)
+    return {
+        "category": str(category.id),
+        "name": f"Talk #{index}",
+        "location": "Main hall",
+        "capacity": 100,
+        "description": "Conference talk",
+        "start_date": start_date.isoformat(),
+        "end_date": (start_date + timedelta(days=1)).isoformat(),
+    }
+
+
+class TestEventBulkCreate(BaseTest):
+    endpoint = reverse("event-bulk-create")
+
+    def test__bulk_create_json_array__per_row_errors(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        category = EventCategoryFactory()
+        rows = [
+            _build_row(category, 0),
+            {**_build_row(category, 1), "category": "5b1f0a8e-3b7c-4a53-9d5f-3f4b1f8c2d10"},
+            {**_build_row(category, 2), "end_date": date.today().isoformat()},
+            "not an event",
+            _build_row(category, 4),
+        ]
+        api_client.force_authenticate(user)
+
+        # when
+        response = api_client.post(self.endpoint, data=rows, format="json")
+
+        # then
+        self._common_check(response, expected_status=201)
+
+        response_data = response.json()
+        assert [item["row"] for item in response_data["created"]] == [0, 4]
+        assert [item["row"] for item in response_data["errors"]] == [1, 2, 3]
+        assert "category" in response_data["errors"][0]["errors"], "Expected an unknown category error"
+        assert response_data["errors"][1]["errors"] == {"start_date": ["The start date must be before the end date."]}
+
+        assert Event.objects.filter(creator=user).count() == 2, "Expected only the valid rows to be created"
+        created_ids = {str(event_id) for event_id in Event.objects.values_list("id", flat=True)}
+        assert created_ids == {item["id"] for item in response_data["created"]}
+
+    def test__bulk_create_ndjson__success(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        category = EventCategoryFactory()
+        lines = [json.dumps(_build_row(category, 0)), "{not json", "", json.dumps(_build_row(category, 1))]
+        api_client.force_authenticate(user)
+
+        # when
+        response = api_client.post(self.endpoint, data="\n".join(lines), content_type="application/x-ndjson")
+
+        # then
+        self._common_check(response, expected_status=201)
+
+        response_data = response.json()
+        assert [item["row"] for item in response_data["created"]] == [0, 2]
+        assert response_data["errors"][0]["row"] == 1
+        assert response_data["errors"][0]["errors"][0].startswith("Line 2: JSON parse error")
+
+    def test__bulk_create__invalidates_list_cache(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        category = EventCategoryFactory()
+        api_client.get(reverse("event-list"))
+        api_client.force_authenticate(user)
+
+        # when
+        api_client.post(self.endpoint, data=[_build_row(category)], format="json")
+        response = api_client.get(reverse("event-list"))
+
+        # then
+        assert len(response.json()["results"]) == 1, "Expected the bulk created event to be listed"
+
+    def test__bulk_create__batched_queries(
+        self, api_client: APIClient, django_assert_max_num_queries, monkeypatch
+    ) -> None:
+        # given
+        rows_count, batch_size = 6, 2
+        monkeypatch.setitem(EVENTS_CONFIGURATION, "BULK_CREATE_BATCH_SIZE", batch_size)
+        user = UserFactory()
+        categories = [EventCategoryFactory() for _ in range(3)]
+        rows = [_build_row(categories[index % 3], index) for index in range(rows_count)]
+        api_client.force_authenticate(user)
+
+        # when
+        # Per chunk, at most a category lookup and the insert, within a savepoint as tests run in a transaction.
+        with django_assert_max_num_queries(4 * rows_count // batch_size):
+            response = api_client.post(self.endpoint, data=rows, format="json")
+
+        # then
+        self._common_check(response, expected_status=201)
+        assert Event.objects.count() == rows_count
+
+    def test__bulk_create__failed_chunk_rolled_back(self, api_client: APIClient, monkeypatch) -> None:
+        # given
+        monkeypatch.setitem(EVENTS_CONFIGURATION, "BULK_CREATE_BATCH_SIZE", 2)
+        user = UserFactory()
+        category = EventCategoryFactory()
+        rows = [_build_row(category, index) for index in range(5)]
+        bulk_create = EventRepository.bulk_create
+        calls = []
+
+        def failing_bulk_create(events, batch_size):
+            calls.append(events)
+            if len(calls) == 2:
+                bulk_create(events[:1], batch_size=batch_size)
+                raise IntegrityError("duplicate key value violates unique constraint")
+
+            return bulk_create(events, batch_size=batch_size)
+
+        monkeypatch.setattr(EventRepository, "bulk_create", failing_bulk_create)
+        api_client.force_authenticate(user)
+
+        # when
+        response = api_client.post(self.endpoint, data=rows, format="json")
+
+        # then
+        self._common_check(response, expected_status=201)
+
+        response_data = response.json()
+        assert [item["row"] for item in response_data["created"]] == [0, 1, 4]
+        assert [item["row"] for item in response_data["errors"]] == [2, 3]
+        assert set(Event.objects.values_list("name", flat=True)) == {
+            "Talk #0",
+            "Talk #1",
+            "Talk #4",
+        }, "Expected the failed chunk to be rolled back and the other chunks to be created"
+
+    def test__bulk_create__rows_past_limit_skipped(self, api_client: APIClient, monkeypatch) -> None:
+        # given
+        monkeypatch.setitem(EVENTS_CONFIGURATION, "BULK_CREATE_MAX_ROWS", 3)
+        category = EventCategoryFactory()
+        lines = [json.dumps(_build_row(category, index)) for index in range(5)]
+        api_client.force_authenticate(UserFactory())
+
+        # when
+        response = api_client.post(self.endpoint, data="\n".join(lines), content_type="application/x-ndjson")
+
+        # then
+        self._common_check(response, expected_status=201)
+
+        response_data = response.json()
+        assert [item["row"] for item in response_data["created"]] == [0, 1, 2]
+        assert response_data["errors"] == [
+            {"row": 3, "errors": ["Uploads are limited to 3 rows, the rest was skipped."]}
+        ]
+        assert Event.objects.count() == 3
+
+    def test__bulk_create_not_a_list__failed(self, api_client: APIClient) -> None:
+        # given
+        api_client.force_authenticate(UserFactory())
+
+        # when
+        response = api_client.post(self.endpoint, data={"name": "Single event"}, format="json")
+
+        # then
+        self._common_check(response, expected_status=400)
+        assert response.json()["non_field_errors"] == ["Expected a list of events."]
+
+    def test__bulk_create__unauthenticated_user__failed(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.post(self.endpoint, data=[], format="json")
+
+        # then
+        self._common_check(response, expected_status=401)
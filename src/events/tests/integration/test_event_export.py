@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+from typing import List
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import StreamingHttpResponse
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient, force_authenticate
+
+from base.tests import BaseTest
+from events.constants import EVENT_ATTENDANCE_EXPORT_FIELDS, EVENT_EXPORT_FIELDS
+from events.tests.factories import EventAttendanceFactory, EventFactory
+from events.views import EventViewSet
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestEventExport(BaseTest):
+    endpoint = reverse("event-export")
+
+    def test__export_events_csv__honours_filters(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        kept_events = [EventFactory(location="Kyiv") for _ in range(3)]
+        EventFactory(location="Lviv")
+        api_client.force_authenticate(UserFactory())
+
+        # when
+        response = api_client.get(self.endpoint, {"location": "Kyiv"})
+        with django_assert_num_queries(1):
+            content = b"".join(response.streaming_content).decode()
+
+        # then
+        self._common_check(response, expected_content_type="text/csv")
+        assert response["Content-Disposition"] == 'attachment; filename="events.csv"'
+
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert tuple(rows[0]) == EVENT_EXPORT_FIELDS
+        assert [row["id"] for row in rows] == [str(event.id) for event in kept_events]
+        assert rows[0]["creator_email"] == kept_events[0].creator.email
+        assert rows[0]["category_name"] == kept_events[0].category.name
+
+    def test__export_events_ndjson__success(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        api_client.force_authenticate(UserFactory())
+
+        # when
+        response = api_client.get(self.endpoint, {"export_format": "ndjson"})
+
+        # then
+        self._common_check(response, expected_content_type="application/x-ndjson")
+
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(event.id)
+        assert rows[0]["start_date"] == event.start_date.isoformat()
+
+    def test__export_events_asgi__streamed_in_chunks(self, monkeypatch) -> None:
+        # given
+        monkeypatch.setattr("base.exports.EXPORT_CHUNK_SIZE", 2)
+        events = [EventFactory() for _ in range(3)]
+        request = AsyncRequestFactory().get(self.endpoint, {"export_format": "ndjson"})
+        force_authenticate(request, UserFactory())
+
+        # when
+        response = EventViewSet.as_view({"get": "export"})(request)
+        chunks = async_to_sync(self._read_chunks)(response)
+
+        # then
+        self._common_check(response, expected_content_type="application/x-ndjson")
+        assert response.is_async, "Expected an async iterator, which ASGI servers stream without reading it in full"
+        assert [len(chunk.splitlines()) for chunk in chunks] == [2, 1]
+        assert {json.loads(line)["id"] for line in b"".join(chunks).decode().splitlines()} == {
+            str(event.id) for event in events
+        }
+
+    @staticmethod
+    async def _read_chunks(response: StreamingHttpResponse) -> List[bytes]:
+        return [chunk async for chunk in response.streaming_content]
+
+    def test__export_events_invalid_format__failed(self, api_client: APIClient) -> None:
+        # given
+        api_client.force_authenticate(UserFactory())
+
+        # when
+        response = api_client.get(self.endpoint, {"export_format": "xlsx"})
+
+        # then
+        self._common_check(response, expected_status=400)
+        assert response.json()["export_format"] == ['"xlsx" is not a valid choice.']
+
+    def test__export_events__unauthenticated_user__failed(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.get(self.endpoint)
+
+        # then
+        self._common_check(response, expected_status=401)
+
+    def test__export_attendance__event_creator(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        attendances = [EventAttendanceFactory(event=event) for _ in range(2)]
+        EventAttendanceFactory()
+        api_client.force_authenticate(event.creator)
+
+        # when
+        response = api_client.get(reverse("event-export-attendance", args=[str(event.id)]))
+
+        # then
+        self._common_check(response, expected_content_type="text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        assert tuple(rows[0]) == EVENT_ATTENDANCE_EXPORT_FIELDS
+        assert {row["id"] for row in rows} == {str(attendance.id) for attendance in attendances}
+        assert {row["user_email"] for row in rows} == {attendance.user.email for attendance in attendances}
+
+    def test__export_attendance__not_event_creator__failed(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        api_client.force_authenticate(UserFactory())
+
+        # when
+        response = api_client.get(reverse("event-export-attendance", args=[str(event.id)]))
+
+        # then
+        self._common_check(response, expected_status=403)
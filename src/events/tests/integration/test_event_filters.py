@@ -1,8 +1,17 @@
+import re
+from datetime import timedelta
+from typing import Any, Callable, Dict
+
 import pytest
+from django.db import connection
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 
 from base.tests import BaseTest
+from events.constants import EventStatus
+from events.filters import EventFilter
+from events.models import Event
 from events.tests.factories import EventCategoryFactory, EventFactory
 from users.tests.factories import UserFactory
 
@@ -86,3 +95,284 @@ class TestEventFilter(BaseTest):
 
         response_data = response.json()["results"]
         assert len(response_data) == 1, "Expected only one event with start_date >= '2024-08-28'"
+
+    def test__filter_by_date_range__success(self, api_client: APIClient) -> None:
+        # given
+        for start_date, end_date in {
+            ("2024-08-01", "2024-08-02"),
+            ("2024-08-10", "2024-08-20"),
+            ("2024-09-01", "2024-09-03"),
+        }:
+            EventFactory(name=start_date, start_date=start_date, end_date=end_date)
+
+        # when
+        response = api_client.get(
+            self.endpoint,
+            {"start_date_gte": "2024-08-01", "start_date_lte": "2024-08-31", "end_date_lte": "2024-08-15"},
+        )
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert [item["name"] for item in response_data] == ["2024-08-01"], "Expected only the event within the range"
+
+    @pytest.mark.parametrize(
+        "params, expected_names",
+        [
+            (
+                {"during": "2024-08-02,2024-08-10"},
+                {"ends on the first day", "spans the range", "starts on the last day"},
+            ),
+            ({"during": "2024-08-05,2024-08-05"}, {"spans the range"}),
+            ({"ongoing_on": "2024-08-02"}, {"ends on the first day", "spans the range"}),
+            ({"ongoing_on": "2024-08-12"}, {"starts on the last day"}),
+            ({"during": "2024-08-15,2024-08-20"}, set()),
+        ],
+    )
+    def test__filter_overlapping_dates__success(self, api_client: APIClient, params: dict, expected_names: set) -> None:
+        # given
+        EventFactory(name="ends before", start_date="2024-07-28", end_date="2024-08-01")
+        EventFactory(name="ends on the first day", start_date="2024-07-30", end_date="2024-08-02")
+        EventFactory(name="spans the range", start_date="2024-08-01", end_date="2024-08-11")
+        EventFactory(name="starts on the last day", start_date="2024-08-10", end_date="2024-08-12")
+        EventFactory(name="starts after", start_date="2024-08-13", end_date="2024-08-14")
+
+        # when
+        response = api_client.get(self.endpoint, params)
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert {item["name"] for item in response_data} == expected_names
+
+    @pytest.mark.parametrize("during", ["2024-08-02", "2024-08-10,2024-08-02", "2024-08-02,tomorrow"])
+    def test__filter_during_invalid__failed(self, api_client: APIClient, during: str) -> None:
+        # when
+        response = api_client.get(self.endpoint, {"during": during})
+
+        # then
+        self._common_check(response, expected_status=400)
+
+    def test__filter_upcoming__success(self, api_client: APIClient) -> None:
+        # given
+        today = timezone.now().date()
+        EventFactory(name="upcoming", status=EventStatus.Created, start_date=today, end_date=today + timedelta(days=1))
+        EventFactory(
+            name="canceled",
+            status=EventStatus.Canceled,
+            start_date=today + timedelta(days=1),
+            end_date=today + timedelta(days=2),
+        )
+        EventFactory(
+            name="started",
+            status=EventStatus.Created,
+            start_date=today - timedelta(days=1),
+            end_date=today + timedelta(days=1),
+        )
+
+        # when
+        response = api_client.get(self.endpoint, {"upcoming": "true"})
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert [item["name"] for item in response_data] == ["upcoming"], "Expected only the event yet to start"
+
+    def test__filter_by_status__success(self, api_client: APIClient) -> None:
+        # given
+        for status in {EventStatus.Created, EventStatus.Canceled}:
+            EventFactory(status=status)
+
+        # when
+        response = api_client.get(self.endpoint, {"status": EventStatus.Canceled})
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert [item["status"] for item in response_data] == [EventStatus.Canceled]
+
+    @pytest.mark.parametrize(
+        "params, expected_indexes",
+        [
+            # On PostgreSQL 18 and later, skip scans let the `(status, start_date)` index serve plain ranges as well.
+            (
+                {"start_date_gte": "2024-08-01", "start_date_lte": "2024-08-31"},
+                ("event_start_date_idx", "event_status_start_date_idx"),
+            ),
+            ({"category": "CATEGORY", "start_date_gte": "2024-08-01"}, ("event_category_start_date_idx",)),
+            ({"upcoming": "true"}, ("event_status_start_date_idx",)),
+            ({"during": "2024-08-02,2024-08-10"}, ("event_date_span_idx",)),
+            ({"ongoing_on": "2024-08-02"}, ("event_date_span_idx",)),
+        ],
+    )
+    def test__filter_by_dates__uses_indexes(self, params: dict, expected_indexes: tuple) -> None:
+        # given
+        categories = [EventCategoryFactory() for _ in range(20)]
+        statuses = [status for status, _ in EventStatus.choices()]
+        first_day = timezone.now().date() - timedelta(days=365)
+        self._bulk_create_events(
+            lambda number: {
+                "category": categories[number % len(categories)],
+                "status": statuses[number % len(statuses)],
+                "start_date": first_day + timedelta(days=number % 730),
+                "end_date": first_day + timedelta(days=number % 730 + 2),
+            }
+        )
+        params = {name: str(categories[0].id) if value == "CATEGORY" else value for name, value in params.items()}
+
+        # when
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        query_plan = EventFilter(params, queryset=Event.objects.all()).qs.explain()
+
+        # then
+        assert any(
+            index in query_plan for index in expected_indexes
+        ), f"Expected one of {expected_indexes}:\n{query_plan}"
+
+    def test__filter_by_location__uses_trigram_index(self) -> None:
+        # given
+        EventFactory(location="New York, USA")
+
+        # when
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        query_plan = Event.objects.filter(location__icontains="usa").explain()
+
+        # then
+        assert "event_location_trgm_idx" in query_plan, "Expected location icontains to use the trigram index"
+
+    def test__search__ranks_matches(self, api_client: APIClient) -> None:
+        # given
+        EventFactory(name="Jazz night", description="Live music downtown", location="New Orleans, USA")
+        EventFactory(name="Open mic", description="Bring your jazz standards", location="Paris, France")
+        EventFactory(name="Chess tournament", description="Rapid games", location="Berlin, Germany")
+
+        # when
+        response = api_client.get(
+            self.endpoint,
+            {"search": "jazz"},
+        )
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert [item["name"] for item in response_data] == [
+            "Jazz night",
+            "Open mic",
+        ], "Expected name matches to rank above description matches"
+
+    def test__search__uses_search_vector_index(self) -> None:
+        # given
+        EventFactory(name="Jazz night")
+
+        # when
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        query_plan = EventFilter.filter_search(Event.objects.all(), "search", "jazz").explain()
+
+        # then
+        assert "event_search_vector_idx" in query_plan, "Expected search to use the search vector GIN index"
+
+    def test__filter_near__nearest_first_within_radius(self, api_client: APIClient) -> None:
+        # given
+        EventFactory(name="Times Square", latitude=40.758, longitude=-73.9855)
+        EventFactory(name="Brooklyn Bridge", latitude=40.7061, longitude=-73.9969)
+        EventFactory(name="Newark", latitude=40.7357, longitude=-74.1724)
+        EventFactory(name="Philadelphia", latitude=39.9526, longitude=-75.1652)
+        EventFactory(name="Nowhere in particular")
+
+        # when
+        response = api_client.get(self.endpoint, {"near": "40.7128,-74.0060", "radius_km": 20})
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert [item["name"] for item in response_data] == [
+            "Brooklyn Bridge",
+            "Times Square",
+            "Newark",
+        ], "Expected the events within 20 km, nearest first"
+
+    def test__filter_near__default_radius(self, api_client: APIClient) -> None:
+        # given
+        EventFactory(name="Brooklyn Bridge", latitude=40.7061, longitude=-73.9969)
+        EventFactory(name="Newark", latitude=40.7357, longitude=-74.1724)
+
+        # when
+        response = api_client.get(self.endpoint, {"near": "40.7128,-74.0060"})
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert [item["name"] for item in response_data] == ["Brooklyn Bridge"], "Expected a 10 km default radius"
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"near": "40.7128"},
+            {"near": "north,west"},
+            {"near": "91,0"},
+            {"near": "0,nan"},
+            {"near": "40.7128,-74.0060", "radius_km": -1},
+            {"near": "40.7128,-74.0060", "radius_km": 501},
+        ],
+    )
+    def test__filter_near__invalid_params__failed(self, api_client: APIClient, params: dict) -> None:
+        # when
+        response = api_client.get(self.endpoint, params)
+
+        # then
+        self._common_check(response, expected_status=400)
+
+    def test__filter_near__uses_location_index(self) -> None:
+        # given
+        EventFactory(latitude=40.7061, longitude=-73.9969)
+        filterset = EventFilter({"near": "40.7128,-74.0060", "radius_km": "5"}, queryset=Event.objects.all())
+
+        # when
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            # `cube` operators come with fixed selectivity estimates, so sorting every match only loses on large tables.
+            cursor.execute("SET LOCAL enable_sort = off")
+
+        query_plan = filterset.qs[:10].explain()
+
+        # then
+        assert "Index Scan using event_earth_location_idx" in query_plan, "Expected near to use the location index"
+        # Ties on distance may still be sorted incrementally, but never the whole set of matches.
+        assert not re.search(r"(?<!Incremental )Sort  \(", query_plan), "Expected the index to order the rows"
+
+    @staticmethod
+    def _bulk_create_events(build: Callable[[int], Dict[str, Any]], count: int = 2000) -> None:
+        """
+        Insert `count` events, overriding the defaults with `build(number)`, and refresh the table statistics so the
+        planner picks among the indexes on their merits rather than on the estimates of a nearly empty table.
+        """
+        creator, category = UserFactory(), EventCategoryFactory()
+        today = timezone.now().date()
+        defaults = {
+            "creator": creator,
+            "category": category,
+            "location": "Paris, France",
+            "capacity": 100,
+            "description": "",
+            "start_date": today,
+            "end_date": today + timedelta(days=1),
+        }
+        Event.objects.bulk_create(
+            Event(name=f"Event {number}", **{**defaults, **build(number)}) for number in range(count)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE events_event")
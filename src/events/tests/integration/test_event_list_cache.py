@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+import freezegun
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from base.tests import BaseTest
+from events.constants import EventStatus
+from events.tests.factories import EventCategoryFactory, EventFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestEventListCache(BaseTest):
+    endpoint = reverse("event-list")
+
+    def test__list_events__served_from_cache(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        EventFactory()
+        api_client.get(self.endpoint, {"location": "", "page": "1"})
+
+        # when
+        with django_assert_num_queries(0):
+            response = api_client.get(self.endpoint, {"page": "1"})
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()["results"]
+        assert len(response_data) == 1, "Expected the cached page to contain the existing event"
+
+    def test__list_events__values_not_stripped_in_cache_key(self, api_client: APIClient) -> None:
+        # given
+        EventFactory(location="New York")
+        api_client.get(self.endpoint, {"location": "york"})
+
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(self.endpoint, {"location": " york"})
+
+        # then
+        self._common_check(response)
+        assert len(queries) > 0, "Expected a value with whitespace not to share the cache entry of the stripped one"
+
+    def test__list_events__upcoming_not_cached_past_the_day(self, api_client: APIClient) -> None:
+        # given
+        EventFactory(status=EventStatus.Created)
+        api_client.get(self.endpoint, {"upcoming": "true"})
+
+        # when
+        with freezegun.freeze_time(timezone.now() + timedelta(days=2)):
+            response = api_client.get(self.endpoint, {"upcoming": "true"})
+
+        # then
+        self._common_check(response)
+        assert response.json()["results"] == [], "Expected the event that started since to no longer be upcoming"
+
+    def test__list_events__invalidated_on_event_write(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        api_client.get(self.endpoint)
+
+        # when created
+        EventFactory()
+        response = api_client.get(self.endpoint)
+
+        # then
+        self._common_check(response)
+        assert len(response.json()["results"]) == 2, "Expected the new event to be visible right away"
+
+        # when updated
+        event.name = "Renamed event"
+        event.save()
+        response = api_client.get(self.endpoint)
+
+        # then
+        names = {item["name"] for item in response.json()["results"]}
+        assert "Renamed event" in names, "Expected the updated event name to be visible right away"
+
+        # when deleted
+        event.delete()
+        response = api_client.get(self.endpoint)
+
+        # then
+        assert len(response.json()["results"]) == 1, "Expected the deleted event to disappear right away"
+
+    def test__list_events__invalidated_on_category_write(self, api_client: APIClient) -> None:
+        # given
+        category = EventCategoryFactory(name="Sports")
+        EventFactory(category=category)
+        api_client.get(self.endpoint)
+
+        # when
+        category.name = "Outdoor sports"
+        category.save()
+        response = api_client.get(self.endpoint)
+
+        # then
+        self._common_check(response)
+        assert response.json()["results"][0]["category"]["name"] == "Outdoor sports"
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.pagination import KeysetPagination
+from base.tests import BaseTest
+from events.models import Event
+from events.tests.factories import EventFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestEventPagination(BaseTest):
+    endpoint = reverse("event-list")
+    page_size = KeysetPagination.page_size
+
+    def test__cursor_pagination__walks_all_events_in_order(self, api_client: APIClient) -> None:
+        # given
+        events = [EventFactory() for _ in range(self.page_size * 2 + 1)]
+        expected_ids = [str(event.id) for event in Event.objects.order_by("-created_at", "-id")]
+
+        # when
+        received_ids, pages, url = [], 0, self.endpoint
+
+        while url:
+            response = api_client.get(url)
+            self._common_check(response)
+
+            response_data = response.json()
+            assert "count" not in response_data, "Cursor pages should not run a COUNT query"
+
+            received_ids += [item["id"] for item in response_data["results"]]
+            url, pages = response_data["next"], pages + 1
+
+        # then
+        assert received_ids == expected_ids, "Expected every event exactly once, newest first"
+        assert pages == 3
+        assert len(events) == len(received_ids)
+
+    def test__cursor_pagination__ties_on_created_at__success(self, api_client: APIClient) -> None:
+        # given
+        [EventFactory() for _ in range(self.page_size + 2)]
+        Event.objects.update(created_at=datetime(2024, 5, 19, 16, 45, tzinfo=timezone.utc))
+        expected_ids = [str(event_id) for event_id in Event.objects.order_by("-id").values_list("id", flat=True)]
+
+        # when
+        first_page = api_client.get(self.endpoint).json()
+        second_page = api_client.get(first_page["next"]).json()
+        back_to_first_page = api_client.get(second_page["previous"]).json()
+
+        # then
+        first_page_ids = [item["id"] for item in first_page["results"]]
+        second_page_ids = [item["id"] for item in second_page["results"]]
+
+        assert first_page["previous"] is None
+        assert second_page["next"] is None
+        assert first_page_ids + second_page_ids == expected_ids, "Expected ties to be broken by id"
+        assert [item["id"] for item in back_to_first_page["results"]] == first_page_ids
+
+    def test__cursor_pagination__invalid_cursor__failed(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.get(self.endpoint, {"cursor": "not-a-cursor"})
+
+        # then
+        self._common_check(response, expected_status=404)
+
+        response_data = response.json()
+        assert response_data["detail"] == "Invalid cursor."
+
+    def test__page_number_pagination__kept_for_old_clients(self, api_client: APIClient) -> None:
+        # given
+        [EventFactory() for _ in range(self.page_size + 1)]
+
+        # when
+        response = api_client.get(self.endpoint, {"pagination": "page"})
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()
+        assert response_data["count"] == self.page_size + 1
+        assert len(response_data["results"]) == self.page_size
+        assert "page=2" in response_data["next"]
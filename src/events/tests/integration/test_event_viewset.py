@@ -210,6 +210,38 @@ class TestEvent(BaseTest):
         assert response_data["id"] == str(event.id)
         assert response_data["name"] == "Updated event name"
 
+    def test__update_event_single_coordinate__success(self, api_client: APIClient) -> None:
+        # given
+        creator = UserFactory()
+        event = EventFactory(creator=creator, latitude=40.7128, longitude=-74.006)
+
+        # when
+        api_client.force_authenticate(creator)
+
+        response = api_client.patch(reverse("event-detail", args=[str(event.id)]), data={"latitude": 40.758})
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()
+        assert (response_data["latitude"], response_data["longitude"]) == (40.758, -74.006)
+
+    def test__update_event_single_coordinate_without_other__failed(self, api_client: APIClient) -> None:
+        # given
+        creator = UserFactory()
+        event = EventFactory(creator=creator)
+
+        # when
+        api_client.force_authenticate(creator)
+
+        response = api_client.patch(reverse("event-detail", args=[str(event.id)]), data={"latitude": 40.758})
+
+        # then
+        self._common_check(response, expected_status=400)
+
+        response_data = response.json()
+        assert response_data["latitude"] == ["Latitude and longitude must be set together."]
+
     def test__update_event_not_by_creator__failed(self, api_client: APIClient) -> None:
         # given
         guest = UserFactory()
@@ -392,6 +424,46 @@ class TestEvent(BaseTest):
         response_data_unsave = response_unsave.json()
         assert response_data_unsave["detail"] == f"Event {EventSaveAction.Removed.lower()} successfully."
 
+    def test__toggle_save_event__single_query(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        user = UserFactory()
+        event = EventFactory()
+        api_client.force_authenticate(user)
+
+        # when
+        with django_assert_num_queries(1):
+            response = api_client.post(reverse("event-toggle-save", args=[str(event.id)]))
+
+        # then
+        self._common_check(response)
+        assert user.profile.saved_events.filter(id=event.id).exists(), "Expected the event to be saved"
+
+    def test__toggle_save_missing_event__failed(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        event = EventFactory()
+        event_id = event.id
+        event.delete()
+        api_client.force_authenticate(user)
+
+        # when
+        response = api_client.post(reverse("event-toggle-save", args=[str(event_id)]))
+
+        # then
+        self._common_check(response, expected_status=404)
+        assert response.json()["detail"] == "No Event matches the given query."
+
+    def test__toggle_save_malformed_event_id__failed(self, api_client: APIClient) -> None:
+        # given
+        api_client.force_authenticate(UserFactory())
+
+        # when
+        response = api_client.post(reverse("event-toggle-save", args=["not-a-uuid"]))
+
+        # then
+        self._common_check(response, expected_status=400)
+        assert response.json()["detail"] == "Invalid event ID."
+
     def test__toggle_save_event__unauthenticated_user__failed(self, api_client: APIClient) -> None:
         # given
         event = EventFactory()
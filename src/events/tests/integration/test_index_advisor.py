@@ -0,0 +1,183 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.index_advisor import TableInfo, find_issues, parse_conditions
+from base.queries import normalize_sql, record_query_shapes
+from base.query_shapes import query_shape_statistics
+from base.settings import QUERY_SHAPES_CONFIGURATION
+from base.tests import BaseTest
+from events.models import Event
+from events.tests.factories import EventFactory
+from users.models import User
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clean_query_shapes():
+    query_shape_statistics.reset()
+    yield
+    query_shape_statistics.reset()
+
+
+def record(*querysets) -> None:
+    with record_query_shapes() as recorder:
+        for queryset in querysets:
+            list(queryset)
+
+    query_shape_statistics.observe(recorder.shapes)
+    query_shape_statistics.flush()
+
+
+class TestQueryShapeRecording:
+    def test__record_query_shapes__aggregated_by_shape(self) -> None:
+        # given
+        EventFactory.create_batch(2)
+
+        # when
+        with record_query_shapes() as recorder:
+            list(Event.objects.filter(capacity__gt=10))
+            list(Event.objects.filter(capacity__gt=20))
+
+        # then
+        sql = str(Event.objects.filter(capacity__gt=10).query)
+        recorded = recorder.shapes[normalize_sql(sql)]
+        assert recorder.count == 2
+        assert recorded.count == 2
+        assert recorded.duration > 0
+        assert recorded.sample[1] == (10,), "Expected the first statement to be kept as the sample"
+
+    def test__collect__totals_and_samples_from_every_flush(self) -> None:
+        # given
+        record(Event.objects.filter(capacity__gt=10), Event.objects.filter(capacity__gt=20))
+        record(Event.objects.filter(capacity__gt=30))
+
+        # when
+        summaries = query_shape_statistics.collect()
+
+        # then
+        summary = next(summary for summary in summaries if '"capacity" >' in summary.shape)
+        assert summary.count == 3
+        assert summary.sample.endswith('"events_event"."capacity" > 10')
+
+    def test__collect__no_samples_of_inserts_or_sensitive_tables(self) -> None:
+        # given
+        user = UserFactory()
+
+        # when
+        with record_query_shapes() as recorder:
+            User.objects.filter(id=user.id).update(email="secret@eventfor.us")
+            list(User.objects.filter(email="secret@eventfor.us"))
+            EventFactory()
+            list(Event.objects.filter(capacity__gt=10))
+
+        query_shape_statistics.observe(recorder.shapes)
+        summaries = query_shape_statistics.collect()
+
+        # then
+        user_summaries = [summary for summary in summaries if '"users_user"' in summary.shape]
+        insert_summaries = [summary for summary in summaries if summary.shape.startswith("INSERT")]
+        event_summary = next(summary for summary in summaries if '"capacity" >' in summary.shape)
+        assert len(user_summaries) >= 2 and all(summary.sample is None for summary in user_summaries)
+        assert insert_summaries and all(summary.sample is None for summary in insert_summaries)
+        assert event_summary.sample is not None, "Expected queries on other tables to keep their samples"
+
+    def test__collect__sensitive_columns_redacted_in_joins(self) -> None:
+        # when
+        record(
+            Event.objects.select_related("creator").filter(creator__email="secret@eventfor.us", capacity__gt=10),
+            Event.objects.filter(creator__in=User.objects.filter(first_name__in=["Jane", "John"]), capacity__lt=20),
+        )
+
+        # then
+        joined_summary, subquery_summary = sorted(
+            (summary for summary in query_shape_statistics.collect() if summary.shape.startswith("SELECT")),
+            key=lambda summary: "IN (SELECT" in summary.shape,
+        )
+        assert joined_summary.sample.endswith(
+            '"events_event"."capacity" > 10 AND "users_user"."email" = \'redacted\')'
+        ), "Expected a query joining the users to keep its sample, without the email"
+        assert '"capacity" < 20' in subquery_summary.sample
+        assert "'redacted', 'redacted'" in subquery_summary.sample
+        assert "Jane" not in subquery_summary.sample and "John" not in subquery_summary.sample
+
+    def test__middleware__records_requests_when_enabled(self, api_client: APIClient, monkeypatch) -> None:
+        # given
+        monkeypatch.setitem(QUERY_SHAPES_CONFIGURATION, "RECORD", True)
+        EventFactory.create_batch(2)
+
+        # when
+        response = api_client.get(reverse("event-list"))
+
+        # then
+        BaseTest._common_check(response)
+        assert any('FROM "events_event"' in summary.shape for summary in query_shape_statistics.collect())
+
+    def test__middleware__nothing_recorded_when_disabled(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.get(reverse("event-list"))
+
+        # then
+        BaseTest._common_check(response)
+        assert query_shape_statistics.collect() == []
+
+
+class TestIndexAdvisor:
+    def test__parse_conditions__equality_and_range_columns(self) -> None:
+        # given
+        condition = (
+            "((events_event.status)::text = 'created'::text) AND (start_date >= '2024-08-01'::date) "
+            "AND (upper((name)::text) ~~ '%FOO%'::text)"
+        )
+
+        # when
+        equality, ranges = parse_conditions(condition, {"status", "start_date", "name"})
+
+        # then
+        assert equality == ["status"]
+        assert ranges == ["start_date"], "Expected the condition on an expression of `name` to be left out"
+
+    def test__find_issues__existing_index_noted_instead_of_proposed(self) -> None:
+        # given
+        plan = {
+            "Node Type": "Seq Scan",
+            "Relation Name": "events_event",
+            "Total Cost": 100.0,
+            "Filter": "(status = 'created'::text)",
+        }
+        tables = {"events_event": TableInfo(50000, {"status"}, {"event_status_idx": ("status", "start_date")})}
+
+        # when
+        findings = find_issues(plan, tables, min_rows=10000)
+
+        # then
+        assert len(findings) == 1
+        assert findings[0].proposal is None
+        assert "event_status_idx" in findings[0].note
+
+    def test__command__proposes_index_for_sort(self) -> None:
+        # given
+        EventFactory.create_batch(2)
+        record(Event.objects.filter(capacity__gt=10).order_by("capacity"))
+        stdout = StringIO()
+
+        # when
+        call_command("index_advisor", min_rows=0, reset=True, stdout=stdout)
+
+        # then
+        output = stdout.getvalue()
+        assert "Sort on events_event" in output
+        assert 'models.Index(fields=["capacity"]' in output
+        assert 'CREATE INDEX CONCURRENTLY "events_even_capacit_' in output
+        assert query_shape_statistics.collect() == [], "Expected `--reset` to delete the recorded shapes"
+
+    def test__command__nothing_recorded(self) -> None:
+        # when / then
+        with pytest.raises(CommandError):
+            call_command("index_advisor", stdout=StringIO())
@@ -0,0 +1,137 @@
+import logging
+
+import pytest
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.middlewares import NPlusOneDetectionMiddleware
+from base.middlewares import logger as middlewares_logger
+from base.queries import NPlusOneError, normalize_sql
+from base.settings import N_PLUS_ONE_CONFIGURATION
+from events.models import Event
+from events.tests.factories import EventAttendanceFactory, EventFactory
+from users.repositories import UserRepository
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def load_categories_lazily(request) -> HttpResponse:
+    return HttpResponse(", ".join(event.category.name for event in Event.objects.all()))
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class TestListEndpointsQueries:
+    @pytest.mark.no_n_plus_one
+    def test__event_list__no_n_plus_one(self, api_client: APIClient) -> None:
+        # given
+        EventFactory.create_batch(5)
+
+        # when
+        response = api_client.get(reverse("event-list"), {"pagination": "page"})
+
+        # then
+        assert len(response.json()["results"]) == 5
+
+    @pytest.mark.no_n_plus_one
+    def test__saved_events__no_n_plus_one(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        user.profile.saved_events.add(*EventFactory.create_batch(5))
+        api_client.force_authenticate(user)
+
+        # when
+        response = api_client.get(reverse("user_saved_events", kwargs={"uuid": str(user.id)}))
+
+        # then
+        assert len(response.json()["results"]) == 5
+
+    @pytest.mark.no_n_plus_one
+    def test__admin_changelist__no_n_plus_one(self, client: Client) -> None:
+        # given
+        superuser = UserRepository.create_superuser(
+            email="admin@eventfor.us", first_name="Admin", last_name="Admin", password="abc123"
+        )
+        [EventAttendanceFactory() for _ in range(5)]
+        client.force_login(superuser)
+
+        # when
+        response = client.get(reverse("admin:events_event_changelist"))
+
+        # then
+        assert response.status_code == 200
+
+
+class TestNPlusOneDetection:
+    def test__assert_no_n_plus_one__lazy_relation_flagged(self, assert_no_n_plus_one) -> None:
+        # given
+        EventFactory.create_batch(3)
+
+        # when
+        with pytest.raises(pytest.fail.Exception) as exc_info:
+            with assert_no_n_plus_one():
+                [event.category.name for event in Event.objects.all()]
+
+        # then
+        message = str(exc_info.value)
+        assert "3 x events/tests/integration/test_n_plus_one.py" in message, "Expected the loop to be the call site"
+        assert 'WHERE "events_eventcategory"."id" = ? LIMIT ?' in message
+
+    def test__assert_no_n_plus_one__selected_relation_passes(self, assert_no_n_plus_one) -> None:
+        # given
+        EventFactory.create_batch(3)
+
+        # when / then
+        with assert_no_n_plus_one():
+            [event.category.name for event in Event.objects.select_related("category")]
+
+    def test__middleware__warn_mode_logs(self, monkeypatch) -> None:
+        # given
+        EventFactory.create_batch(3)
+        monkeypatch.setitem(N_PLUS_ONE_CONFIGURATION, "MODE", "warn")
+        monkeypatch.setitem(N_PLUS_ONE_CONFIGURATION, "THRESHOLD", 3)
+        handler = RecordingHandler()
+        middlewares_logger.addHandler(handler)
+
+        # when
+        try:
+            response = NPlusOneDetectionMiddleware(load_categories_lazily)(RequestFactory().get("/api/events/"))
+        finally:
+            middlewares_logger.removeHandler(handler)
+
+        # then
+        assert response.status_code == 200
+        assert len(handler.records) == 1
+        assert handler.records[0].query_count == 3
+        assert handler.records[0].call_site.startswith("events/tests/integration/test_n_plus_one.py")
+
+    def test__middleware__raise_mode_raises(self, monkeypatch) -> None:
+        # given
+        EventFactory.create_batch(3)
+        monkeypatch.setitem(N_PLUS_ONE_CONFIGURATION, "MODE", "raise")
+        monkeypatch.setitem(N_PLUS_ONE_CONFIGURATION, "THRESHOLD", 3)
+
+        # when / then
+        with pytest.raises(NPlusOneError, match="GET /api/events/"):
+            NPlusOneDetectionMiddleware(load_categories_lazily)(RequestFactory().get("/api/events/"))
+
+    def test__normalize_sql__literals_and_value_lists(self) -> None:
+        # when
+        shapes = {
+            normalize_sql("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'a''b' LIMIT 21"),
+            normalize_sql("SELECT *  FROM t\nWHERE id IN (%s) AND name = %s LIMIT 1"),
+        }
+
+        # then
+        assert shapes == {"SELECT * FROM t WHERE id IN (...) AND name = ? LIMIT ?"}
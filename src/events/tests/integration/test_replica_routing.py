@@ -0,0 +1,162 @@
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from base.middlewares import ReplicaRoutingMiddleware
+from base.routers import ReplicaRouter, read_from_primary, read_from_replica
+from base.settings import REPLICA_CONFIGURATION
+from events.caches import event_category_registry
+from events.models import Event
+from events.repositories import EventRepository
+from events.tests.factories import EventFactory
+from users.authentication import CachedJWTAuthentication
+from users.caches import auth_user_cache
+from users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def replica_alias(monkeypatch) -> str:
+    # Routing decisions only name the alias, so no replica connection is needed.
+    monkeypatch.setitem(REPLICA_CONFIGURATION, "ALIAS", "replica")
+    return "replica"
+
+
+def get_read_alias(request) -> HttpResponse:
+    return HttpResponse(ReplicaRouter().db_for_read(Event) or DEFAULT_DB_ALIAS)
+
+
+class TestReplicaRouter:
+    def test__reads__primary_by_default(self, replica_alias: str) -> None:
+        # when / then
+        assert ReplicaRouter().db_for_read(Event) is None
+
+    def test__reads__replica_within_block(self, replica_alias: str) -> None:
+        # when
+        with read_from_replica():
+            read_alias = ReplicaRouter().db_for_read(Event)
+
+        # then
+        assert read_alias == replica_alias
+        assert ReplicaRouter().db_for_write(Event) == DEFAULT_DB_ALIAS
+        assert not ReplicaRouter().allow_migrate(replica_alias, "events")
+
+    def test__reads__primary_without_replica(self) -> None:
+        # when
+        with read_from_replica():
+            read_alias = ReplicaRouter().db_for_read(Event)
+
+        # then
+        assert read_alias is None
+
+    def test__analytics__read_from_replica(self, replica_alias: str) -> None:
+        # when / then
+        assert EventRepository.get_monthly_attendance_statistics().db == replica_alias
+        assert EventRepository.get_event_duration_analysis().db == replica_alias
+        assert EventRepository.get_monthly_event_creation_statistics().db == replica_alias
+
+
+class TestReplicaRoutingMiddleware:
+    def test__safe_request__reads_from_replica(self, replica_alias: str) -> None:
+        # when
+        response = ReplicaRoutingMiddleware(get_read_alias)(RequestFactory().get("/api/events/"))
+
+        # then
+        assert response.content.decode() == replica_alias
+        assert REPLICA_CONFIGURATION["COOKIE_NAME"] not in response.cookies
+
+    def test__write_request__pins_client_to_primary(self, replica_alias: str) -> None:
+        # given
+        middleware = ReplicaRoutingMiddleware(get_read_alias)
+
+        # when
+        write_response = middleware(RequestFactory().post("/api/events/"))
+
+        # then
+        assert write_response.content.decode() == DEFAULT_DB_ALIAS
+        cookie = write_response.cookies[REPLICA_CONFIGURATION["COOKIE_NAME"]]
+        assert cookie["max-age"] == REPLICA_CONFIGURATION["STICKY_SECONDS"]
+
+        request = RequestFactory().get("/api/events/")
+        request.COOKIES[cookie.key] = cookie.value
+        assert middleware(request).content.decode() == DEFAULT_DB_ALIAS, "Expected reads to stick to the primary"
+
+
+@pytest.mark.replica
+@pytest.mark.skipif(not REPLICA_CONFIGURATION["ALIAS"], reason="No replica configured, set POSTGRES_REPLICA_HOST")
+@pytest.mark.django_db(transaction=True, databases=[DEFAULT_DB_ALIAS, "replica"])
+class TestMirroredReplica:
+    def test__retrieve__served_by_replica(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        event_category_registry.get_categories()
+
+        # when
+        with CaptureQueriesContext(connections["replica"]) as replica_queries:
+            response = api_client.get(reverse("event-detail", args=[str(event.id)]))
+
+        # then
+        assert response.status_code == 200
+        assert len(replica_queries) == 1, "Expected the event lookup to run on the replica"
+
+    def test__write__served_by_primary(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        api_client.force_authenticate(event.creator)
+
+        # when
+        with CaptureQueriesContext(connections["replica"]) as replica_queries:
+            response = api_client.patch(reverse("event-detail", args=[str(event.id)]), {"name": "Renamed"})
+
+        # then
+        assert response.status_code == 200
+        assert len(replica_queries) == 0
+        assert REPLICA_CONFIGURATION["COOKIE_NAME"] in response.cookies
+
+
+@pytest.mark.django_db
+class TestCacheFillingReads:
+    """
+    The replica alias has no connection behind it, so any read routed to it fails.
+    """
+
+    @pytest.fixture(autouse=True)
+    def unreachable_replica(self, monkeypatch) -> None:
+        monkeypatch.setitem(REPLICA_CONFIGURATION, "ALIAS", "unreachable_replica")
+
+    def test__auth_user__cached_from_primary(self) -> None:
+        # given
+        user = UserFactory()
+        auth_user_cache.delete(user.id)
+
+        # when
+        with read_from_replica():
+            authenticated_user = CachedJWTAuthentication().get_user(AccessToken.for_user(user))
+
+        # then
+        assert authenticated_user == user
+        assert auth_user_cache.get(user.id) == user
+
+    def test__read_from_primary__overrides_replica_block(self) -> None:
+        # when
+        with read_from_replica(), read_from_primary():
+            read_alias = ReplicaRouter().db_for_read(Event)
+
+        # then
+        assert read_alias is None
+
+    def test__cache_miss__lists_read_from_primary(self, api_client: APIClient) -> None:
+        # given
+        EventFactory()
+
+        # when
+        events_response = api_client.get(reverse("event-list"))
+        categories_response = api_client.get(reverse("categories_list"))
+
+        # then
+        assert events_response.status_code == 200
+        assert categories_response.status_code == 200
@@ -0,0 +1,82 @@
+import json
+import logging
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.loggers import JSONFormatter, QueueListenerHandler
+from base.middlewares import request_logger
+from base.settings import LOGGER_CONFIGURATION
+from events.caches import event_category_registry
+from events.tests.factories import EventFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def request_records():
+    handler = RecordingHandler()
+    request_logger.addHandler(handler)
+    yield handler.records
+    request_logger.removeHandler(handler)
+
+
+class TestRequestLogging:
+    def test__request_logged__structured(self, api_client: APIClient, request_records) -> None:
+        # given
+        event = EventFactory()
+        event_category_registry.get_categories()
+
+        # when
+        api_client.get(reverse("event-detail", args=[str(event.id)]))
+
+        # then
+        assert len(request_records) == 1, "Expected one record per request"
+
+        payload = json.loads(JSONFormatter().format(request_records[0]))
+        assert payload["message"] == f"GET /api/events/{event.id}/ 200"
+        assert payload["view"] == "event-detail"
+        assert payload["status"] == 200
+        assert payload["query_count"] == 1, "Expected the event lookup to be counted"
+        assert payload["duration_ms"] > 0
+
+    def test__successful_requests_sampled(self, api_client: APIClient, request_records, monkeypatch) -> None:
+        # given
+        monkeypatch.setattr("base.middlewares.random.random", lambda: 0.5)
+        monkeypatch.setitem(LOGGER_CONFIGURATION, "REQUEST_SAMPLE_RATE", 0.1)
+
+        # when
+        api_client.get(reverse("categories_list"))
+        api_client.get(reverse("event-detail", args=["5b1f0a8e-3b7c-4a53-9d5f-3f4b1f8c2d10"]))
+
+        # then
+        assert [record.status for record in request_records] == [404], "Expected only the error to be logged"
+
+
+class TestQueueListenerHandler:
+    def test__configured_handlers_resolved(self) -> None:
+        # when
+        queue_handler = next(
+            handler for handler in logging.getLogger("base").handlers if isinstance(handler, QueueListenerHandler)
+        )
+
+        # then
+        assert all(
+            isinstance(handler, logging.StreamHandler) for handler in queue_handler.handlers
+        ), "Expected the `cfg://` references of the logging settings to resolve to the configured handlers"
+
+    def test__unresolved_handlers__failed(self) -> None:
+        # when / then
+        with pytest.raises(ValueError):
+            QueueListenerHandler(handlers=["file"])
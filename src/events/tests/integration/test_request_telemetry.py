@@ -0,0 +1,124 @@
+import re
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.metrics import request_metrics
+from base.tests import BaseTest
+from events.caches import event_category_registry
+from events.tests.factories import EventFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    request_metrics.reset()
+    yield
+    request_metrics.reset()
+
+
+def parse_server_timing(header: str) -> dict:
+    return {entry.split(";", 1)[0].strip(): entry for entry in header.split(",")}
+
+
+class TestServerTiming:
+    def test__server_timing__reports_queries_cache_and_serialization(self, api_client: APIClient) -> None:
+        # given
+        EventFactory.create_batch(3)
+
+        # when
+        response = api_client.get(reverse("event-list"))
+
+        # then
+        BaseTest._common_check(response)
+
+        timings = parse_server_timing(response["Server-Timing"])
+        assert set(timings) == {"db", "cache", "serialize", "total"}
+        assert re.search(r'desc="[1-9]\d* queries"', timings["db"]), "Expected the list queries to be counted"
+        assert 'desc="hits=0 misses=1"' in timings["cache"], "Expected the cold list cache to miss"
+        assert float(re.search(r"dur=([\d.]+)", timings["serialize"]).group(1)) > 0
+
+    def test__server_timing__cached_response_skips_database(self, api_client: APIClient) -> None:
+        # given
+        EventFactory.create_batch(3)
+        api_client.get(reverse("event-list"))
+
+        # when
+        response = api_client.get(reverse("event-list"))
+
+        # then
+        timings = parse_server_timing(response["Server-Timing"])
+        assert 'desc="0 queries"' in timings["db"]
+        assert 'desc="hits=1 misses=0"' in timings["cache"]
+
+
+class TestMetricsEndpoint(BaseTest):
+    endpoint = reverse("metrics")
+
+    def test__metrics__histograms_per_view(self, api_client: APIClient) -> None:
+        # given
+        event = EventFactory()
+        event_category_registry.get_categories()
+        api_client.get(reverse("event-detail", args=[str(event.id)]))
+        api_client.get(reverse("event-detail", args=[str(event.id)]))
+        api_client.get(reverse("event-list"))
+
+        # when
+        response = api_client.get(self.endpoint)
+
+        # then
+        self._common_check(response, expected_content_type="text/plain; version=0.0.4; charset=utf-8")
+
+        body = response.content.decode()
+        assert "# TYPE eventfor_request_duration_seconds histogram" in body
+        assert 'eventfor_request_duration_seconds_count{view="event-detail"} 2' in body
+        assert 'eventfor_request_duration_seconds_bucket{view="event-detail",le="+Inf"} 2' in body
+        assert 'eventfor_db_queries_sum{view="event-detail"} 2' in body, "Expected one query per retrieve"
+        assert 'eventfor_cache_misses_total{view="event-list"} 1' in body
+
+    def test__metrics__aggregated_through_redis(self, api_client: APIClient) -> None:
+        # given
+        request_metrics.observe("event-list", {"request_duration_seconds": 0.02, "db_queries": 3}, {})
+        request_metrics.flush()
+        # Another worker process flushing into the same hash.
+        request_metrics.observe("event-list", {"request_duration_seconds": 0.2, "db_queries": 1}, {})
+        request_metrics.flush()
+
+        # when
+        response = api_client.get(self.endpoint)
+
+        # then
+        body = response.content.decode()
+        assert 'eventfor_request_duration_seconds_bucket{view="event-list",le="0.025"} 1' in body
+        assert 'eventfor_request_duration_seconds_bucket{view="event-list",le="0.25"} 2' in body
+        assert 'eventfor_db_queries_sum{view="event-list"} 4' in body
+
+    def test__metrics__external_address_forbidden(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.get(self.endpoint, REMOTE_ADDR="203.0.113.7")
+
+        # then
+        self._common_check(response, expected_status=403)
+
+    def test__metrics__internal_address_behind_trusted_proxy(self, api_client: APIClient, monkeypatch) -> None:
+        # given
+        monkeypatch.setattr("base.views.TRUSTED_PROXIES", ["10.0.0.2"])
+
+        # when
+        response = api_client.get(self.endpoint, REMOTE_ADDR="10.0.0.2", HTTP_X_FORWARDED_FOR="127.0.0.1")
+
+        # then
+        self._common_check(response, expected_content_type="text/plain; version=0.0.4; charset=utf-8")
+
+    def test__metrics__forwarded_address_of_untrusted_client_ignored(self, api_client: APIClient, monkeypatch) -> None:
+        # given
+        monkeypatch.setattr("base.views.TRUSTED_PROXIES", ["10.0.0.2"])
+
+        # when
+        response = api_client.get(self.endpoint, REMOTE_ADDR="10.0.0.2", HTTP_X_FORWARDED_FOR="127.0.0.1, 203.0.113.7")
+
+        # then
+        self._common_check(response, expected_status=403)
@@ -0,0 +1,58 @@
+import pytest
+from django.core.management import call_command
+
+from events.models import Event
+from events.repositories import EventRepository
+from events.tests.factories import EventAttendanceFactory, EventFactory
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test__toggle_attendance__maintains_attendees_count():
+    # given
+    event = EventFactory(capacity=10)
+    users = [UserFactory() for _ in range(3)]
+
+    # when
+    for user in users:
+        EventRepository.toggle_attendance(user=user, event_id=event.id)
+
+    EventRepository.toggle_attendance(user=users[0], event_id=event.id)
+
+    # then
+    event.refresh_from_db()
+    assert event.attendees_count == 2, "Expected the counter to follow reservations and cancellations"
+
+
+def test__toggle_attendance__full_event__not_open():
+    # given
+    event = EventFactory(capacity=1)
+    attendee = UserFactory()
+    EventRepository.toggle_attendance(user=attendee, event_id=event.id)
+
+    # when
+    reserved = EventRepository.toggle_attendance(user=UserFactory(), event_id=event.id)
+    canceled = EventRepository.toggle_attendance(user=attendee, event_id=event.id)
+
+    # then
+    assert reserved is None, "A full event should not be open for attendance"
+    assert canceled is False, "An attendee should still be able to cancel a full event"
+
+
+def test__reconcile_attendees_count__repairs_drift():
+    # given
+    drifted_event, consistent_event = EventFactory(), EventFactory()
+    [EventAttendanceFactory(event=drifted_event) for _ in range(3)]
+    Event.objects.filter(id=consistent_event.id).update(attendees_count=0)
+
+    # when
+    call_command("reconcile_attendees_count", batch_size=1)
+
+    # then
+    drifted_event.refresh_from_db()
+    consistent_event.refresh_from_db()
+
+    assert drifted_event.attendees_count == 3, "Expected the drifted counter to be repaired"
+    assert consistent_event.attendees_count == 0, "Expected the consistent counter to stay untouched"
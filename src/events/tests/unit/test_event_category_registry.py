@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from events.caches import event_category_registry
+from events.models import EventCategory
+from events.repositories import EventRepository
+from events.serializers import EventReadSerializer, EventSerializer
+from events.tests.factories import EventCategoryFactory, EventFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def get_category_queries(queries: CaptureQueriesContext) -> list:
+    return [query["sql"] for query in queries if EventCategory._meta.db_table in query["sql"]]
+
+
+def test__registry__loaded_once(django_assert_num_queries) -> None:
+    # given
+    category = EventCategoryFactory()
+
+    # when
+    with django_assert_num_queries(1):
+        event_category_registry.get_categories()
+        categories = event_category_registry.get_categories()
+
+    # then
+    assert categories[category.id].name == category.name
+
+
+def test__registry__refreshed_on_category_write() -> None:
+    # given
+    category = EventCategoryFactory(name="Sports")
+    event_category_registry.get_categories()
+
+    # when
+    category.name = "Outdoor sports"
+    category.save()
+    created_category = EventCategoryFactory()
+
+    # then
+    categories = event_category_registry.get_categories()
+    assert categories[category.id].name == "Outdoor sports"
+    assert created_category.id in categories
+
+    # when
+    created_category.delete()
+
+    # then
+    assert created_category.id not in event_category_registry.get_categories()
+
+
+def test__event_serializer__category_validated_without_query() -> None:
+    # given
+    category = EventCategoryFactory()
+    event_category_registry.get_categories()
+    data = {
+        "category": str(category.id),
+        "name": "Concert",
+        "location": "York",
+        "capacity": 100,
+        "description": "Live music",
+        "start_date": date.today() + timedelta(days=1),
+        "end_date": date.today() + timedelta(days=2),
+    }
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        serializer = EventSerializer(data=data)
+        is_valid = serializer.is_valid()
+
+    # then
+    assert is_valid, serializer.errors
+    assert serializer.validated_data["category"] == category
+    assert serializer.validated_data["category"] is not event_category_registry.get_categories()[category.id]
+    assert not get_category_queries(queries)
+
+
+def test__event_serializer__unknown_category_rejected() -> None:
+    # given
+    category_id = uuid4()
+
+    # when
+    serializer = EventSerializer(data={"category": str(category_id)}, partial=True)
+
+    # then
+    assert not serializer.is_valid()
+    assert serializer.errors["category"] == [f'Invalid pk "{category_id}" - object does not exist.']
+
+
+def test__event_read_serializer__category_rendered_without_join() -> None:
+    # given
+    event = EventFactory()
+    event_category_registry.get_categories()
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        data = EventReadSerializer(EventRepository.get_all().get(id=event.id)).data
+
+    # then
+    assert data["category"]["name"] == event.category.name
+    assert not get_category_queries(queries)
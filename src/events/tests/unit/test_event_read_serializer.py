@@ -0,0 +1,27 @@
+import json
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from events.repositories import EventRepository
+from events.serializers import EventReadSerializer, EventSerializer
+from events.tests.factories import EventCategoryFactory, EventFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test__event_read_serializer__matches_event_serializer():
+    # given
+    EventFactory()
+    EventFactory(category=EventCategoryFactory(description=None))
+    EventFactory(latitude=40.7128, longitude=-74.006)
+    events = list(EventRepository.get_all())
+
+    # when
+    expected = JSONRenderer().render(EventSerializer(events, many=True).data)
+    actual = JSONRenderer().render(EventReadSerializer(events, many=True).data)
+
+    # then
+    assert actual == expected, "Expected the fast read path to render byte-identical JSON"
+    assert list(json.loads(actual)[0]) == list(json.loads(expected)[0]), "Expected the same key order"
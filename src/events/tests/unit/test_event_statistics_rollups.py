@@ -0,0 +1,64 @@
+from datetime import date, datetime, timedelta
+
+import freezegun
+import pytest
+from django.core.management import call_command
+
+from events.models import EventAttendance
+from events.repositories import EventRepository, EventStatisticsRepository
+from events.tests.factories import EventAttendanceFactory, EventFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def create_activity(moment: datetime, attendances: int = 1) -> None:
+    with freezegun.freeze_time(moment):
+        event = EventFactory(start_date=moment.date(), end_date=moment.date() + timedelta(days=3))
+        [EventAttendanceFactory(event=event) for _ in range(attendances)]
+
+
+def test__refresh_rollups__builds_statistics():
+    # given
+    create_activity(datetime(2024, 3, 10), attendances=2)
+    create_activity(datetime(2024, 4, 5), attendances=1)
+
+    # when
+    with freezegun.freeze_time(datetime(2024, 4, 20)):
+        call_command("refresh_event_statistics")
+
+    # then
+    assert list(EventRepository.get_monthly_attendance_statistics()) == [
+        {"month": date(2024, 3, 1), "total_attendees": 2},
+        {"month": date(2024, 4, 1), "total_attendees": 1},
+    ]
+    assert [row["total"] for row in EventRepository.get_monthly_event_creation_statistics()] == [1, 1]
+    assert list(EventRepository.get_event_duration_analysis()) == [{"duration_category": "Medium", "total": 2}]
+
+
+def test__refresh_rollups__incremental_from_high_water_mark():
+    # given
+    create_activity(datetime(2024, 3, 10), attendances=2)
+
+    with freezegun.freeze_time(datetime(2024, 4, 20)):
+        EventStatisticsRepository.refresh_rollups()
+
+    create_activity(datetime(2024, 4, 25), attendances=3)
+    EventAttendance.objects.filter(timestamp__month=3).first().delete()
+
+    # when
+    with freezegun.freeze_time(datetime(2024, 5, 2)):
+        EventStatisticsRepository.refresh_rollups()
+
+    # then
+    assert list(EventRepository.get_monthly_attendance_statistics()) == [
+        {"month": date(2024, 3, 1), "total_attendees": 2},
+        {"month": date(2024, 4, 1), "total_attendees": 3},
+    ], "Expected only the months since the high-water mark to be recomputed"
+
+    # when
+    with freezegun.freeze_time(datetime(2024, 5, 2)):
+        EventStatisticsRepository.refresh_rollups(rebuild=True)
+
+    # then
+    assert list(EventRepository.get_monthly_attendance_statistics())[0]["total_attendees"] == 1
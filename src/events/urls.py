@@ -1,14 +1,49 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from events.views import EventCategoryListView, EventViewSet
+from base import settings
+from base.views import dispatch_by_method
+from events.views import (
+    AsyncEventCategoryListView,
+    AsyncEventDetailView,
+    AsyncEventListView,
+    EventCategoryListView,
+    EventViewSet,
+)
 
 
 router = DefaultRouter()
 router.register(r"", EventViewSet)
 
 
-urlpatterns = [
+if settings.ASYNC_READ_VIEWS:
+    # Read paths are served natively async under ASGI, writes keep going through the sync viewset.
+    urlpatterns = [
+        path(
+            "events/",
+            dispatch_by_method(
+                read_view=AsyncEventListView.as_view(),
+                write_view=EventViewSet.as_view({"post": "create"}),
+            ),
+            name="event-list",
+        ),
+        path("events/bulk/", EventViewSet.as_view({"post": "bulk_create"}), name="event-bulk-create"),
+        path("events/export/", EventViewSet.as_view({"get": "export"}), name="event-export"),
+        path(
+            "events/<str:pk>/",
+            dispatch_by_method(
+                read_view=AsyncEventDetailView.as_view(),
+                write_view=EventViewSet.as_view({"put": "update", "patch": "partial_update", "delete": "destroy"}),
+            ),
+            name="event-detail",
+        ),
+        path("categories/", AsyncEventCategoryListView.as_view(), name="categories_list"),
+    ]
+else:
+    urlpatterns = [
+        path("categories/", EventCategoryListView.as_view(), name="categories_list"),
+    ]
+
+urlpatterns += [
     path("events/", include(router.urls)),
-    path("categories/", EventCategoryListView.as_view(), name="categories_list"),
 ]
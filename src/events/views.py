@@ -1,58 +1,274 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Type, Union
+from uuid import UUID
 
-from django.http import JsonResponse
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListAPIView
-from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.parsers import JSONParser
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
 from rest_framework.viewsets import ModelViewSet
 
-from base.settings import REDIS_CONFIGURATION
+from base.conditional import build_list_etag, get_not_modified_response, set_validators
+from base.constants import ExportFormat
+from base.exports import build_export_response
+from base.pagination import AsyncPageNumberPagination, KeysetOrPageNumberPagination
+from base.parsers import NDJSONParser
+from base.routers import read_from_primary
+from base.settings import EVENTS_CONFIGURATION
 from base.utils import build_response
-from events.constants import EventAttendanceIntent, EventSaveAction
+from base.views import AsyncReadView
+from events.caches import (
+    event_categories_cache,
+    event_category_registry,
+    events_list_cache,
+    get_event_categories_cache_params,
+    get_event_validators,
+    get_events_list_cache_params,
+)
+from events.constants import EVENT_ATTENDANCE_EXPORT_FIELDS, EVENT_EXPORT_FIELDS, EventAttendanceIntent, EventSaveAction
 from events.filters import EventFilter
-from events.permissions import IsEventCreator
-from events.repositories import EventCategoryRepository, EventRepository
-from events.serializers import EventCategorySerializer, EventSerializer
+from events.permissions import IsEventCreator, IsEventOrganizer
+from events.repositories import EventAttendanceRepository, EventCategoryRepository, EventRepository
+from events.serializers import EventBulkCreateSerializer, EventCategorySerializer, EventReadSerializer, EventSerializer
 from users.repositories import UserProfileRepository
 
 
 class EventCategoryListView(ListAPIView):
-    queryset = EventCategoryRepository.get_all()
+    queryset = EventCategoryRepository.get_all().order_by("name")
     serializer_class = EventCategorySerializer
 
-    @method_decorator(cache_page(timeout=REDIS_CONFIGURATION["TIMEOUT"], key_prefix="event_category_list"))
-    def list(self, request: Request, *args: str, **kwargs: Dict[str, Any]):
-        return super().list(request, *args, **kwargs)
+    def list(self, request: Request, *args: str, **kwargs: Dict[str, Any]) -> Union[Response, HttpResponse]:
+        params = get_event_categories_cache_params(request, self.paginator.page_query_param)
+        cache_key = event_categories_cache.build_key(params)
+        etag, data = event_categories_cache.get(cache_key) or (None, None)
+        if etag is None:
+            with read_from_primary():
+                etag = build_list_etag(EventCategoryRepository.get_watermark(self.get_queryset(), "updated_at"), params)
+            event_categories_cache.set(cache_key, (etag, None))
+
+        if (not_modified_response := get_not_modified_response(request, etag)) is not None:
+            return not_modified_response
+
+        if data is not None:
+            return set_validators(Response(data), etag)
+
+        with read_from_primary():
+            response = super().list(request, *args, **kwargs)
+        event_categories_cache.set(cache_key, (etag, response.data))
+        return set_validators(response, etag)
 
 
 class EventViewSet(ModelViewSet):
     queryset = EventRepository.get_all()
     serializer_class = EventSerializer
     filterset_class = EventFilter
+    pagination_class = KeysetOrPageNumberPagination
     permission_classes = (IsAuthenticatedOrReadOnly, IsEventCreator)
 
+    def get_serializer_class(self) -> Type[BaseSerializer]:
+        if self.request.method in SAFE_METHODS:
+            return EventReadSerializer
+
+        return super().get_serializer_class()
+
     def perform_create(self, serializer: EventSerializer) -> None:
         serializer.save(creator=self.request.user)
 
-    @method_decorator(cache_page(timeout=REDIS_CONFIGURATION["TIMEOUT"], key_prefix="events_list"))
-    def list(self, request: Request, *args: str, **kwargs: Dict[str, Any]):
-        return super().list(request, *args, **kwargs)
+    def list(self, request: Request, *args: str, **kwargs: Dict[str, Any]) -> Union[Response, HttpResponse]:
+        """
+        Serve the page from the list cache, revalidating it against the ETag cached with it.
+
+        On a miss, the ETag comes from a count/`MAX(updated_at)` probe of the filtered events and is cached right away
+        on its own, so clients that already hold the page get a 304 without the page ever being read or serialized,
+        and only the probe's first run touches the database. The probe runs before the page is read, so a write in
+        between can only make the page newer than its ETag, which costs one more full response instead of hiding
+        the write. Both are read from the primary, since they are cached.
+        """
+        params = get_events_list_cache_params(request, self.paginator.query_params)
+        cache_key = events_list_cache.build_key(params)
+        etag, data = events_list_cache.get(cache_key) or (None, None)
+        if etag is None:
+            with read_from_primary():
+                etag = build_list_etag(
+                    EventRepository.get_events_watermark(self.filter_queryset(self.get_queryset())), params
+                )
+            events_list_cache.set(cache_key, (etag, None))
+
+        if (not_modified_response := get_not_modified_response(request, etag)) is not None:
+            return not_modified_response
+
+        if data is not None:
+            return set_validators(Response(data), etag)
+
+        with read_from_primary():
+            response = super().list(request, *args, **kwargs)
+        events_list_cache.set(cache_key, (etag, response.data))
+        return set_validators(response, etag)
+
+    def retrieve(self, request: Request, *args: str, **kwargs: Dict[str, Any]) -> Union[Response, HttpResponse]:
+        event = self.get_object()
+        etag, last_modified = get_event_validators(event, event_category_registry.get_categories())
+        if (not_modified_response := get_not_modified_response(request, etag, last_modified)) is not None:
+            return not_modified_response
+
+        return set_validators(Response(self.get_serializer(event).data), etag, last_modified)
+
+    @action(
+        detail=False,
+        methods=["POST"],
+        url_path="bulk",
+        permission_classes=[IsAuthenticated],
+        parser_classes=[JSONParser, NDJSONParser],
+    )
+    def bulk_create(self, request: Request) -> Response:
+        if not isinstance(request.data, (list, Iterator)):
+            raise ValidationError({"non_field_errors": ["Expected a list of events."]})
+
+        serializer = EventBulkCreateSerializer(context=self.get_serializer_context())
+        created, errors = serializer.create_many(
+            request.data,
+            creator=request.user,
+            batch_size=EVENTS_CONFIGURATION["BULK_CREATE_BATCH_SIZE"],
+            max_rows=EVENTS_CONFIGURATION["BULK_CREATE_MAX_ROWS"],
+        )
+
+        if created:
+            # `bulk_create` sends no `post_save`, so the list cache has to be invalidated here.
+            events_list_cache.bump_version()
+
+        return Response(
+            {"created": created, "errors": errors},
+            status=201 if created or not errors else 400,
+        )
+
+    @action(detail=False, methods=["GET"], permission_classes=[IsAuthenticated])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        queryset = EventRepository.get_export_queryset(self.filter_queryset(self.get_queryset()))
+        return build_export_response(request, queryset, EVENT_EXPORT_FIELDS, self._get_export_format(request), "events")
+
+    @action(
+        detail=True,
+        methods=["GET"],
+        url_path="attendance/export",
+        permission_classes=[IsAuthenticated, IsEventOrganizer],
+    )
+    def export_attendance(self, request: Request, pk: str) -> StreamingHttpResponse:
+        event = self.get_object()
+        return build_export_response(
+            request,
+            EventAttendanceRepository.get_event_attendance_export(event_ids=[event.id]),
+            EVENT_ATTENDANCE_EXPORT_FIELDS,
+            self._get_export_format(request),
+            f"event_{event.id}_attendance",
+        )
 
     @action(detail=True, methods=["POST"], permission_classes=[IsAuthenticated])
     def attend(self, request: Request, pk: str = None) -> JsonResponse:
-        if not (event := EventRepository.get_open_event_for_attendance(event_id=pk)):
+        if (event_participated := EventRepository.toggle_attendance(user=request.user, event_id=pk)) is None:
             return build_response(detail="The event is not open for attendance.", status=400)
 
-        event_participated = EventRepository.toggle_attendance(user=request.user, event=event)
         attendance_intent = EventAttendanceIntent.Reserved if event_participated else EventAttendanceIntent.Canceled
         return build_response(detail=f"Attendance {attendance_intent.lower()}.")
 
     @action(detail=True, methods=["POST"], permission_classes=[IsAuthenticated])
     def toggle_save(self, request: Request, pk: str) -> JsonResponse:
-        event = EventRepository.get(id=pk)
-        event_saved = UserProfileRepository.toggle_save_event(profile=request.user.profile, event=event)
+        # The statement binds the ID as is, so a malformed one would fail in the database instead of matching nothing.
+        try:
+            event_id = UUID(pk)
+        except ValueError:
+            return build_response(detail="Invalid event ID.", status=400)
+
+        if (event_saved := UserProfileRepository.toggle_save_event(user_id=request.user.id, event_id=event_id)) is None:
+            raise Http404("No Event matches the given query.")
+
         toggle_action = EventSaveAction.Saved if event_saved else EventSaveAction.Removed
         return build_response(detail=f"Event {toggle_action.lower()} successfully.")
+
+    @staticmethod
+    def _get_export_format(request: Request) -> str:
+        export_format = request.query_params.get("export_format", ExportFormat.CSV)
+        if export_format not in (ExportFormat.CSV, ExportFormat.NDJSON):
+            raise ValidationError({"export_format": [f'"{export_format}" is not a valid choice.']})
+
+        return export_format
+
+
+class AsyncEventCategoryListView(AsyncReadView):
+    pagination_class = AsyncPageNumberPagination
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        request = Request(request)
+        paginator = self.pagination_class()
+        params = get_event_categories_cache_params(request, paginator.page_query_param)
+        cache_key = await event_categories_cache.abuild_key(params)
+        queryset = EventCategoryRepository.get_all().order_by("name")
+        etag, data = await event_categories_cache.aget(cache_key) or (None, None)
+        if etag is None:
+            with read_from_primary():
+                etag = build_list_etag(await EventCategoryRepository.aget_watermark(queryset, "updated_at"), params)
+            await event_categories_cache.aset(cache_key, (etag, None))
+
+        if (not_modified_response := get_not_modified_response(request, etag)) is not None:
+            return not_modified_response
+
+        if data is not None:
+            return set_validators(JsonResponse(data), etag)
+
+        with read_from_primary():
+            categories = await paginator.apaginate_queryset(queryset, request)
+        data = paginator.get_paginated_data(EventCategorySerializer(categories, many=True).data)
+
+        await event_categories_cache.aset(cache_key, (etag, data))
+        return set_validators(JsonResponse(data), etag)
+
+
+class AsyncEventListView(AsyncReadView):
+    filterset_class = EventFilter
+    pagination_class = KeysetOrPageNumberPagination
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        request = Request(request)
+        paginator = self.pagination_class()
+        params = get_events_list_cache_params(request, paginator.query_params)
+        cache_key = await events_list_cache.abuild_key(params)
+        filterset = self.filterset_class(request.query_params, queryset=EventRepository.get_all(), request=request)
+        if not filterset.is_valid():
+            return JsonResponse(filterset.errors, status=400)
+
+        etag, data = await events_list_cache.aget(cache_key) or (None, None)
+        if etag is None:
+            with read_from_primary():
+                etag = build_list_etag(await EventRepository.aget_events_watermark(filterset.qs), params)
+            await events_list_cache.aset(cache_key, (etag, None))
+
+        if (not_modified_response := get_not_modified_response(request, etag)) is not None:
+            return not_modified_response
+
+        if data is not None:
+            return set_validators(JsonResponse(data), etag)
+
+        with read_from_primary():
+            events = await paginator.apaginate_queryset(filterset.qs, request)
+        categories = await event_category_registry.aget_categories()
+        data = paginator.get_paginated_data(
+            EventReadSerializer(events, many=True, context={"categories": categories}).data
+        )
+
+        await events_list_cache.aset(cache_key, (etag, data))
+        return set_validators(JsonResponse(data), etag)
+
+
+class AsyncEventDetailView(AsyncReadView):
+    async def get(self, request: HttpRequest, pk: str) -> HttpResponse:
+        event = await EventRepository.aget(id=pk)
+        categories = await event_category_registry.aget_categories()
+        etag, last_modified = get_event_validators(event, categories)
+        if (not_modified_response := get_not_modified_response(request, etag, last_modified)) is not None:
+            return not_modified_response
+
+        data = EventReadSerializer(event, context={"categories": categories}).data
+        return set_validators(JsonResponse(data), etag, last_modified)
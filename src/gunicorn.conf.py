@@ -0,0 +1,10 @@
+# ASGI counterpart of uwsgi.ini: `gunicorn -c src/gunicorn.conf.py` serves base.asgi with uvicorn workers,
+# where the read endpoints run as native async views (see ASYNC_READ_VIEWS in base/settings.py).
+# Unlike uWSGI it speaks plain HTTP, so nginx has to use `proxy_pass` instead of `uwsgi_pass`.
+
+wsgi_app = "base.asgi:application"
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = 4
+bind = ":8000"
+keepalive = 5
+errorlog = "src/logs/gunicorn.log"
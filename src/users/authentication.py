@@ -0,0 +1,35 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from base.routers import read_from_primary
+from users.caches import auth_user_cache
+from users.models import User
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    `JWTAuthentication` that resolves the token's user through `auth_user_cache` (in-process LRU, then Redis) and
+    only falls back to the database on a miss, so authenticated requests cost no user query in the steady state.
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if (user := auth_user_cache.get(user_id)) is None:
+            # The parent lookup raises for missing and inactive users, so only active users are ever cached.
+            with read_from_primary():
+                user = super().get_user(validated_token)
+            auth_user_cache.set(user)
+        elif not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        elif api_settings.CHECK_REVOKE_TOKEN:
+            # The password hash is not cached, so revocation checks have to go through the database.
+            user = super().get_user(validated_token)
+
+        return user
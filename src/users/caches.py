@@ -0,0 +1,172 @@
+from datetime import datetime
+from math import ceil
+from typing import Any, Iterable, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from base.cache import LocalLRUCache
+from base.settings import CACHE_CONFIGURATION
+from base.telemetry import record_cache_access
+from users.models import User
+
+
+class AuthUserCache:
+    """
+    Two-tier cache of the users resolved from access tokens: a bounded in-process LRU in front of Redis.
+
+    Entries hold the user's field values rather than model instances, so every request gets its own `User` object and
+    nothing a view attaches to `request.user` leaks into the next request. The password hash is left out and stays
+    deferred on the rebuilt instance.
+    """
+
+    excluded_fields = ("password",)
+
+    def __init__(self, namespace: str, timeout: int, local_cache: LocalLRUCache) -> None:
+        self.namespace = namespace
+        self.timeout = timeout
+        self.local_cache = local_cache
+        self.field_names = tuple(
+            field.attname for field in User._meta.concrete_fields if field.attname not in self.excluded_fields
+        )
+
+    def get_key(self, user_id: Any) -> str:
+        return f"{self.namespace}:{user_id}"
+
+    def get(self, user_id: Any) -> Optional[User]:
+        key = self.get_key(user_id)
+
+        if (values := self.local_cache.get(key)) is None:
+            if (values := cache.get(key)) is None:
+                record_cache_access(hit=False)
+                return None
+
+            self.local_cache.set(key, values)
+
+        record_cache_access(hit=True)
+        return User.from_db(DEFAULT_DB_ALIAS, self.field_names, values)
+
+    def set(self, user: User) -> None:
+        key = self.get_key(user.pk)
+        values = self._get_values(user)
+        cache.set(key, values, timeout=self.timeout)
+        self.local_cache.set(key, values)
+
+    def delete(self, user_id: Any) -> None:
+        key = self.get_key(user_id)
+        self.local_cache.delete(key)
+        cache.delete(key)
+
+    def _get_values(self, user: User) -> Tuple[Any, ...]:
+        return tuple(getattr(user, field_name) for field_name in self.field_names)
+
+
+class TokenBlacklist:
+    """
+    Redis store of blacklisted refresh token `jti`s.
+
+    Every entry expires together with its token: an expired token is rejected by signature verification on its own, so
+    the blacklist never holds more than the tokens that are still alive. Redis has to be configured not to evict keys
+    without a TTL preference (e.g. `volatile-ttl` or `noeviction`), or a blacklisted token could become usable again.
+    """
+
+    def __init__(self, namespace: str) -> None:
+        self.namespace = namespace
+
+    def get_key(self, jti: str) -> str:
+        return f"{self.namespace}:{jti}"
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        if (timeout := ceil((expires_at - timezone.now()).total_seconds())) > 0:
+            cache.set(self.get_key(jti), True, timeout=timeout)
+
+    def contains(self, jti: str) -> bool:
+        return cache.has_key(self.get_key(jti))
+
+
+class SavedEventsCache:
+    """
+    Redis set of the event IDs saved by each profile, answering "is this event saved?" and "how many events are
+    saved?" without touching the `saved_events` M2M table.
+
+    A set only counts as loaded while it holds `loaded_marker`: Redis drops empty sets, and a set recreated by an
+    `add` after its key expired would otherwise pass for the complete one. Lookups return `None` for sets that are
+    not loaded, leaving it to the caller to `load` them from the database.
+    """
+
+    loaded_marker = "*"
+    update_loaded_script = """
+        if redis.call("SISMEMBER", KEYS[1], ARGV[1]) == 1 then
+            return redis.call(ARGV[2], KEYS[1], unpack(ARGV, 3))
+        end
+        return 0
+    """
+
+    def __init__(self, namespace: str, timeout: int) -> None:
+        self.namespace = namespace
+        self.timeout = timeout
+
+    def get_key(self, profile_id: Any) -> str:
+        return cache.make_key(f"{self.namespace}:{profile_id}")
+
+    def contains(self, profile_id: Any, event_id: Any) -> Optional[bool]:
+        pipeline = get_redis_connection().pipeline(transaction=False)
+        pipeline.sismember(self.get_key(profile_id), self.loaded_marker)
+        pipeline.sismember(self.get_key(profile_id), str(event_id))
+        loaded, saved = pipeline.execute()
+        record_cache_access(hit=bool(loaded))
+        return bool(saved) if loaded else None
+
+    def count(self, profile_id: Any) -> Optional[int]:
+        pipeline = get_redis_connection().pipeline(transaction=False)
+        pipeline.sismember(self.get_key(profile_id), self.loaded_marker)
+        pipeline.scard(self.get_key(profile_id))
+        loaded, size = pipeline.execute()
+        record_cache_access(hit=bool(loaded))
+        return size - 1 if loaded else None
+
+    def load(self, profile_id: Any, event_ids: Iterable[Any]) -> None:
+        key = self.get_key(profile_id)
+        pipeline = get_redis_connection().pipeline()
+        pipeline.delete(key)
+        pipeline.sadd(key, self.loaded_marker, *(str(event_id) for event_id in event_ids))
+        pipeline.expire(key, self.timeout)
+        pipeline.execute()
+
+    def add(self, profile_id: Any, *event_ids: Any) -> None:
+        self._update_loaded("SADD", profile_id, event_ids)
+
+    def remove(self, profile_id: Any, *event_ids: Any) -> None:
+        self._update_loaded("SREM", profile_id, event_ids)
+
+    def delete(self, profile_id: Any) -> None:
+        get_redis_connection().delete(self.get_key(profile_id))
+
+    def _update_loaded(self, command: str, profile_id: Any, event_ids: Iterable[Any]) -> None:
+        """
+        Run `command` on the profile's set only while it is loaded. On an expired key, a plain `SADD` would create a
+        set without the marker or a TTL, which nothing would ever reload or expire.
+        """
+        script = get_redis_connection().register_script(self.update_loaded_script)
+        script(
+            keys=[self.get_key(profile_id)],
+            args=[self.loaded_marker, command, *(str(event_id) for event_id in event_ids)],
+        )
+
+
+auth_user_cache = AuthUserCache(
+    namespace="auth_user",
+    timeout=CACHE_CONFIGURATION["AUTH_USER_TIMEOUT"],
+    local_cache=LocalLRUCache(
+        maxsize=CACHE_CONFIGURATION["AUTH_USER_LOCAL_MAXSIZE"],
+        timeout=CACHE_CONFIGURATION["AUTH_USER_LOCAL_TIMEOUT"],
+    ),
+)
+
+saved_events_cache = SavedEventsCache(
+    namespace="saved_events",
+    timeout=CACHE_CONFIGURATION["SAVED_EVENTS_TIMEOUT"],
+)
+token_blacklist = TokenBlacklist(namespace="token_blacklist")
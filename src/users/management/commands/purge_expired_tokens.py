@@ -0,0 +1,22 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from users.repositories import OutstandingTokenRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy still-alive blacklisted refresh tokens into the Redis blacklist and delete expired outstanding and "
+        "blacklisted token rows."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of tokens deleted per transaction.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        synced = OutstandingTokenRepository.sync_blacklist(batch_size=options["batch_size"])
+        purged = OutstandingTokenRepository.purge_expired(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Synced {synced} blacklisted token(s) to Redis, purged {purged} expired token(s).")
+        )
@@ -1,10 +1,15 @@
-from typing import Any
+from typing import Any, Iterable, List, Optional, Tuple
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.backends.utils import CursorWrapper
 from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 
 from base.repositories import BaseRepository
+from base.routers import read_from_primary
 from events.models import Event
+from users.caches import saved_events_cache, token_blacklist
 from users.models import User, UserProfile
 
 
@@ -32,14 +37,200 @@ class UserProfileRepository(BaseRepository[UserProfile]):
     model = UserProfile
 
     @classmethod
-    def get_saved_events(cls, profile: UserProfile) -> QuerySet:
-        return profile.saved_events.all()
+    def get_saved_events(cls, user_id: Any) -> QuerySet:
+        return Event.objects.with_related().filter(saved_by_user__user_id=user_id)
 
     @classmethod
-    def toggle_save_event(cls, profile: UserProfile, event: Event) -> bool:
-        if profile.saved_events.filter(id=event.id).exists():
-            profile.saved_events.remove(event)
-            return False
-        else:
-            profile.saved_events.add(event)
-            return True
+    def get_saved_event_ids(cls, profile_id: Any) -> List[Any]:
+        return list(
+            cls.model.saved_events.through.objects.filter(userprofile_id=profile_id).values_list("event_id", flat=True)
+        )
+
+    @classmethod
+    def get_profile_ids_saving_event(cls, event_id: Any) -> List[Any]:
+        return list(
+            cls.model.saved_events.through.objects.filter(event_id=event_id).values_list("userprofile_id", flat=True)
+        )
+
+    @classmethod
+    def is_event_saved(cls, profile: UserProfile, event_id: Any) -> bool:
+        if (saved := saved_events_cache.contains(profile.id, event_id)) is None:
+            with read_from_primary():
+                saved_event_ids = cls.get_saved_event_ids(profile.id)
+            saved_events_cache.load(profile.id, saved_event_ids)
+            saved = event_id in saved_event_ids
+
+        return saved
+
+    @classmethod
+    def get_saved_events_count(cls, profile: UserProfile) -> int:
+        if (count := saved_events_cache.count(profile.id)) is None:
+            with read_from_primary():
+                saved_event_ids = cls.get_saved_event_ids(profile.id)
+            saved_events_cache.load(profile.id, saved_event_ids)
+            count = len(saved_event_ids)
+
+        return count
+
+    @classmethod
+    def toggle_save_event(cls, user_id: Any, event_id: Any) -> Optional[bool]:
+        """
+        Save the event for the user's profile, or remove it when it is already saved, in a single statement.
+
+        The profile is resolved and the event's existence checked inside the same statement. Since the through table
+        is written directly, `m2m_changed` is not sent and `saved_events_cache` is updated here instead.
+
+        Returns:
+            True if the event is saved afterwards, False if it was removed, or None if the event doesn't exist.
+        """
+        through_table, profile_column, event_column = cls._get_saved_events_through_columns()
+        query = f"""
+            WITH profile AS (
+                SELECT id FROM {cls.model._meta.db_table} WHERE user_id = %(user_id)s
+            ), event AS (
+                SELECT id FROM {Event._meta.db_table} WHERE id = %(event_id)s
+            ), removed AS (
+                DELETE FROM {through_table} USING profile
+                WHERE {profile_column} = profile.id AND {event_column} = %(event_id)s
+                RETURNING {event_column}
+            ), saved AS (
+                INSERT INTO {through_table} ({profile_column}, {event_column})
+                SELECT profile.id, event.id FROM profile, event WHERE NOT EXISTS (SELECT 1 FROM removed)
+                ON CONFLICT ({profile_column}, {event_column}) DO NOTHING
+                RETURNING {event_column}
+            )
+            SELECT profile.id, EXISTS (SELECT 1 FROM event), EXISTS (SELECT 1 FROM removed) FROM profile
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(query, {"user_id": str(user_id), "event_id": str(event_id)})
+            profile_id, event_exists, event_removed = cls._fetch_profile_row(cursor)
+
+            if not event_exists:
+                return None
+
+            # A concurrent save of the same event makes the insert a no-op, which still leaves the event saved.
+            if event_removed:
+                cls._sync_saved_events_cache(profile_id, saved=[], removed=[event_id])
+            else:
+                cls._sync_saved_events_cache(profile_id, saved=[event_id], removed=[])
+
+        return not event_removed
+
+    @classmethod
+    def bulk_update_saved_events(
+        cls, user_id: Any, save: Iterable[Any], remove: Iterable[Any]
+    ) -> Tuple[List[Any], List[Any]]:
+        """
+        Save and remove many events for the user's profile in a single statement, so the whole batch commits or fails
+        together.
+
+        Unknown event IDs are skipped, as are events already in the requested state.
+
+        Returns:
+            The IDs of the events that were newly saved and of those that were removed.
+        """
+        through_table, profile_column, event_column = cls._get_saved_events_through_columns()
+        query = f"""
+            WITH profile AS (
+                SELECT id FROM {cls.model._meta.db_table} WHERE user_id = %(user_id)s
+            ), removed AS (
+                DELETE FROM {through_table} USING profile
+                WHERE {profile_column} = profile.id AND {event_column} = ANY (%(remove)s::uuid[])
+                RETURNING {event_column}
+            ), saved AS (
+                INSERT INTO {through_table} ({profile_column}, {event_column})
+                SELECT profile.id, event.id FROM profile, {Event._meta.db_table} AS event
+                WHERE event.id = ANY (%(save)s::uuid[])
+                ON CONFLICT ({profile_column}, {event_column}) DO NOTHING
+                RETURNING {event_column}
+            )
+            SELECT profile.id, ARRAY (SELECT {event_column} FROM saved), ARRAY (SELECT {event_column} FROM removed)
+            FROM profile
+        """
+        params = {
+            "user_id": str(user_id),
+            "save": [str(event_id) for event_id in save],
+            "remove": [str(event_id) for event_id in remove],
+        }
+
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            profile_id, saved, removed = cls._fetch_profile_row(cursor)
+            cls._sync_saved_events_cache(profile_id, saved=saved, removed=removed)
+
+        return saved, removed
+
+    @classmethod
+    def _get_saved_events_through_columns(cls) -> Tuple[str, str, str]:
+        through = cls.model.saved_events.through
+        return (
+            through._meta.db_table,
+            through._meta.get_field("userprofile").column,
+            through._meta.get_field("event").column,
+        )
+
+    @classmethod
+    def _fetch_profile_row(cls, cursor: CursorWrapper) -> Tuple[Any, ...]:
+        if (row := cursor.fetchone()) is None:
+            raise cls.model.DoesNotExist("UserProfile matching query does not exist.")
+
+        return row
+
+    @staticmethod
+    def _sync_saved_events_cache(profile_id: Any, saved: List[Any], removed: List[Any]) -> None:
+        if saved:
+            transaction.on_commit(lambda: saved_events_cache.add(profile_id, *saved))
+        if removed:
+            transaction.on_commit(lambda: saved_events_cache.remove(profile_id, *removed))
+
+
+class OutstandingTokenRepository(BaseRepository[OutstandingToken]):
+    model = OutstandingToken
+
+    @classmethod
+    def sync_blacklist(cls, batch_size: int = 1000) -> int:
+        """
+        Copy the still-alive tokens blacklisted in the `token_blacklist` tables into the Redis `token_blacklist`, so
+        tokens revoked before the blacklist moved to Redis stay revoked.
+
+        Returns:
+            The number of tokens copied.
+        """
+        live_tokens = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list(
+            "token__jti", "token__expires_at"
+        )
+
+        synced = 0
+        for jti, expires_at in live_tokens.iterator(chunk_size=batch_size):
+            token_blacklist.add(jti, expires_at)
+            synced += 1
+
+        return synced
+
+    @classmethod
+    def purge_expired(cls, batch_size: int = 1000) -> int:
+        """
+        Delete expired outstanding tokens, together with their blacklist rows, one batch per transaction.
+
+        An expired token fails verification on its own, so neither row serves any purpose once `expires_at` has passed.
+
+        Returns:
+            The number of outstanding tokens deleted.
+        """
+        purged, now = 0, timezone.now()
+
+        while True:
+            with transaction.atomic():
+                batch_ids = list(
+                    cls.model.objects.filter(expires_at__lte=now)
+                    .order_by("id")
+                    .values_list("id", flat=True)[:batch_size]
+                )
+                if not batch_ids:
+                    return purged
+
+                BlacklistedToken.objects.filter(token_id__in=batch_ids).delete()
+                cls.model.objects.filter(id__in=batch_ids).delete()
+
+            purged += len(batch_ids)
@@ -3,18 +3,22 @@ from typing import Any, Dict
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken, Token
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.tokens import Token
 
+from base.serializers import TimedListSerializer, TimedSerializerMixin
 from users.repositories import UserRepository
+from users.tokens import RefreshToken
 
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "email", "first_name", "last_name")
+        list_serializer_class = TimedListSerializer
 
 
 class SignUpSerializer(serializers.ModelSerializer):
@@ -34,6 +38,10 @@ class SignUpSerializer(serializers.ModelSerializer):
         return UserRepository.create_user(**validated_data)
 
 
+class SignInSerializer(TokenObtainPairSerializer):
+    token_class = RefreshToken
+
+
 class LogoutSerializer(serializers.Serializer):
     refresh_token = serializers.CharField()
 
@@ -45,3 +53,22 @@ class LogoutSerializer(serializers.Serializer):
             raise serializers.ValidationError(f"Invalid refresh token: {exc}")
 
         return value
+
+
+class BulkSavedEventsSerializer(serializers.Serializer):
+    max_events = 500
+
+    save = serializers.ListField(child=serializers.UUIDField(), required=False, default=list)
+    remove = serializers.ListField(child=serializers.UUIDField(), required=False, default=list)
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        save, remove = set(attrs["save"]), set(attrs["remove"])
+
+        if not save and not remove:
+            raise serializers.ValidationError("At least one event must be saved or removed.")
+        if len(save) + len(remove) > self.max_events:
+            raise serializers.ValidationError(f"At most {self.max_events} events can be updated at once.")
+        if save & remove:
+            raise serializers.ValidationError("An event can't be both saved and removed.")
+
+        return {"save": save, "remove": remove}
@@ -0,0 +1,59 @@
+from typing import Any, Iterable, Optional, Set, Union
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from events.models import Event
+from users.caches import auth_user_cache, saved_events_cache
+from users.models import User, UserProfile
+from users.repositories import UserProfileRepository
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_auth_user_cache(instance: User, **kwargs: Any) -> None:
+    """
+    Drop the cached user right away and once more after commit, so a request that re-cached the pre-commit row in
+    between (e.g. still active) gets dropped as well.
+    """
+    auth_user_cache.delete(instance.pk)
+    transaction.on_commit(lambda: auth_user_cache.delete(instance.pk))
+
+
+@receiver(m2m_changed, sender=UserProfile.saved_events.through)
+def sync_saved_events_cache(
+    instance: Union[UserProfile, Event], action: str, reverse: bool, pk_set: Optional[Set[Any]], **kwargs: Any
+) -> None:
+    """
+    Mirror `saved_events` changes into `saved_events_cache` once they are committed, whichever side of the relation
+    they were made from.
+    """
+    # Capture the primary key now: a deleted instance no longer has one when the callbacks run.
+    instance_id = instance.pk
+
+    if action == "post_clear" and not reverse:
+        transaction.on_commit(lambda: saved_events_cache.delete(instance_id))
+    elif action == "pre_clear" and reverse:
+        _remove_event_from_saved_events_cache(instance_id)
+    elif action in ("post_add", "post_remove") and pk_set:
+        update = saved_events_cache.add if action == "post_add" else saved_events_cache.remove
+        if reverse:
+            transaction.on_commit(lambda: _update_profiles(update, pk_set, instance_id))
+        else:
+            transaction.on_commit(lambda: update(instance_id, *pk_set))
+
+
+@receiver(pre_delete, sender=Event)
+def remove_deleted_event_from_saved_events_cache(instance: Event, **kwargs: Any) -> None:
+    # Deleting an event cascades to the through table without sending `m2m_changed`.
+    _remove_event_from_saved_events_cache(instance.pk)
+
+
+def _remove_event_from_saved_events_cache(event_id: Any) -> None:
+    profile_ids = UserProfileRepository.get_profile_ids_saving_event(event_id)
+    transaction.on_commit(lambda: _update_profiles(saved_events_cache.remove, profile_ids, event_id))
+
+
+def _update_profiles(update: Any, profile_ids: Iterable[Any], event_id: Any) -> None:
+    for profile_id in profile_ids:
+        update(profile_id, event_id)
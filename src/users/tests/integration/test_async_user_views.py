@@ -0,0 +1,53 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+from rest_framework.reverse import reverse
+
+from base.tests import BaseTest
+from events.tests.factories import EventFactory
+from users.tests.factories import UserFactory
+from users.views import AsyncGetSavedEventsView, AsyncGetUserView
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestAsyncUserViews(BaseTest):
+    request_factory = AsyncRequestFactory()
+
+    def test__async_get_user__success(self) -> None:
+        # given
+        user = UserFactory()
+
+        # when
+        request = self.request_factory.get(reverse("user_details", kwargs={"uuid": str(user.id)}))
+        response = async_to_sync(AsyncGetUserView.as_view())(request, uuid=str(user.id))
+
+        # then
+        self._common_check(response)
+
+        response_data = json.loads(response.content)
+        assert response_data == {
+            "id": str(user.id),
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+        }
+
+    def test__async_get_saved_events__success(self) -> None:
+        # given
+        user = UserFactory()
+        events = [EventFactory() for _ in range(2)]
+        user.profile.saved_events.add(*events)
+
+        # when
+        request = self.request_factory.get(reverse("user_saved_events", kwargs={"uuid": str(user.id)}))
+        response = async_to_sync(AsyncGetSavedEventsView.as_view())(request, uuid=str(user.id))
+
+        # then
+        self._common_check(response)
+
+        response_data = json.loads(response.content)
+        assert {item["id"] for item in response_data["results"]} == {str(event.id) for event in events}
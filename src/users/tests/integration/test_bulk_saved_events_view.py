@@ -0,0 +1,70 @@
+import pytest
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from base.tests import BaseTest
+from events.tests.factories import EventFactory
+from users.repositories import UserProfileRepository
+from users.tests.factories import UserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBulkSavedEventsView(BaseTest):
+    endpoint = reverse("bulk_saved_events")
+
+    def test__bulk_saved_events__success(
+        self, api_client: APIClient, django_assert_num_queries, django_capture_on_commit_callbacks
+    ) -> None:
+        # given
+        user = UserFactory()
+        saved_event, kept_event = EventFactory(), EventFactory()
+        user.profile.saved_events.add(saved_event, kept_event)
+        new_events = [EventFactory() for _ in range(3)]
+        assert UserProfileRepository.get_saved_events_count(user.profile) == 2
+        api_client.force_authenticate(user)
+
+        # when
+        with django_assert_num_queries(1), django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                self.endpoint,
+                data={
+                    "save": [str(event.id) for event in new_events] + [str(kept_event.id)],
+                    "remove": [str(saved_event.id)],
+                },
+                format="json",
+            )
+
+        # then
+        self._common_check(response)
+
+        response_data = response.json()
+        assert sorted(response_data["saved"]) == sorted(str(event.id) for event in new_events)
+        assert response_data["removed"] == [str(saved_event.id)]
+
+        saved_event_ids = set(user.profile.saved_events.values_list("id", flat=True))
+        assert saved_event_ids == {kept_event.id, *(event.id for event in new_events)}
+        assert UserProfileRepository.get_saved_events_count(user.profile) == 4, "Expected the cache to be in sync"
+
+    def test__bulk_saved_events_conflicting_ids__failed(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        event = EventFactory()
+        api_client.force_authenticate(user)
+
+        # when
+        response = api_client.post(
+            self.endpoint, data={"save": [str(event.id)], "remove": [str(event.id)]}, format="json"
+        )
+
+        # then
+        self._common_check(response, expected_status=400)
+        assert response.json()["non_field_errors"] == ["An event can't be both saved and removed."]
+
+    def test__bulk_saved_events__unauthenticated_user__failed(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.post(self.endpoint, data={"save": []}, format="json")
+
+        # then
+        self._common_check(response, expected_status=401)
@@ -3,6 +3,7 @@ from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
 from base.tests import BaseTest
+from events.caches import event_category_registry
 from events.models import Event
 from events.tests.factories import EventFactory
 from users.tests.factories import UserFactory
@@ -23,7 +24,8 @@ class TestGetSavedEventsView(BaseTest):
             reverse(
                 "user_saved_events",
                 kwargs={"uuid": str(user.id)},
-            )
+            ),
+            {"pagination": "page"},
         )
 
         # when
@@ -33,3 +35,25 @@ class TestGetSavedEventsView(BaseTest):
 
         response_data = response.json()
         assert response_data["count"] == 2, "Expected the response to contain 2 events"
+
+    def test_get_saved_events__single_query(self, api_client: APIClient, django_assert_num_queries) -> None:
+        # given
+        user = UserFactory()
+        user.profile.saved_events.add(*[EventFactory() for _ in range(5)])
+        event_category_registry.get_categories()
+
+        # when
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse("user_saved_events", kwargs={"uuid": str(user.id)}))
+
+        # then
+        self._common_check(response, expected_status=200)
+        assert len(response.json()["results"]) == 5, "Expected the response to contain 5 events"
+
+    def test_get_saved_events_missing_user__failed(self, api_client: APIClient) -> None:
+        # when
+        response = api_client.get(reverse("user_saved_events", kwargs={"uuid": "5b1f0a8e-3b7c-4a53-9d5f-3f4b1f8c2d10"}))
+
+        # then
+        self._common_check(response, expected_status=404)
+        assert response.json()["detail"] == "No User matches the given query."
@@ -1,10 +1,11 @@
 import pytest
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
 
 from base.tests import BaseTest
 from users.tests.factories import UserFactory
+from users.tokens import RefreshToken
 
 
 pytestmark = pytest.mark.django_db
@@ -33,6 +34,23 @@ class TestLogoutView(BaseTest):
         response_data = response.json()
         assert response_data["detail"] == "Refresh token was successfully blacklisted."
 
+    def test__logout_blacklisted_refresh_token__failed(self, api_client: APIClient) -> None:
+        # given
+        user = UserFactory()
+        refresh = RefreshToken.for_user(user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+        api_client.post(self.endpoint, data={"refresh_token": str(refresh)})
+
+        # when
+        response = api_client.post(self.endpoint, data={"refresh_token": str(refresh)})
+
+        # then
+        self._common_check(response, expected_status=400)
+
+        response_data = response.json()
+        assert response_data["refresh_token"] == ["Invalid refresh token: Token is blacklisted"]
+        assert not BlacklistedToken.objects.exists(), "Expected the blacklist to be kept out of the database"
+
     def test__logout_invalid_refresh_token__failed(self, api_client: APIClient) -> None:
         # when
         response = api_client.post(
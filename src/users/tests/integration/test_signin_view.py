@@ -1,6 +1,7 @@
 import pytest
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
 
 from base.tests import BaseTest
 from users.tests.factories import UserFactory
@@ -31,6 +32,7 @@ class TestSignIn(BaseTest):
         response_data = response.json()
         assert response_data.get("access"), "Access token is missing"
         assert response_data.get("refresh"), "Refresh token is missing"
+        assert not OutstandingToken.objects.exists(), "Expected no outstanding token row per sign in"
 
     def test__sign_in_wrong_password__failed(self, api_client: APIClient) -> None:
         # given
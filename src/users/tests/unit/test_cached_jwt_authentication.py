@@ -0,0 +1,77 @@
+import pytest
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.authentication import CachedJWTAuthentication
+from users.caches import auth_user_cache
+from users.models import User
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test__get_user__resolved_without_queries_once_cached(user: User, django_assert_num_queries) -> None:
+    # given
+    authentication = CachedJWTAuthentication()
+    token = AccessToken.for_user(user)
+    authentication.get_user(token)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_user = authentication.get_user(token)
+
+    # then
+    assert cached_user == user, "Expected the cached user to be resolved"
+    assert cached_user is not authentication.get_user(token), "Expected every lookup to build a fresh instance"
+    assert cached_user.email == user.email, "Expected the cached user fields to be restored"
+
+
+def test__get_user__falls_back_to_redis(user: User, django_assert_num_queries) -> None:
+    # given
+    authentication = CachedJWTAuthentication()
+    token = AccessToken.for_user(user)
+    authentication.get_user(token)
+    auth_user_cache.local_cache.clear()
+
+    # when
+    with django_assert_num_queries(0):
+        cached_user = authentication.get_user(token)
+
+    # then
+    assert cached_user == user, "Expected the user to be resolved from Redis"
+
+
+def test__get_user__invalidated_on_update(user: User) -> None:
+    # given
+    authentication = CachedJWTAuthentication()
+    token = AccessToken.for_user(user)
+    authentication.get_user(token)
+
+    # when renamed
+    user.first_name = "Jane"
+    user.save()
+
+    # then
+    assert authentication.get_user(token).first_name == "Jane", "Expected the updated user to be resolved"
+
+    # when deactivated
+    user.is_active = False
+    user.save()
+
+    # then
+    with pytest.raises(AuthenticationFailed):
+        authentication.get_user(token)
+
+
+def test__get_user__invalidated_on_delete(user: User) -> None:
+    # given
+    authentication = CachedJWTAuthentication()
+    token = AccessToken.for_user(user)
+    authentication.get_user(token)
+
+    # when
+    user.delete()
+
+    # then
+    with pytest.raises(AuthenticationFailed):
+        authentication.get_user(token)
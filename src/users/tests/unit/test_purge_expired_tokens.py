@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from users.caches import token_blacklist
+from users.models import User
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _create_token(user: User, jti: str, expires_in: timedelta, blacklisted: bool) -> OutstandingToken:
+    token = OutstandingToken.objects.create(
+        user=user, jti=jti, token=jti, created_at=timezone.now(), expires_at=timezone.now() + expires_in
+    )
+    if blacklisted:
+        BlacklistedToken.objects.create(token=token)
+
+    return token
+
+
+def test__purge_expired_tokens(user: User) -> None:
+    # given
+    for index in range(5):
+        _create_token(user, f"expired-{index}", expires_in=-timedelta(days=1), blacklisted=index % 2 == 0)
+
+    live_token = _create_token(user, "live-blacklisted", expires_in=timedelta(days=1), blacklisted=True)
+
+    # when
+    call_command("purge_expired_tokens", batch_size=2)
+
+    # then
+    assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [live_token.jti]
+    assert BlacklistedToken.objects.count() == 1, "Expected only the live blacklist row to be kept"
+    assert token_blacklist.contains(live_token.jti), "Expected the live blacklisted token to be copied to Redis"
+    assert not token_blacklist.contains("expired-0"), "Expected expired tokens not to be copied to Redis"
@@ -0,0 +1,103 @@
+import pytest
+from django_redis import get_redis_connection
+
+from events.tests.factories import EventFactory
+from users.caches import saved_events_cache
+from users.models import User
+from users.repositories import UserProfileRepository
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test__saved_events_cache__served_without_queries(user: User, django_assert_num_queries) -> None:
+    # given
+    saved_event, other_event = EventFactory(), EventFactory()
+    user.profile.saved_events.add(saved_event)
+    UserProfileRepository.get_saved_events_count(user.profile)
+
+    # when
+    with django_assert_num_queries(0):
+        is_saved = UserProfileRepository.is_event_saved(user.profile, saved_event.id)
+        is_other_saved = UserProfileRepository.is_event_saved(user.profile, other_event.id)
+        count = UserProfileRepository.get_saved_events_count(user.profile)
+
+    # then
+    assert is_saved, "Expected the saved event to be reported as saved"
+    assert not is_other_saved, "Expected the other event not to be reported as saved"
+    assert count == 1, "Expected one saved event"
+
+
+def test__saved_events_cache__kept_in_sync_by_toggle(user: User, django_capture_on_commit_callbacks) -> None:
+    # given
+    event = EventFactory()
+    assert UserProfileRepository.get_saved_events_count(user.profile) == 0
+
+    # when saved
+    with django_capture_on_commit_callbacks(execute=True):
+        UserProfileRepository.toggle_save_event(user_id=user.id, event_id=event.id)
+
+    # then
+    assert UserProfileRepository.is_event_saved(user.profile, event.id), "Expected the event to be saved"
+    assert UserProfileRepository.get_saved_events_count(user.profile) == 1, "Expected one saved event"
+
+    # when removed
+    with django_capture_on_commit_callbacks(execute=True):
+        UserProfileRepository.toggle_save_event(user_id=user.id, event_id=event.id)
+
+    # then
+    assert not UserProfileRepository.is_event_saved(user.profile, event.id), "Expected the event to be removed"
+    assert UserProfileRepository.get_saved_events_count(user.profile) == 0, "Expected no saved events"
+
+
+def test__saved_events_cache__kept_in_sync_on_event_side_changes(
+    user: User, django_capture_on_commit_callbacks
+) -> None:
+    # given
+    event, deleted_event = EventFactory(), EventFactory()
+    assert UserProfileRepository.get_saved_events_count(user.profile) == 0
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        event.saved_by_user.add(user.profile)
+        deleted_event.saved_by_user.add(user.profile)
+        deleted_event.delete()
+
+    # then
+    assert UserProfileRepository.get_saved_events_count(user.profile) == 1, "Expected only the live event"
+    assert UserProfileRepository.is_event_saved(user.profile, event.id), "Expected the event to be saved"
+
+
+def test__saved_events_cache__expired_set_not_recreated_by_writes(user: User) -> None:
+    # given
+    event = EventFactory()
+    saved_events_cache.load(user.profile.id, [])
+    saved_events_cache.delete(user.profile.id)
+
+    # when
+    saved_events_cache.add(user.profile.id, event.id)
+
+    # then
+    assert not get_redis_connection().exists(
+        saved_events_cache.get_key(user.profile.id)
+    ), "Expected a write to an expired set not to recreate it without a TTL"
+    assert saved_events_cache.contains(user.profile.id, event.id) is None
+
+
+def test__saved_events_cache__writes_applied_to_loaded_set(user: User) -> None:
+    # given
+    event = EventFactory()
+    saved_events_cache.load(user.profile.id, [])
+
+    # when added
+    saved_events_cache.add(user.profile.id, event.id)
+
+    # then
+    assert saved_events_cache.contains(user.profile.id, event.id) is True
+    assert get_redis_connection().ttl(saved_events_cache.get_key(user.profile.id)) > 0
+
+    # when removed
+    saved_events_cache.remove(user.profile.id, event.id)
+
+    # then
+    assert saved_events_cache.contains(user.profile.id, event.id) is False
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from users.caches import token_blacklist
+
+
+class RefreshToken(BaseRefreshToken):
+    """
+    Refresh token blacklisted through the Redis `token_blacklist` instead of the `token_blacklist` tables, so neither
+    signing in nor logging out nor validating a token touches the database.
+    """
+
+    def check_blacklist(self) -> None:
+        if token_blacklist.contains(self[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> None:
+        token_blacklist.add(self[api_settings.JTI_CLAIM], datetime_from_epoch(self["exp"]))
+
+    @classmethod
+    def for_user(cls, user: Any) -> Token:
+        # Skip `BlacklistMixin.for_user`, which records an `OutstandingToken` row for every issued token.
+        return super(BlacklistMixin, cls).for_user(user)
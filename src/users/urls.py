@@ -1,6 +1,16 @@
 from django.urls import path
 
-from users.views import GetSavedEventsView, GetUserView, LogoutView, SignInView, SignUpView
+from base import settings
+from users.views import (
+    AsyncGetSavedEventsView,
+    AsyncGetUserView,
+    BulkSavedEventsView,
+    GetSavedEventsView,
+    GetUserView,
+    LogoutView,
+    SignInView,
+    SignUpView,
+)
 
 
 urlpatterns = [
@@ -8,7 +18,17 @@ urlpatterns = [
     path("signup/", SignUpView.as_view(), name="signup"),
     path("signin/", SignInView.as_view(), name="signin"),
     path("logout/", LogoutView.as_view(), name="logout"),
-    # other urls
-    path("<str:uuid>/", GetUserView.as_view(), name="user_details"),
-    path("<str:uuid>/saved_events/", GetSavedEventsView.as_view(), name="user_saved_events"),
+    # current user urls
+    path("me/saved_events/bulk/", BulkSavedEventsView.as_view(), name="bulk_saved_events"),
 ]
+
+if settings.ASYNC_READ_VIEWS:
+    urlpatterns += [
+        path("<str:uuid>/", AsyncGetUserView.as_view(), name="user_details"),
+        path("<str:uuid>/saved_events/", AsyncGetSavedEventsView.as_view(), name="user_saved_events"),
+    ]
+else:
+    urlpatterns += [
+        path("<str:uuid>/", GetUserView.as_view(), name="user_details"),
+        path("<str:uuid>/saved_events/", GetSavedEventsView.as_view(), name="user_saved_events"),
+    ]
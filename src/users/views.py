@@ -1,15 +1,30 @@
+from typing import Any, List, Optional, Union
+
 from django.db.models import QuerySet
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from rest_framework.generics import CreateAPIView, GenericAPIView, ListAPIView, RetrieveAPIView
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from base.conditional import build_page_etag, get_not_modified_response, set_validators
+from base.pagination import KeysetOrPageNumberPagination
 from base.utils import build_response
-from events.serializers import EventSerializer
+from base.views import AsyncReadView
+from events.caches import event_category_registry, get_event_validators
+from events.models import Event
+from events.serializers import EventReadSerializer
 from users.models import User
 from users.repositories import UserProfileRepository, UserRepository
-from users.serializers import LogoutSerializer, SignUpSerializer, UserSerializer
+from users.serializers import (
+    BulkSavedEventsSerializer,
+    LogoutSerializer,
+    SignInSerializer,
+    SignUpSerializer,
+    UserSerializer,
+)
+from users.tokens import RefreshToken
 
 
 class SignUpView(CreateAPIView):
@@ -17,7 +32,7 @@ class SignUpView(CreateAPIView):
 
 
 class SignInView(TokenObtainPairView):
-    serializer_class = TokenObtainPairSerializer
+    serializer_class = SignInSerializer
 
 
 class LogoutView(GenericAPIView):
@@ -40,8 +55,74 @@ class GetUserView(RetrieveAPIView):
 
 
 class GetSavedEventsView(ListAPIView):
-    serializer_class = EventSerializer
+    serializer_class = EventReadSerializer
+    pagination_class = KeysetOrPageNumberPagination
 
     def get_queryset(self) -> QuerySet:
-        user = UserRepository.get(id=self.kwargs.get("uuid"))
-        return UserProfileRepository.get_saved_events(user.profile)
+        return UserProfileRepository.get_saved_events(user_id=self.kwargs.get("uuid"))
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Union[Response, HttpResponse]:
+        """
+        A user's saved events are few, so the page itself is the cheapest probe: its ETag is built from the loaded
+        rows and the pagination links, and a match skips serialization.
+        """
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        categories = event_category_registry.get_categories()
+        etags = (get_event_validators(event, categories)[0] for event in page)
+        etag = build_page_etag(self.paginator.get_paginated_data([]), etags)
+        if (not_modified_response := get_not_modified_response(request, etag)) is not None:
+            return not_modified_response
+
+        return set_validators(self.get_paginated_response(self.get_serializer(page, many=True).data), etag)
+
+    def paginate_queryset(self, queryset: QuerySet) -> Optional[List[Event]]:
+        page = super().paginate_queryset(queryset)
+
+        # The page query doesn't tell a user without saved events from a missing one, so only then look the user up.
+        if not page and not UserRepository.filter(id=self.kwargs.get("uuid")).exists():
+            raise Http404("No User matches the given query.")
+
+        return page
+
+
+class BulkSavedEventsView(GenericAPIView):
+    permission_classes = (IsAuthenticated,)
+    serializer_class = BulkSavedEventsSerializer
+
+    def post(self, request: Request) -> JsonResponse:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        saved, removed = UserProfileRepository.bulk_update_saved_events(
+            user_id=request.user.id, **serializer.validated_data
+        )
+        return JsonResponse({"saved": saved, "removed": removed})
+
+
+class AsyncGetUserView(AsyncReadView):
+    async def get(self, request: HttpRequest, uuid: str) -> JsonResponse:
+        user = await UserRepository.aget(id=uuid)
+        return JsonResponse(UserSerializer(user).data)
+
+
+class AsyncGetSavedEventsView(AsyncReadView):
+    pagination_class = KeysetOrPageNumberPagination
+
+    async def get(self, request: HttpRequest, uuid: str) -> HttpResponse:
+        request = Request(request)
+        paginator = self.pagination_class()
+        saved_events = UserProfileRepository.get_saved_events(user_id=uuid)
+        events = await paginator.apaginate_queryset(saved_events, request)
+
+        if not events and not await UserRepository.filter(id=uuid).aexists():
+            raise Http404("No User matches the given query.")
+
+        categories = await event_category_registry.aget_categories()
+        etags = (get_event_validators(event, categories)[0] for event in events)
+        etag = build_page_etag(paginator.get_paginated_data([]), etags)
+        if (not_modified_response := get_not_modified_response(request, etag)) is not None:
+            return not_modified_response
+
+        data = paginator.get_paginated_data(
+            EventReadSerializer(events, many=True, context={"categories": categories}).data
+        )
+        return set_validators(JsonResponse(data), etag)